@@ -0,0 +1,80 @@
+"""
+Bounded pools of background threads, for work started by requests that they need not wait on.
+
+A pool runs its tasks on at most max_workers threads. If max_pending is set, at most that many tasks are queued or
+running, and further tasks are dropped, so that bursts of requests cannot pile up work. Pools are created in each
+process when first used, since threads do not survive the forking of workers, and are drained when the process exits.
+"""
+from __future__ import unicode_literals
+
+import atexit
+import logging
+import os
+import threading
+from multiprocessing.pool import ThreadPool
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundPool(object):
+    """ A bounded pool of threads running tasks in the background. """
+
+    def __init__(self, name, max_workers, max_pending=None):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+        self._pending = 0
+        self._drain_registered = False
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Runs the given function in the background.
+
+        The database connection of the thread is closed once the function returns.
+
+        Returns:
+            AsyncResult: The result of the function, or None if the task was dropped because the pool is full.
+        """
+        with self._lock:
+            pool = self._get_pool()
+            if self.max_pending is not None and self._pending >= self.max_pending:
+                logger.warning('Background pool [%s] is full. Dropped task [%s].', self.name, func)
+                return None
+            self._pending += 1
+
+        return pool.apply_async(self._run, (func, args, kwargs))
+
+    def drain(self):
+        """ Waits for the queued and running tasks of this process, and stops the threads of the pool. """
+        with self._lock:
+            pool = self._pool if self._pid == os.getpid() else None
+            self._pool = None
+
+        if pool:
+            pool.close()
+            pool.join()
+
+    def _get_pool(self):
+        if self._pool is None or self._pid != os.getpid():
+            self._pool = ThreadPool(self.max_workers)
+            self._pid = os.getpid()
+            self._pending = 0
+            if not self._drain_registered:
+                # Registered after multiprocessing's own exit handler, which terminates pools, so that it runs first.
+                # Forked processes inherit the registration.
+                atexit.register(self.drain)
+                self._drain_registered = True
+        return self._pool
+
+    def _run(self, func, args, kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._pending -= 1
+            connection.close()
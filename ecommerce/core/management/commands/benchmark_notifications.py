@@ -0,0 +1,82 @@
+from __future__ import division, unicode_literals
+
+import time
+from textwrap import dedent
+
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand
+from oscar.core.loading import get_model
+from premailer import transform
+
+from ecommerce.notifications.templates import clear_notification_templates_cache, get_notification_templates
+
+CommunicationEventType = get_model('customer', 'CommunicationEventType')
+
+
+class Command(BaseCommand):
+    """
+    Command to measure how many notification emails can be rendered per second.
+
+    Emails are rendered for different recipients, first by looking up and compiling their templates, and inlining
+    their stylesheets with premailer, for each recipient, as notifications used to be; then with the cached templates
+    and stylesheets used by send_notification. No emails are sent.
+
+    Example:
+
+        ./manage.py benchmark_notifications --commtype COURSE_PURCHASED --count 200
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--commtype',
+                            action='store',
+                            dest='commtype_code',
+                            default='COURSE_PURCHASED',
+                            help='Code of the communication type of the emails.')
+        parser.add_argument('--count',
+                            action='store',
+                            dest='count',
+                            type=int,
+                            default=200,
+                            help='Number of emails rendered each way.')
+
+    def handle(self, *args, **options):
+        code = options['commtype_code']
+        count = options['count']
+        site = Site.objects.first()
+
+        def render_uncached(context):
+            messages = CommunicationEventType.objects.get_and_render(code, context)
+            transform(messages['html'])
+
+        def render_cached(context):
+            try:
+                event_type = CommunicationEventType.objects.get(code=code)
+            except CommunicationEventType.DoesNotExist:
+                event_type = CommunicationEventType(code=code)
+            templates = get_notification_templates(event_type, site)
+            messages = templates.render(context)
+            templates.inline_css(messages['html'])
+
+        clear_notification_templates_cache()
+        uncached = self.measure(render_uncached, count)
+        cached = self.measure(render_cached, count)
+
+        self.stdout.write('Uncached: {:.1f} emails per second.'.format(uncached))
+        self.stdout.write('Cached: {:.1f} emails per second.'.format(cached))
+        self.stdout.write('Speedup: {:.1f}x.'.format(cached / uncached))
+
+    def measure(self, render, count):
+        """
+        Renders the given number of emails, for different recipients, and returns the number rendered per second.
+        """
+        start = time.time()
+        for index in range(count):
+            render({
+                'full_name': 'Learner {}'.format(index),
+                'course_title': 'Demonstration Course',
+                'platform_name': 'edX',
+                'site_domain': 'example.com',
+                'tracking_pixel': 'https://www.google-analytics.com/collect?cid={}'.format(index),
+            })
+        return count / max(time.time() - start, 1e-6)
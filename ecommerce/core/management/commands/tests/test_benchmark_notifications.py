@@ -0,0 +1,21 @@
+from django.core import mail
+from django.core.management import call_command
+from six import StringIO
+
+from ecommerce.tests.testcases import TestCase
+
+
+class BenchmarkNotificationsTests(TestCase):
+    """Tests for benchmark_notifications management command."""
+
+    def test_benchmark(self):
+        """ The rates of rendering emails, uncached and cached, should be reported, and no emails sent. """
+        out = StringIO()
+        call_command('benchmark_notifications', count=2, stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertRegexpMatches(lines[0], r'^Uncached: [\d.]+ emails per second\.$')
+        self.assertRegexpMatches(lines[1], r'^Cached: [\d.]+ emails per second\.$')
+        self.assertRegexpMatches(lines[2], r'^Speedup: [\d.]+x\.$')
+        self.assertEqual(len(mail.outbox), 0)
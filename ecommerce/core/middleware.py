@@ -0,0 +1,63 @@
+"""
+Middleware for core app
+
+Note:
+    This middleware replaces "django.contrib.sites.middleware.CurrentSiteMiddleware", and must appear before
+    any middleware relying on request.site in django settings files.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+
+from ecommerce.core.utils import get_site_cache_version
+
+# Sites, along with their configurations, partners and themes, and the time they were loaded at, keyed by the
+# host they were resolved for. The cache version the sites were loaded with is kept alongside them.
+_site_cache = (None, {})
+
+
+def get_site_for_request(request):
+    """
+    Returns the site matching the host of the request, or the site set by the SITE_ID setting if there is none.
+
+    Sites are loaded once per process, along with their configuration, partner and themes, and are reloaded
+    whenever any of them are saved, so that resolving the site of a request issues no database queries. Like
+    the site cache of django_sites_extensions, sites are also reloaded after SITE_CACHE_TTL seconds, so that the
+    API clients cached on site configurations do not outlive their access tokens.
+
+    Args:
+        request (HttpRequest)
+
+    Returns:
+        Site
+    """
+    global _site_cache  # pylint: disable=global-statement
+
+    version = get_site_cache_version()
+    cache_version, sites = _site_cache
+    if cache_version != version:
+        sites = {}
+        _site_cache = (version, sites)
+
+    host = request.get_host()
+    now = time.time()
+    site, loaded_at = sites.get(host, (None, None))
+    if site is None or now - loaded_at >= getattr(settings, 'SITE_CACHE_TTL', 300):
+        queryset = Site.objects.select_related('siteconfiguration__partner').prefetch_related('themes')
+        try:
+            site = queryset.get(domain__iexact=host)
+        except Site.DoesNotExist:
+            site = queryset.get(pk=settings.SITE_ID)
+        sites[host] = (site, now)
+
+    return site
+
+
+class CurrentSiteMiddleware(object):
+    """
+    Middleware that sets `site` attribute to request object.
+    """
+
+    def process_request(self, request):
+        request.site = get_site_for_request(request)
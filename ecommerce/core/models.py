@@ -1,12 +1,15 @@
 import datetime
 import hashlib
 import logging
+import threading
+import time
 from urlparse import urljoin, urlsplit, urlunsplit
 
 from dateutil.parser import parse
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.functional import cached_property
@@ -20,9 +23,13 @@ from slumber.exceptions import HttpNotFoundError, SlumberBaseException
 
 from analytics import Client as SegmentClient
 from ecommerce.core.url_utils import get_lms_url
-from ecommerce.core.utils import log_message_and_raise_validation_error
+from ecommerce.core.utils import get_cache_key, log_message_and_raise_validation_error
 from ecommerce.extensions.payment.exceptions import ProcessorNotFoundError
-from ecommerce.extensions.payment.helpers import get_processor_class, get_processor_class_by_name
+from ecommerce.extensions.payment.helpers import (
+    get_payment_processors_cache_version,
+    get_processor_class_by_name,
+    get_processor_classes
+)
 from ecommerce.journals.constants import JOURNAL_DISCOVERY_API_PATH  # TODO: journals dependency
 
 log = logging.getLogger(__name__)
@@ -247,32 +254,42 @@ class SiteConfiguration(models.Model):
             raise ValidationError('Processor [{processor}] must be in the payment_processors field in order to '
                                   'be configured as a client-side processor.'.format(processor=value))
 
-    def _all_payment_processors(self):
-        """ Returns all processor classes declared in settings. """
-        all_processors = [get_processor_class(path) for path in settings.PAYMENT_PROCESSORS]
-        return all_processors
-
     def get_payment_processors(self):
         """
         Returns payment processor classes enabled for the corresponding Site
 
+        The names of the enabled processors are cached. The cache key includes the configured processors,
+        so that it changes whenever they are saved, and the cache is invalidated when processor switches
+        are toggled.
+
         Returns:
             list[BasePaymentProcessor]: Returns payment processor classes enabled for the corresponding Site
         """
-        all_processors = self._all_payment_processors()
-        all_processor_names = {processor.NAME for processor in all_processors}
+        all_processors = get_processor_classes()
+        cache_key = get_cache_key(
+            site_id=self.site_id,
+            payment_processors=self.payment_processors,
+            version=get_payment_processors_cache_version(),
+        )
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return [all_processors[name] for name in cached_response.value if name in all_processors]
 
-        missing_processor_configurations = self.payment_processors_set - all_processor_names
+        missing_processor_configurations = self.payment_processors_set - set(all_processors)
         if missing_processor_configurations:
             processor_config_repr = ", ".join(missing_processor_configurations)
             log.warning(
                 'Unknown payment processors [%s] are configured for site %s', processor_config_repr, self.site.id
             )
 
-        return [
-            processor for processor in all_processors
+        processors = [
+            processor for processor in all_processors.values()
             if processor.NAME in self.payment_processors_set and processor.is_enabled()
         ]
+        TieredCache.set_all_tiers(
+            cache_key, [processor.NAME for processor in processors], settings.PAYMENT_PROCESSORS_CACHE_TIMEOUT
+        )
+        return processors
 
     def get_client_side_payment_processor_class(self):
         """ Returns the payment processor class to be used for client-side payments.
@@ -283,9 +300,7 @@ class SiteConfiguration(models.Model):
              BasePaymentProcessor
         """
         if self.client_side_payment_processor:
-            for processor in self._all_payment_processors():
-                if processor.NAME == self.client_side_payment_processor:
-                    return processor
+            return get_processor_classes().get(self.client_side_payment_processor)
 
         return None
 
@@ -374,27 +389,97 @@ class SiteConfiguration(models.Model):
         The token is cached for the lifetime of the token, as specified by the OAuth provider's response. The token
         type is JWT.
 
+        Once the token is about to expire, it is renewed in the background while the cached token keeps being
+        returned. Renewals are coalesced through a cache lock, so that a single caller, across all processes,
+        requests a new token from the OAuth provider. When there is no valid token at all, callers wait for the
+        one holding the lock to retrieve it, rather than all requesting their own.
+
         Returns:
             str: JWT access token
         """
-        key = 'siteconfiguration_access_token_{}'.format(self.id)
-        access_token_cached_response = TieredCache.get_cached_response(key)
+        access_token_cached_response = TieredCache.get_cached_response(self._access_token_cache_key)
         if access_token_cached_response.is_found:
-            return access_token_cached_response.value
-
-        url = '{root}/access_token'.format(root=self.oauth2_provider_url)
-        access_token, expiration_datetime = EdxRestApiClient.get_oauth_access_token(
-            url,
-            self.oauth_settings['BACKEND_SERVICE_EDX_OAUTH2_KEY'],  # pylint: disable=unsubscriptable-object
-            self.oauth_settings['BACKEND_SERVICE_EDX_OAUTH2_SECRET'],  # pylint: disable=unsubscriptable-object
-            token_type='jwt'
-        )
+            cached_token = access_token_cached_response.value
+            if time.time() >= cached_token['renew_at'] and self._acquire_access_token_lock():
+                thread = threading.Thread(target=self._renew_access_token)
+                thread.daemon = True
+                thread.start()
+            return cached_token['access_token']
+
+        if self._acquire_access_token_lock():
+            return self._renew_access_token()
+
+        deadline = time.time() + settings.ACCESS_TOKEN_LOCK_TIMEOUT
+        while time.time() < deadline:
+            time.sleep(0.1)
+            access_token_cached_response = TieredCache.get_cached_response(self._access_token_cache_key)
+            if access_token_cached_response.is_found:
+                return access_token_cached_response.value['access_token']
+
+        log.warning('Timed out waiting for the access token of site configuration [%s] to be renewed.', self.id)
+        return self._renew_access_token()
+
+    @property
+    def _access_token_cache_key(self):
+        return 'siteconfiguration_oauth_access_token_{}'.format(self.id)
+
+    @property
+    def _access_token_lock_key(self):
+        return 'siteconfiguration_oauth_access_token_lock_{}'.format(self.id)
+
+    def _acquire_access_token_lock(self):
+        """ Returns True if the lock on renewing the access token was acquired, and False if it is already held. """
+        return cache.add(self._access_token_lock_key, True, settings.ACCESS_TOKEN_LOCK_TIMEOUT)
+
+    def _renew_access_token(self):
+        """ Retrieves a new access token from the OAuth provider, caches it, and releases the renewal lock.
+
+        Returns:
+            str: JWT access token
+        """
+        try:
+            url = '{root}/access_token'.format(root=self.oauth2_provider_url)
+            access_token, expiration_datetime = EdxRestApiClient.get_oauth_access_token(
+                url,
+                self.oauth_settings['BACKEND_SERVICE_EDX_OAUTH2_KEY'],  # pylint: disable=unsubscriptable-object
+                self.oauth_settings['BACKEND_SERVICE_EDX_OAUTH2_SECRET'],  # pylint: disable=unsubscriptable-object
+                token_type='jwt'
+            )
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Failed to renew the access token of site configuration [%s].', self.id)
+            cache.delete(self._access_token_lock_key)
+            raise
 
         expires = (expiration_datetime - datetime.datetime.utcnow()).seconds
-        TieredCache.set_all_tiers(key, access_token, expires)
+        cached_token = {
+            'access_token': access_token,
+            'renew_at': time.time() + expires - min(settings.ACCESS_TOKEN_RENEWAL_WINDOW, expires // 2),
+        }
+        TieredCache.set_all_tiers(self._access_token_cache_key, cached_token, expires)
+        cache.delete(self._access_token_lock_key)
         return access_token
 
-    @cached_property
+    def _get_api_client(self, url, **kwargs):
+        """ Returns an API client for the given URL, authenticated with the current access token.
+
+        Site configurations are shared between requests, so clients are reused only for as long as the
+        access token they were built with is current.
+
+        Returns:
+            EdxRestApiClient
+        """
+        access_token = self.access_token
+        api_clients = self.__dict__.setdefault('_api_clients', {})
+        key = (url, tuple(sorted(kwargs.items())))
+
+        client, client_access_token = api_clients.get(key, (None, None))
+        if client is None or client_access_token != access_token:
+            client = EdxRestApiClient(url, jwt=access_token, **kwargs)
+            api_clients[key] = (client, access_token)
+
+        return client
+
+    @property
     def discovery_api_client(self):
         """
         Returns an API client to access the Discovery service.
@@ -403,10 +488,10 @@ class SiteConfiguration(models.Model):
             EdxRestApiClient: The client to access the Discovery service.
         """
 
-        return EdxRestApiClient(self.discovery_api_url, jwt=self.access_token)
+        return self._get_api_client(self.discovery_api_url)
 
     # TODO: journals dependency
-    @cached_property
+    @property
     def journal_discovery_api_client(self):
         """
         Returns an Journal API client to access the Discovery service.
@@ -423,14 +508,14 @@ class SiteConfiguration(models.Model):
             split_url.fragment
         ])
 
-        return EdxRestApiClient(journal_discovery_url, jwt=self.access_token)
+        return self._get_api_client(journal_discovery_url)
 
-    @cached_property
+    @property
     def embargo_api_client(self):
         """ Returns the URL for the embargo API """
-        return EdxRestApiClient(self.build_lms_url('/api/embargo/v1'), jwt=self.access_token)
+        return self._get_api_client(self.build_lms_url('/api/embargo/v1'))
 
-    @cached_property
+    @property
     def enterprise_api_client(self):
         """
         Constructs a Slumber-based REST API client for the provided site.
@@ -442,13 +527,13 @@ class SiteConfiguration(models.Model):
             EdxRestApiClient: The client to access the Enterprise service.
 
         """
-        return EdxRestApiClient(self.enterprise_api_url, jwt=self.access_token)
+        return self._get_api_client(self.enterprise_api_url)
 
-    @cached_property
+    @property
     def consent_api_client(self):
-        return EdxRestApiClient(self.build_lms_url('/consent/api/v1/'), jwt=self.access_token, append_slash=False)
+        return self._get_api_client(self.build_lms_url('/consent/api/v1/'), append_slash=False)
 
-    @cached_property
+    @property
     def user_api_client(self):
         """
         Returns the API client to access the user API endpoint on LMS.
@@ -456,23 +541,23 @@ class SiteConfiguration(models.Model):
         Returns:
             EdxRestApiClient: The client to access the LMS user API service.
         """
-        return EdxRestApiClient(self.build_lms_url('/api/user/v1/'), jwt=self.access_token)
+        return self._get_api_client(self.build_lms_url('/api/user/v1/'))
 
-    @cached_property
+    @property
     def commerce_api_client(self):
-        return EdxRestApiClient(self.build_lms_url('/api/commerce/v1/'), jwt=self.access_token)
+        return self._get_api_client(self.build_lms_url('/api/commerce/v1/'))
 
-    @cached_property
+    @property
     def credit_api_client(self):
-        return EdxRestApiClient(self.build_lms_url('/api/credit/v1/'), jwt=self.access_token)
+        return self._get_api_client(self.build_lms_url('/api/credit/v1/'))
 
-    @cached_property
+    @property
     def enrollment_api_client(self):
-        return EdxRestApiClient(self.build_lms_url('/api/enrollment/v1/'), jwt=self.access_token, append_slash=False)
+        return self._get_api_client(self.build_lms_url('/api/enrollment/v1/'), append_slash=False)
 
-    @cached_property
+    @property
     def entitlement_api_client(self):
-        return EdxRestApiClient(self.build_lms_url('/api/entitlements/v1/'), jwt=self.access_token)
+        return self._get_api_client(self.build_lms_url('/api/entitlements/v1/'))
 
 
 class User(AbstractUser):
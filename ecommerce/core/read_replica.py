@@ -0,0 +1,159 @@
+"""
+Routing of the reads of read-only views to the read replica.
+
+Views opt into the replica with ReadReplicaMixin, or the use_read_replica decorator. While they handle requests
+made with safe methods, ReadReplicaRouter sends their reads to the database called 'read_replica', if there is
+one. Writes always go to the primary database.
+
+Replicas lag behind the primary. So that users see their own changes, the reads of a user who has just made a
+change are sent to the primary for READ_REPLICA_PIN_TIMEOUT seconds. ReadReplicaPinningMiddleware records the
+changes.
+"""
+from __future__ import unicode_literals
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from edx_django_utils.cache import TieredCache
+from rest_framework.permissions import SAFE_METHODS
+
+from ecommerce.core.utils import get_cache_key
+
+READ_REPLICA_DB_ALIAS = 'read_replica'
+
+_state = threading.local()
+
+
+def is_read_replica_configured():
+    return READ_REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def get_replication_lag():
+    """
+    Returns the number of seconds the read replica lags behind the primary database.
+
+    Returns:
+        int: The lag, or None if there is no replica, or its lag cannot be determined.
+    """
+    if not is_read_replica_configured():
+        return None
+
+    connection = connections[READ_REPLICA_DB_ALIAS]
+    if connection.vendor != 'mysql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute('SHOW SLAVE STATUS')
+        row = cursor.fetchone()
+        if not row:
+            return None
+        status = dict(zip([column[0] for column in cursor.description], row))
+
+    return status.get('Seconds_Behind_Master')
+
+
+def get_pin_cache_key(user_id):
+    return get_cache_key(resource='read_replica_pin', user_id=user_id)
+
+
+def pin_to_primary(user):
+    """ Sends the reads of the given user to the primary database for READ_REPLICA_PIN_TIMEOUT seconds. """
+    TieredCache.set_all_tiers(get_pin_cache_key(user.id), True, settings.READ_REPLICA_PIN_TIMEOUT)
+
+
+def is_pinned_to_primary(user):
+    if not user or not user.is_authenticated:
+        return False
+    return TieredCache.get_cached_response(get_pin_cache_key(user.id)).is_found
+
+
+@contextmanager
+def read_replica_routing(request):
+    """
+    Sends the reads made in the block to the read replica, if the request was made with a safe method.
+
+    Whether the user of the request is pinned to the primary is only checked at the first read made once they are
+    known, since API views authenticate their users after they are dispatched.
+    """
+    previous = getattr(_state, 'request', None), getattr(_state, 'decisions', {})
+    _state.request = request if request.method in SAFE_METHODS and is_read_replica_configured() else None
+    _state.decisions = {}
+    try:
+        yield
+    finally:
+        _state.request, _state.decisions = previous
+
+
+def should_read_from_replica():
+    request = getattr(_state, 'request', None)
+    if request is None:
+        return False
+
+    # Loading the user of the request reads from the database, and so is routed itself. It is read from the primary.
+    if getattr(_state, 'loading_user', False):
+        return False
+
+    _state.loading_user = True
+    try:
+        user = getattr(request, 'user', None)
+        user_id = user.id if user else None
+    finally:
+        _state.loading_user = False
+
+    if user_id not in _state.decisions:
+        _state.decisions[user_id] = not is_pinned_to_primary(user)
+    return _state.decisions[user_id]
+
+
+def use_read_replica(view_method):
+    """ Decorator sending the reads of a view method, e.g. a view set action, to the read replica. """
+
+    @wraps(view_method)
+    def wrapper(view, request, *args, **kwargs):
+        with read_replica_routing(request):
+            return view_method(view, request, *args, **kwargs)
+
+    return wrapper
+
+
+class ReadReplicaMixin(object):
+    """ View mixin sending the reads made while handling requests with safe methods to the read replica. """
+
+    def dispatch(self, request, *args, **kwargs):
+        with read_replica_routing(request):
+            return super(ReadReplicaMixin, self).dispatch(request, *args, **kwargs)
+
+
+class ReadReplicaRouter(object):
+    """ Database router sending the reads of the views using the read replica to it. """
+
+    def db_for_read(self, model, **hints):  # pylint: disable=unused-argument
+        return READ_REPLICA_DB_ALIAS if should_read_from_replica() else None
+
+    def db_for_write(self, model, **hints):  # pylint: disable=unused-argument
+        # Instances read from the replica must still be saved to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):  # pylint: disable=unused-argument
+        # The replica holds the same data as the primary.
+        databases = {DEFAULT_DB_ALIAS, READ_REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:  # pylint: disable=protected-access
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):  # pylint: disable=unused-argument
+        return False if db == READ_REPLICA_DB_ALIAS else None
+
+
+class ReadReplicaPinningMiddleware(object):
+    """ Middleware pinning the users who make changes to the primary database, so that they see their changes. """
+
+    def process_response(self, request, response):
+        user = getattr(request, 'user', None)
+        if (request.method not in SAFE_METHODS and response.status_code < 400 and user and user.is_authenticated and
+                is_read_replica_configured()):
+            pin_to_primary(user)
+        return response
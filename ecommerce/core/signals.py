@@ -0,0 +1,25 @@
+import logging
+
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ecommerce.core.models import SiteConfiguration
+from ecommerce.core.utils import invalidate_site_cache
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_save, sender='partner.Partner')
+@receiver(post_save, sender='theming.SiteTheme')
+@receiver(post_delete, sender='theming.SiteTheme')
+def invalidate_sites(sender, **_kwargs):
+    """
+    When a site, its configuration, partner or themes change, the sites cached
+    in the memory of every process must be reloaded.
+    """
+    invalidate_site_cache()
+    logger.debug('Invalidated site cache after a %s change.', sender.__name__)
@@ -0,0 +1,57 @@
+from __future__ import unicode_literals
+
+import threading
+
+import mock
+
+from ecommerce.core.background import BackgroundPool
+from ecommerce.tests.testcases import TestCase
+
+
+class BackgroundPoolTests(TestCase):
+    def setUp(self):
+        super(BackgroundPoolTests, self).setUp()
+        self.pool = BackgroundPool('test', max_workers=1, max_pending=2)
+        self.addCleanup(self.pool.drain)
+
+    def test_submit(self):
+        """ Tasks should run in the background, with their results returned. """
+        result = self.pool.submit(lambda a, b: a + b, 1, b=2)
+        self.assertEqual(result.get(timeout=5), 3)
+
+    def test_submit_full(self):
+        """ Tasks submitted while max_pending tasks are queued or running should be dropped. """
+        release = threading.Event()
+        blocked = [self.pool.submit(release.wait, 5) for __ in range(2)]
+
+        func = mock.Mock()
+        with mock.patch('ecommerce.core.background.logger') as mock_logger:
+            self.assertIsNone(self.pool.submit(func))
+            self.assertTrue(mock_logger.warning.called)
+
+        release.set()
+        for result in blocked:
+            result.wait(5)
+        self.pool.submit(func).wait(5)
+        func.assert_called_once_with()
+
+    def test_drain(self):
+        """ Draining should wait for the submitted tasks to finish. """
+        pool = BackgroundPool('test', max_workers=1)
+        func = mock.Mock()
+        for __ in range(3):
+            pool.submit(func)
+
+        pool.drain()
+        self.assertEqual(func.call_count, 3)
+
+    def test_drain_registered_once(self):
+        """ The pool should be drained at exit, registering the drain once however often the pool is re-created. """
+        pool = BackgroundPool('test', max_workers=1)
+        with mock.patch('ecommerce.core.background.atexit.register') as mock_register:
+            pool.submit(mock.Mock()).wait(5)
+            pool.drain()
+            pool.submit(mock.Mock()).wait(5)
+            pool.drain()
+
+        mock_register.assert_called_once_with(pool.drain)
@@ -0,0 +1,55 @@
+"""
+Tests for core middleware.
+"""
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, override_settings
+
+from ecommerce.core.middleware import CurrentSiteMiddleware
+from ecommerce.tests.testcases import TestCase
+from ecommerce.theming.models import SiteTheme
+
+
+class CurrentSiteMiddlewareTests(TestCase):
+    """
+    Test the site of a request is resolved from the in-process site cache.
+    """
+
+    def process_request(self, host):
+        request = RequestFactory().get('/', HTTP_HOST=host)
+        CurrentSiteMiddleware().process_request(request)
+        return request
+
+    def test_site_cached(self):
+        """ Verify the site, its configuration, partner and theme are resolved without queries once cached. """
+        SiteTheme.objects.create(site=self.site, theme_dir_name='test-theme')
+        self.process_request(self.site.domain)
+
+        with self.assertNumQueries(0):
+            request = self.process_request(self.site.domain)
+            self.assertEqual(request.site, self.site)
+            self.assertEqual(request.site.siteconfiguration.partner, self.partner)
+            self.assertEqual(SiteTheme.get_theme(request.site).theme_dir_name, 'test-theme')
+
+    def test_site_invalidated(self):
+        """ Verify the cached site is reloaded after its configuration is saved. """
+        self.process_request(self.site.domain)
+
+        self.site.siteconfiguration.from_email = 'updated@example.com'
+        self.site.siteconfiguration.save()
+
+        request = self.process_request(self.site.domain)
+        self.assertEqual(request.site.siteconfiguration.from_email, 'updated@example.com')
+
+    @override_settings(SITE_CACHE_TTL=0)
+    def test_site_expired(self):
+        """ Verify the cached site is reloaded once it is older than SITE_CACHE_TTL. """
+        self.process_request(self.site.domain)
+
+        with self.assertNumQueries(2):
+            self.process_request(self.site.domain)
+
+    def test_unknown_host(self):
+        """ Verify the site set by the SITE_ID setting is used for hosts not matching any site. """
+        request = self.process_request('unknown.example.com')
+        self.assertEqual(request.site, Site.objects.get(pk=settings.SITE_ID))
@@ -1,4 +1,5 @@
 import json
+import time
 from urlparse import urljoin
 
 import ddt
@@ -6,8 +7,10 @@ import httpretty
 import mock
 from django.conf import settings
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import override_settings
+from edx_django_utils.cache import TieredCache
 from edx_rest_api_client.auth import SuppliedJwtAuth
 from requests.exceptions import ConnectionError
 
@@ -268,6 +271,27 @@ class SiteConfigurationTests(TestCase):
         result = site_config.get_payment_processors()
         self.assertEqual(result, expected_result)
 
+    @override_settings(PAYMENT_PROCESSORS=[
+        'ecommerce.extensions.payment.tests.processors.DummyProcessor',
+        'ecommerce.extensions.payment.tests.processors.AnotherDummyProcessor',
+    ])
+    def test_get_payment_processors_cached(self):
+        """ Verify the enabled payment processors are cached until a processor switch is toggled. """
+        processors = [DummyProcessor, AnotherDummyProcessor]
+        self._enable_processor_switches(processors)
+        site_config = _make_site_config(",".join(proc.NAME for proc in processors))
+        self.assertEqual(site_config.get_payment_processors(), processors)
+
+        with mock.patch('waffle.switch_is_active') as mock_switch_is_active:
+            self.assertEqual(site_config.get_payment_processors(), processors)
+            self.assertFalse(mock_switch_is_active.called)
+
+        toggle_switch(settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + AnotherDummyProcessor.NAME, False)
+        self.assertEqual(site_config.get_payment_processors(), [DummyProcessor])
+
+        site_config.payment_processors = AnotherDummyProcessor.NAME
+        self.assertEqual(site_config.get_payment_processors(), [])
+
     def test_get_client_side_payment_processor(self):
         """ Verify the method returns the client-side payment processor. """
         PROCESSOR_NAME = 'cybersource'
@@ -302,6 +326,61 @@ class SiteConfigurationTests(TestCase):
         httpretty.disable()
         self.assertEqual(self.site.siteconfiguration.access_token, token)
 
+    @httpretty.activate
+    def test_access_token_renewed_in_background(self):
+        """ Verify the cached token keeps being returned while a token about to expire is renewed. """
+        site_configuration = self.site.siteconfiguration
+        token = self.mock_access_token_response()
+        self.assertEqual(site_configuration.access_token, token)
+
+        cache_key = site_configuration._access_token_cache_key  # pylint: disable=protected-access
+        TieredCache.set_all_tiers(cache_key, {'access_token': token, 'renew_at': time.time() - 1}, 60)
+        renewed_token = 'def456'
+        self.mock_access_token_response(access_token=renewed_token)
+
+        with mock.patch('threading.Thread') as mock_thread:
+            self.assertEqual(site_configuration.access_token, token)
+            self.assertEqual(site_configuration.access_token, token)
+            # The renewal is started once, by the caller holding the lock.
+            # pylint: disable=protected-access
+            mock_thread.assert_called_once_with(target=site_configuration._renew_access_token)
+            mock_thread.return_value.start.assert_called_once_with()
+
+        mock_thread.call_args[1]['target']()
+        self.assertEqual(site_configuration.access_token, renewed_token)
+        self.assertIsNone(cache.get(site_configuration._access_token_lock_key))  # pylint: disable=protected-access
+
+    @httpretty.activate
+    def test_access_token_waits_for_renewal(self):
+        """ Verify callers wait for the token being retrieved by the lock holder, rather than requesting their own. """
+        site_configuration = self.site.siteconfiguration
+        self.mock_access_token_response()
+        self.assertTrue(site_configuration._acquire_access_token_lock())  # pylint: disable=protected-access
+
+        def renew(__):
+            TieredCache.set_all_tiers(
+                site_configuration._access_token_cache_key,  # pylint: disable=protected-access
+                {'access_token': 'def456', 'renew_at': time.time() + 60},
+                60
+            )
+
+        with mock.patch('time.sleep', side_effect=renew):
+            self.assertEqual(site_configuration.access_token, 'def456')
+        self.assertFalse(httpretty.has_request())
+
+    @httpretty.activate
+    def test_api_clients_follow_access_token(self):
+        """ Verify API clients are reused until the access token changes. """
+        site_configuration = self.site.siteconfiguration
+        self.mock_access_token_response()
+        client = site_configuration.commerce_api_client
+        self.assertIs(site_configuration.commerce_api_client, client)
+
+        TieredCache.dangerous_clear_all_tiers()
+        self.mock_access_token_response(access_token='def456')
+        client = site_configuration.commerce_api_client
+        self.assertEqual(client._store['session'].auth.token, 'def456')  # pylint: disable=protected-access
+
     @httpretty.activate
     @override_settings(ENTERPRISE_API_URL=ENTERPRISE_API_URL)
     def test_enterprise_api_client(self):
@@ -0,0 +1,157 @@
+import ddt
+import mock
+from django.contrib.auth.models import AnonymousUser
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.functional import SimpleLazyObject
+from django.views.generic import View
+
+from ecommerce.core.read_replica import (
+    READ_REPLICA_DB_ALIAS,
+    ReadReplicaMixin,
+    ReadReplicaPinningMiddleware,
+    ReadReplicaRouter,
+    get_replication_lag,
+    is_pinned_to_primary,
+    pin_to_primary,
+    read_replica_routing,
+    use_read_replica
+)
+from ecommerce.tests.testcases import TestCase
+
+
+class MixinView(ReadReplicaMixin, View):
+    def get(self, request):  # pylint: disable=unused-argument
+        return HttpResponse(ReadReplicaRouter().db_for_read(None))
+
+
+class DecoratedView(View):
+    @use_read_replica
+    def get(self, request):  # pylint: disable=unused-argument
+        return HttpResponse(ReadReplicaRouter().db_for_read(None))
+
+
+@ddt.ddt
+@mock.patch('ecommerce.core.read_replica.is_read_replica_configured', mock.Mock(return_value=True))
+class ReadReplicaRouterTests(TestCase):
+    def setUp(self):
+        super(ReadReplicaRouterTests, self).setUp()
+        self.router = ReadReplicaRouter()
+        self.user = self.create_user()
+
+    def make_request(self, method='get', user=None):
+        request = getattr(RequestFactory(), method)('/')
+        request.user = user or self.user
+        return request
+
+    @ddt.data('get', 'head', 'options')
+    def test_safe_methods(self, method):
+        """ Reads made while handling requests with safe methods should be sent to the replica. """
+        self.assertIsNone(self.router.db_for_read(None))
+
+        with read_replica_routing(self.make_request(method)):
+            self.assertEqual(self.router.db_for_read(None), READ_REPLICA_DB_ALIAS)
+
+        self.assertIsNone(self.router.db_for_read(None))
+
+    @ddt.data('post', 'put', 'patch', 'delete')
+    def test_unsafe_methods(self, method):
+        """ Reads made while handling requests with unsafe methods should be sent to the primary. """
+        with read_replica_routing(self.make_request(method)):
+            self.assertIsNone(self.router.db_for_read(None))
+
+    def test_not_configured(self):
+        """ Reads should be sent to the primary if there is no replica. """
+        with mock.patch('ecommerce.core.read_replica.is_read_replica_configured', return_value=False):
+            with read_replica_routing(self.make_request()):
+                self.assertIsNone(self.router.db_for_read(None))
+
+    def test_pinned_user(self):
+        """ The reads of users who have just made a change should be sent to the primary. """
+        pin_to_primary(self.user)
+
+        with read_replica_routing(self.make_request()):
+            self.assertIsNone(self.router.db_for_read(None))
+
+        with read_replica_routing(self.make_request(user=self.create_user())):
+            self.assertEqual(self.router.db_for_read(None), READ_REPLICA_DB_ALIAS)
+
+    def test_lazy_user(self):
+        """ The user of the request should be loaded from the primary. """
+        def load_user():
+            self.assertIsNone(self.router.db_for_read(None))
+            return self.user
+
+        with read_replica_routing(self.make_request(user=SimpleLazyObject(load_user))):
+            self.assertEqual(self.router.db_for_read(None), READ_REPLICA_DB_ALIAS)
+
+    def test_writes(self):
+        """ Writes should always be sent to the primary, even those of instances read from the replica. """
+        instance = mock.Mock()
+        instance._state.db = READ_REPLICA_DB_ALIAS  # pylint: disable=protected-access
+
+        with read_replica_routing(self.make_request()):
+            self.assertEqual(self.router.db_for_write(None, instance=instance), DEFAULT_DB_ALIAS)
+
+    def test_allow_migrate(self):
+        """ Migrations should not be run against the replica. """
+        self.assertFalse(self.router.allow_migrate(READ_REPLICA_DB_ALIAS, 'order'))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'order'))
+
+    def test_views(self):
+        """ The mixin and decorator should route the reads of the views using them. """
+        for view in (MixinView, DecoratedView):
+            self.assertEqual(view.as_view()(self.make_request()).content, READ_REPLICA_DB_ALIAS)
+
+
+@ddt.ddt
+@mock.patch('ecommerce.core.read_replica.is_read_replica_configured', mock.Mock(return_value=True))
+class ReadReplicaPinningMiddlewareTests(TestCase):
+    def setUp(self):
+        super(ReadReplicaPinningMiddlewareTests, self).setUp()
+        self.user = self.create_user()
+
+    def process_response(self, method, status=200, user=None):
+        request = getattr(RequestFactory(), method)('/')
+        request.user = user or self.user
+        ReadReplicaPinningMiddleware().process_response(request, HttpResponse(status=status))
+
+    @ddt.data('post', 'put', 'patch', 'delete')
+    def test_changes(self, method):
+        """ Users should be pinned to the primary after making a change. """
+        self.process_response(method)
+        self.assertTrue(is_pinned_to_primary(self.user))
+
+    @ddt.data(
+        {'method': 'get'},
+        {'method': 'post', 'status': 400},
+        {'method': 'post', 'user': AnonymousUser()},
+    )
+    @ddt.unpack
+    def test_no_changes(self, method, status=200, user=None):
+        """ Users should not be pinned to the primary after reading, or failing to make a change. """
+        self.process_response(method, status=status, user=user)
+        self.assertFalse(is_pinned_to_primary(self.user))
+
+
+class ReplicationLagTests(TestCase):
+    def test_not_configured(self):
+        """ The lag should be unknown if there is no replica. """
+        self.assertIsNone(get_replication_lag())
+
+    @mock.patch('ecommerce.core.read_replica.is_read_replica_configured', mock.Mock(return_value=True))
+    @mock.patch('ecommerce.core.read_replica.connections')
+    def test_mysql(self, mock_connections):
+        """ The lag of MySQL replicas should be read from their status. """
+        connection = mock_connections.__getitem__.return_value
+        connection.vendor = 'mysql'
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.description = [('Slave_IO_State',), ('Seconds_Behind_Master',)]
+        cursor.fetchone.return_value = ('Waiting for master to send event', 12)
+
+        self.assertEqual(get_replication_lag(), 12)
+        cursor.execute.assert_called_once_with('SHOW SLAVE STATUS')
+
+        cursor.fetchone.return_value = None
+        self.assertIsNone(get_replication_lag())
@@ -33,7 +33,7 @@ class HealthTests(TestCase):
         self._assert_health(status.HTTP_200_OK, Status.OK, Status.OK)
         self.assertTrue(mock_newrelic_agent.ignore_transaction.called)
 
-    @mock.patch('django.contrib.sites.middleware.get_current_site', mock.Mock(return_value=None))
+    @mock.patch('ecommerce.core.middleware.get_site_for_request', mock.Mock(return_value=None))
     @mock.patch('django.db.backends.base.base.BaseDatabaseWrapper.cursor', mock.Mock(side_effect=DatabaseError))
     def test_database_outage(self):
         """Test that the endpoint reports when the database is unavailable."""
@@ -2,15 +2,19 @@ from __future__ import unicode_literals
 
 import hashlib
 import logging
+import uuid
 from urlparse import parse_qs, urlparse
 
 import six
 import waffle
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from edx_django_utils.cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
+SITE_CACHE_VERSION_KEY = 'site_cache_version'
+
 
 def log_message_and_raise_validation_error(message):
     """
@@ -50,6 +54,27 @@ def get_cache_key(**kwargs):
     return hashlib.md5(key).hexdigest()
 
 
+def get_site_cache_version():
+    """
+    Returns the version of the sites, along with their configurations, partners and themes, cached in process memory.
+
+    Returns:
+        str: The current cache version.
+    """
+    cached_response = TieredCache.get_cached_response(SITE_CACHE_VERSION_KEY)
+    if cached_response.is_found:
+        return cached_response.value
+
+    version = uuid.uuid4().hex
+    TieredCache.set_all_tiers(SITE_CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate_site_cache():
+    """ Invalidates the sites cached in the memory of every process. """
+    TieredCache.delete_all_tiers(SITE_CACHE_VERSION_KEY)
+
+
 def deprecated_traverse_pagination(response, endpoint):
     """
     Traverse a paginated API response.
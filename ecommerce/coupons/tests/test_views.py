@@ -13,9 +13,9 @@ from factory.fuzzy import FuzzyText
 from oscar.core.loading import get_class, get_model
 from oscar.test.factories import OrderFactory, OrderLineFactory, ProductFactory, RangeFactory, VoucherFactory
 
-from ecommerce.core.url_utils import get_lms_url
+from ecommerce.core.url_utils import get_ecommerce_url, get_lms_url
 from ecommerce.coupons.tests.mixins import CouponMixin, DiscoveryMockMixin
-from ecommerce.coupons.views import voucher_is_valid
+from ecommerce.coupons.views import EnrollmentCodeCsvView, voucher_is_valid
 from ecommerce.enterprise.tests.mixins import EnterpriseServiceMockMixin
 from ecommerce.enterprise.utils import (
     get_enterprise_course_consent_url,
@@ -708,3 +708,27 @@ class EnrollmentCodeCsvViewTests(TestCase):
         response = self.client.get(reverse(self.path, args=[order.number]))
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'text/csv')
+        self.assertTrue(response.streaming)
+
+        redeem_url = get_ecommerce_url(reverse('coupons:offer'))
+        self.assertEqual(b''.join(response.streaming_content).decode('utf-8').splitlines(), [
+            'Order Number:,{}'.format(order.number),
+            '',
+            product_title,
+            'Code,Redemption URL,Name Of Employee,Date Of Distribution,Employee Email',
+            '{code},{url}?code={code},,,'.format(code=voucher.code, url=redeem_url),
+            '',
+        ])
+
+    def test_code_batches(self):
+        """ Verify the codes are read in batches, one query per batch. """
+        vouchers = [VoucherFactory(code='CODE{}'.format(index)) for index in range(3)]
+        order = OrderFactory(user=self.user)
+        order_line_vouchers = OrderLineVouchers.objects.create(line=OrderLineFactory(order=order))
+        order_line_vouchers.vouchers.add(*vouchers)
+
+        with mock.patch.object(EnrollmentCodeCsvView, 'code_batch_size', 2):
+            with self.assertNumQueries(3):
+                batches = list(EnrollmentCodeCsvView().iter_code_batches(order_line_vouchers))
+
+        self.assertEqual(batches, [[vouchers[0].code, vouchers[1].code], [vouchers[2].code]])
@@ -6,7 +6,7 @@ import unicodecsv as csv
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils import timezone
@@ -16,6 +16,7 @@ from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView, View
 from oscar.core.loading import get_class, get_model
 
+from ecommerce.core.read_replica import ReadReplicaMixin, read_replica_routing
 from ecommerce.core.url_utils import get_ecommerce_url
 from ecommerce.core.views import StaffOnlyMixin
 from ecommerce.coupons.decorators import login_required_for_credit
@@ -261,8 +262,16 @@ class CouponRedeemView(EdxOrderPlacementMixin, View):
         return HttpResponseRedirect(reverse('basket:summary'))
 
 
-class EnrollmentCodeCsvView(View):
+class RowBuffer(object):
+    """ File-like object returning the rows written to it by CSV writers, rather than storing them. """
+
+    def write(self, value):
+        return value
+
+
+class EnrollmentCodeCsvView(ReadReplicaMixin, View):
     """ Download enrollment code CSV file view. """
+    code_batch_size = 1000
 
     @method_decorator(login_required)
     def dispatch(self, *args, **kwargs):
@@ -288,7 +297,7 @@ class EnrollmentCodeCsvView(View):
             number (str): Number of the order
 
         Returns:
-            HttpResponse
+            StreamingHttpResponse
 
         Raises:
             Http404: When an order number for a non-existing order is passed.
@@ -306,26 +315,49 @@ class EnrollmentCodeCsvView(View):
         file_name = 'Enrollment code CSV order num {}'.format(order.number)
         file_name = '{filename}.csv'.format(filename=slugify(file_name))
 
-        response = HttpResponse(content_type='text/csv')
+        response = StreamingHttpResponse(self.generate_csv(request, order), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename={filename}'.format(filename=file_name)
-
-        redeem_url = get_ecommerce_url(reverse('coupons:offer'))
-        voucher_field_names = ('Code', 'Redemption URL', 'Name Of Employee', 'Date Of Distribution', 'Employee Email')
-        voucher_writer = csv.DictWriter(response, fieldnames=voucher_field_names)
-
-        writer = csv.writer(response)
-        writer.writerow(('Order Number:', order.number))
-        writer.writerow([])
-
-        order_line_vouchers = OrderLineVouchers.objects.filter(line__order=order)
-        for order_line_voucher in order_line_vouchers:
-            writer.writerow([order_line_voucher.line.product.title])
-            voucher_writer.writeheader()
-
-            for voucher in order_line_voucher.vouchers.all():
-                voucher_writer.writerow({
-                    voucher_field_names[0]: voucher.code,
-                    voucher_field_names[1]: '{url}?code={code}'.format(url=redeem_url, code=voucher.code)
-                })
-            writer.writerow([])
         return response
+
+    def generate_csv(self, request, order):
+        """
+        Yields the rows of the CSV of the order, reading its codes in batches, so that the download starts at once
+        and its memory use does not grow with the number of codes.
+        """
+        # The rows are read once the view has returned, so they are routed to the read replica here.
+        with read_replica_routing(request):
+            redeem_url = get_ecommerce_url(reverse('coupons:offer'))
+            voucher_field_names = ('Code', 'Redemption URL', 'Name Of Employee', 'Date Of Distribution',
+                                   'Employee Email')
+            row_buffer = RowBuffer()
+            voucher_writer = csv.DictWriter(row_buffer, fieldnames=voucher_field_names)
+            writer = csv.writer(row_buffer)
+
+            yield writer.writerow(('Order Number:', order.number))
+            yield writer.writerow([])
+
+            order_line_vouchers = OrderLineVouchers.objects.filter(line__order=order).select_related('line__product')
+            for order_line_voucher in order_line_vouchers:
+                yield writer.writerow([order_line_voucher.line.product.title])
+                yield voucher_writer.writerow(dict(zip(voucher_field_names, voucher_field_names)))
+
+                for codes in self.iter_code_batches(order_line_voucher):
+                    yield b''.join(
+                        voucher_writer.writerow({
+                            voucher_field_names[0]: code,
+                            voucher_field_names[1]: '{url}?code={code}'.format(url=redeem_url, code=code)
+                        }) for code in codes
+                    )
+                yield writer.writerow([])
+
+    def iter_code_batches(self, order_line_voucher):
+        """ Yields the codes of the vouchers of the order line, in batches, walking them by ID. """
+        queryset = order_line_voucher.vouchers.order_by('id').values_list('id', 'code')
+        last_id = 0
+        while True:
+            vouchers = list(queryset.filter(id__gt=last_id)[:self.code_batch_size])
+            if not vouchers:
+                return
+
+            yield [code for __, code in vouchers]
+            last_id = vouchers[-1][0]
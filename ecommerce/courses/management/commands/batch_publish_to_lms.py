@@ -0,0 +1,95 @@
+""" This command publishes many courses to LMS concurrently."""
+from __future__ import unicode_literals
+
+import logging
+import os
+
+import unicodecsv as csv
+from django.core.management import BaseCommand, CommandError
+
+from ecommerce.courses.publishers import BatchLMSPublisher
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Publish many courses to LMS, in batches of concurrently published courses."""
+
+    help = 'Publish many courses to LMS, in batches of concurrently published courses'
+
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    logger.addHandler(ch)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course_ids_file',
+                            action='store',
+                            dest='course_ids_file',
+                            default=None,
+                            help='Path to file to read courses from.')
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=100,
+                            help='Number of courses whose seats are retrieved from the database at once.')
+        parser.add_argument('--max_workers',
+                            action='store',
+                            dest='max_workers',
+                            type=int,
+                            default=None,
+                            help='Maximum number of courses published concurrently. '
+                                 'Defaults to the LMS_PUBLICATION_MAX_WORKERS setting.')
+        parser.add_argument('--max_retries',
+                            action='store',
+                            dest='max_retries',
+                            type=int,
+                            default=None,
+                            help='Number of times failed publications are retried. '
+                                 'Defaults to the LMS_PUBLICATION_MAX_RETRIES setting.')
+        parser.add_argument('--report_file',
+                            action='store',
+                            dest='report_file',
+                            default=None,
+                            help='Path to the CSV file the courses that failed to publish are written to.')
+
+    def handle(self, *args, **options):
+        course_ids_file = options['course_ids_file']
+        if not course_ids_file or not os.path.exists(course_ids_file):
+            raise CommandError("Pass the correct absolute path to course ids file as --course_ids_file argument.")
+
+        with open(course_ids_file, 'r') as file_handler:
+            course_ids = [course_id.strip() for course_id in file_handler.readlines() if course_id.strip()]
+
+        total_courses = len(course_ids)
+        logger.info("Publishing %d courses.", total_courses)
+
+        progress = {'published': 0}
+
+        def log_progress(course_id, error):
+            progress['published'] += 1
+            if error:
+                logger.error(
+                    u"(%d/%d) Failed to publish %s: %s", progress['published'], total_courses, course_id, error
+                )
+            else:
+                logger.info(u"(%d/%d) Successfully published %s.", progress['published'], total_courses, course_id)
+
+        publisher = BatchLMSPublisher(
+            batch_size=options['batch_size'],
+            max_workers=options['max_workers'],
+            max_retries=options['max_retries']
+        )
+        errors = publisher.publish(course_ids, callback=log_progress)
+        failures = [(course_id, unicode(error)) for course_id, error in errors.items() if error]
+
+        if options['report_file']:
+            with open(options['report_file'], 'wb') as report_file:
+                writer = csv.writer(report_file, encoding='utf-8')
+                writer.writerow(['course_id', 'error'])
+                writer.writerows(failures)
+
+        if failures:
+            logger.error("Completed publishing courses. %d of %d failed.", len(failures), total_courses)
+        else:
+            logger.info("All %d courses successfully published.", total_courses)
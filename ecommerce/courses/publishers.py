@@ -2,18 +2,30 @@ from __future__ import unicode_literals
 
 import json
 import logging
+import time
+from collections import OrderedDict, defaultdict
+from multiprocessing.pool import ThreadPool
 
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 from edx_rest_api_client.exceptions import SlumberHttpBaseException
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 
-from ecommerce.core.constants import ENROLLMENT_CODE_SEAT_TYPES
+from ecommerce.core.constants import (
+    ENROLLMENT_CODE_PRODUCT_CLASS_NAME,
+    ENROLLMENT_CODE_SEAT_TYPES,
+    SEAT_PRODUCT_CLASS_NAME
+)
 from ecommerce.courses.utils import mode_for_product
 
 logger = logging.getLogger(__name__)
 Product = get_model('catalogue', 'Product')
+Selector = get_class('partner.strategy', 'Selector')
 StockRecord = get_model('partner', 'StockRecord')
 
+# Marks the enrollment code of a course as not yet retrieved.
+UNKNOWN = object()
+
 
 class LMSPublisher(object):
     def get_seat_expiration(self, seat):
@@ -25,15 +37,27 @@ class LMSPublisher(object):
     def get_course_verification_deadline(self, course):
         return course.verification_deadline.isoformat() if course.verification_deadline else None
 
-    def serialize_seat_for_commerce_api(self, seat):
-        """ Serializes a course seat product to a dict that can be further serialized to JSON. """
-        stock_record = seat.stockrecords.first()
+    def get_stock_record(self, product):
+        """ Returns the first stock record of the product, from the stock records prefetched with it if any. """
+        stock_records = sorted(product.stockrecords.all(), key=lambda stock_record: stock_record.id)
+        return stock_records[0] if stock_records else None
+
+    def serialize_seat_for_commerce_api(self, seat, enrollment_code=UNKNOWN):
+        """ Serializes a course seat product to a dict that can be further serialized to JSON.
+
+        Arguments:
+            seat (Product): Course seat to be serialized.
+            enrollment_code (Product): Available enrollment code of the course of the seat, or None if the course
+                has none. The enrollment code is retrieved when needed if not given.
+        """
+        stock_record = self.get_stock_record(seat)
 
         bulk_sku = None
         if getattr(seat.attr, 'certificate_type', '') in ENROLLMENT_CODE_SEAT_TYPES:
-            enrollment_code = seat.course.enrollment_code_product
+            if enrollment_code is UNKNOWN:
+                enrollment_code = seat.course.enrollment_code_product
             if enrollment_code:
-                bulk_sku = enrollment_code.stockrecords.first().partner_sku
+                bulk_sku = self.get_stock_record(enrollment_code).partner_sku
 
         return {
             'name': mode_for_product(seat),
@@ -56,13 +80,41 @@ class LMSPublisher(object):
         Returns:
             None, if publish operation succeeded; otherwise, error message.
         """
+        return self.send(course, self.serialize_seats_for_commerce_api(course, course.seat_products))
+
+    def serialize_seats_for_commerce_api(self, course, seats, enrollment_code=UNKNOWN):
+        """ Serializes the seats of a course, retrieving the enrollment code of the course at most once. """
+        modes = []
+        for seat in seats:
+            if enrollment_code is UNKNOWN and getattr(seat.attr, 'certificate_type', '') in ENROLLMENT_CODE_SEAT_TYPES:
+                enrollment_code = course.enrollment_code_product
+            modes.append(self.serialize_seat_for_commerce_api(seat, enrollment_code))
+        return modes
+
+    def send(self, course, modes):
+        """ Send course commerce data, with the given serialized seats, to LMS.
+
+        Arguments:
+            course (Course): Course to be published.
+            modes (list): Seats of the course, serialized by `serialize_seat_for_commerce_api`.
+
+        Returns:
+            None, if publish operation succeeded; otherwise, error message.
+        """
+        return self._send(course, modes)[0]
+
+    def _send(self, course, modes):
+        """ Send course commerce data to LMS.
+
+        Returns:
+            tuple: None or an error message, and whether the failure may be resolved by retrying.
+        """
         site = course.partner.default_site
         course_id = course.id
         error_message = _('Failed to publish commerce data for {course_id} to LMS.').format(course_id=course_id)
 
         name = course.name
         verification_deadline = self.get_course_verification_deadline(course)
-        modes = [self.serialize_seat_for_commerce_api(seat) for seat in course.seat_products]
 
         has_credit = 'credit' in [mode['name'] for mode in modes]
         if has_credit:
@@ -84,10 +136,10 @@ class LMSPublisher(object):
                     e.response.status_code,
                     e.content
                 )
-                return error_message
+                return error_message, self._is_retryable(e)
             except:  # pylint: disable=bare-except
                 logger.exception('Failed to publish CreditCourse for [%s] to LMS.', course_id)
-                return error_message
+                return error_message, True
 
         try:
             data = {
@@ -107,10 +159,16 @@ class LMSPublisher(object):
                 e.response.status_code,
                 e.content
             )
-            return self._parse_error(e.content, error_message)
+            return self._parse_error(e.content, error_message), self._is_retryable(e)
         except Exception:  # pylint: disable=broad-except
             logger.exception('Failed to publish commerce data for [%s] to LMS.', course_id)
-            return error_message
+            return error_message, True
+
+        return None, False
+
+    def _is_retryable(self, error):
+        """ Returns True if a failed request to LMS may succeed when retried, i.e. it did not fail validation. """
+        return error.response.status_code >= 500 or error.response.status_code == 429
 
     def _parse_error(self, response, default_error_message):
         """When validation errors occur during publication, the LMS is expected
@@ -142,3 +200,142 @@ class LMSPublisher(object):
             return ' '.join([default_error_message, message])
         else:
             return default_error_message
+
+
+class BatchLMSPublisher(object):
+    """ Publishes the commerce data of many courses to LMS.
+
+    The courses are published in batches. The seats, stock records and enrollment codes of the courses of a
+    batch are retrieved with a few queries, after which the courses are sent to LMS concurrently by a bounded
+    pool of workers. Failures that may be resolved by retrying, such as timeouts and server errors, are retried
+    with an exponential backoff.
+    """
+
+    def __init__(self, batch_size=100, max_workers=None, max_retries=None, retry_backoff=None):
+        self.batch_size = batch_size
+        self.max_workers = max_workers or settings.LMS_PUBLICATION_MAX_WORKERS
+        self.max_retries = settings.LMS_PUBLICATION_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = settings.LMS_PUBLICATION_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.publisher = LMSPublisher()
+
+    def publish(self, course_ids, callback=None):
+        """ Publish the commerce data of the given courses to LMS.
+
+        Arguments:
+            course_ids (list): IDs of the courses to be published.
+            callback (callable): Called with the ID and the publication error of each course, if any, as soon as
+                the batch of the course has been published.
+
+        Returns:
+            OrderedDict: Publication error of each course, or None if the course was published, by course ID.
+        """
+        errors = OrderedDict()
+        for start in range(0, len(course_ids), self.batch_size):
+            batch_errors = self.publish_batch(course_ids[start:start + self.batch_size])
+            for course_id, error in batch_errors.items():
+                errors[course_id] = error
+                if callback:
+                    callback(course_id, error)
+
+        return errors
+
+    def publish_batch(self, course_ids):
+        """ Publish a batch of courses to LMS.
+
+        Returns:
+            OrderedDict: Publication error of each course, or None if the course was published, by course ID.
+        """
+        # pylint: disable=cyclic-import
+        from ecommerce.courses.models import Course
+
+        courses = Course.objects.filter(id__in=course_ids).select_related('partner__default_site__siteconfiguration')
+        courses = {course.id: course for course in courses}
+
+        # The database is only read from this thread, the workers only send the serialized courses to LMS.
+        publications = []
+        errors = OrderedDict()
+        seats = self.get_seats(courses.keys())
+        enrollment_codes = self.get_enrollment_codes(courses.keys())
+        for course_id in course_ids:
+            course = courses.get(course_id)
+            if course is None:
+                errors[course_id] = _('Course does not exist.')
+                continue
+
+            try:
+                modes = self.publisher.serialize_seats_for_commerce_api(
+                    course, seats[course_id], enrollment_codes.get(course_id)
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to serialize commerce data for [%s].', course_id)
+                errors[course_id] = _('Failed to publish commerce data for {course_id} to LMS.').format(
+                    course_id=course_id
+                )
+                continue
+
+            errors[course_id] = None
+            publications.append((course, modes))
+
+        if publications:
+            pool = ThreadPool(min(len(publications), self.max_workers))
+            try:
+                results = pool.map(self._send, publications)
+            finally:
+                pool.close()
+                pool.join()
+
+            for (course, __), error in zip(publications, results):
+                errors[course.id] = error
+
+        return errors
+
+    def get_seats(self, course_ids):
+        """ Returns the seats of the given courses, with their attributes and stock records, by course ID. """
+        seats = Product.objects.filter(
+            parent__course_id__in=course_ids,
+            parent__product_class__name=SEAT_PRODUCT_CLASS_NAME,
+            parent__structure=Product.PARENT,
+        ).select_related('parent').prefetch_related('attribute_values__attribute', 'stockrecords')
+
+        seats_by_course = defaultdict(list)
+        for seat in seats:
+            self._initiate_attributes(seat)
+            seats_by_course[seat.parent.course_id].append(seat)
+        return seats_by_course
+
+    def get_enrollment_codes(self, course_ids):
+        """ Returns the available enrollment codes of the given courses, by course ID. """
+        enrollment_codes = Product.objects.filter(
+            course_id__in=course_ids,
+            product_class__name=ENROLLMENT_CODE_PRODUCT_CLASS_NAME,
+        ).prefetch_related('stockrecords')
+
+        strategy = Selector().strategy()
+        return {
+            enrollment_code.course_id: enrollment_code
+            for enrollment_code in enrollment_codes
+            if strategy.fetch_for_product(enrollment_code).availability.is_available_to_buy
+        }
+
+    def _initiate_attributes(self, product):
+        """ Initiates the attributes of the product from its prefetched attribute values, like Oscar would. """
+        for value in product.attribute_values.all():
+            setattr(product.attr, value.attribute.code, value.value)
+        product.attr.initialised = True
+
+    def _send(self, publication):
+        """ Send a serialized course to LMS, retrying failures that may be resolved by retrying. """
+        course, modes = publication
+        attempt = 0
+        while True:
+            error, retryable = self.publisher._send(course, modes)  # pylint: disable=protected-access
+            if not error or not retryable or attempt >= self.max_retries:
+                return error
+
+            delay = self.retry_backoff * 2 ** attempt
+            attempt += 1
+            logger.warning(
+                'Retrying publication of [%s] to LMS in %.1f seconds (attempt %d of %d).',
+                course.id, delay, attempt, self.max_retries
+            )
+            time.sleep(delay)
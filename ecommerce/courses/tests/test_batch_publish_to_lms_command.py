@@ -0,0 +1,78 @@
+"""Contains the tests for the batch publish to lms command."""
+
+from __future__ import unicode_literals
+
+import os
+import tempfile
+from collections import OrderedDict
+
+import mock
+import unicodecsv as csv
+from django.core.management import CommandError, call_command
+from testfixtures import LogCapture
+
+from ecommerce.courses.publishers import BatchLMSPublisher
+from ecommerce.tests.testcases import TestCase
+
+LOGGER_NAME = 'ecommerce.courses.management.commands.batch_publish_to_lms'
+
+
+class BatchPublishCoursesToLMSTests(TestCase):
+    """Tests the batch course publish command."""
+
+    def setUp(self):
+        super(BatchPublishCoursesToLMSTests, self).setUp()
+        self.course_ids = ['course-v1:a+b+c', 'course-v1:d+e+f']
+        self.course_ids_file = tempfile.NamedTemporaryFile(delete=False)
+        self.course_ids_file.write('\n'.join(self.course_ids))
+        self.course_ids_file.close()
+        self.report_file = os.path.join(tempfile.gettempdir(), 'tmp-publish-report.csv')
+
+    def tearDown(self):
+        super(BatchPublishCoursesToLMSTests, self).tearDown()
+        for path in (self.course_ids_file.name, self.report_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def mock_publish(self, errors):
+        def publish(_self, course_ids, callback=None):
+            for course_id in course_ids:
+                callback(course_id, errors[course_id])
+            return OrderedDict((course_id, errors[course_id]) for course_id in course_ids)
+
+        return mock.patch.object(BatchLMSPublisher, 'publish', autospec=True, side_effect=publish)
+
+    def test_invalid_file_path(self):
+        """ Verify command raises the CommandError for invalid file path. """
+        with self.assertRaises(CommandError):
+            call_command('batch_publish_to_lms', course_ids_file='fake/path')
+
+    def test_publish(self):
+        """ Verify the progress is logged, and the courses that failed to publish are reported. """
+        errors = {self.course_ids[0]: None, self.course_ids[1]: 'The failure message.'}
+        with self.mock_publish(errors):
+            with LogCapture(LOGGER_NAME) as lc:
+                call_command(
+                    'batch_publish_to_lms', course_ids_file=self.course_ids_file.name, report_file=self.report_file
+                )
+                lc.check(
+                    (LOGGER_NAME, 'INFO', 'Publishing 2 courses.'),
+                    (LOGGER_NAME, 'INFO', '(1/2) Successfully published {}.'.format(self.course_ids[0])),
+                    (LOGGER_NAME, 'ERROR', '(2/2) Failed to publish {}: The failure message.'.format(
+                        self.course_ids[1]
+                    )),
+                    (LOGGER_NAME, 'ERROR', 'Completed publishing courses. 1 of 2 failed.'),
+                )
+
+        with open(self.report_file, 'rb') as report_file:
+            self.assertEqual(list(csv.reader(report_file)), [
+                ['course_id', 'error'],
+                [self.course_ids[1], 'The failure message.'],
+            ])
+
+    def test_publish_successfully(self):
+        """ Verify a successful publication is logged. """
+        with self.mock_publish({course_id: None for course_id in self.course_ids}):
+            with LogCapture(LOGGER_NAME) as lc:
+                call_command('batch_publish_to_lms', course_ids_file=self.course_ids_file.name)
+                self.assertEqual(lc.records[-1].getMessage(), 'All 2 courses successfully published.')
@@ -13,7 +13,7 @@ from testfixtures import LogCapture
 
 from ecommerce.core.constants import ENROLLMENT_CODE_PRODUCT_CLASS_NAME
 from ecommerce.core.url_utils import get_lms_url
-from ecommerce.courses.publishers import LMSPublisher
+from ecommerce.courses.publishers import BatchLMSPublisher, LMSPublisher
 from ecommerce.courses.tests.factories import CourseFactory
 from ecommerce.extensions.catalogue.tests.mixins import DiscoveryTestMixin
 from ecommerce.tests.testcases import TestCase
@@ -233,3 +233,98 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
         actual = self.attempt_credit_publication(500)
         expected = 'Failed to publish commerce data for {} to LMS.'.format(self.course.id)
         self.assertEqual(actual, expected)
+
+
+class BatchLMSPublisherTests(DiscoveryTestMixin, TestCase):
+    def setUp(self):
+        super(BatchLMSPublisherTests, self).setUp()
+
+        httpretty.enable()
+        self.mock_access_token_response()
+
+        self.courses = []
+        for __ in range(2):
+            course = CourseFactory(partner=self.partner)
+            course.create_or_update_seat('honor', False, 0)
+            course.create_or_update_seat('verified', True, 50, create_enrollment_code=True)
+            self.courses.append(course)
+        self.publisher = BatchLMSPublisher(batch_size=10, max_workers=2, max_retries=2, retry_backoff=0)
+
+    def tearDown(self):
+        super(BatchLMSPublisherTests, self).tearDown()
+        httpretty.disable()
+        httpretty.reset()
+
+    def mock_commerce_api(self, course, responses):
+        url = self.site_configuration.build_lms_url('/api/commerce/v1/courses/{}/'.format(course.id))
+        httpretty.register_uri(httpretty.PUT, url, responses=[
+            httpretty.Response(status=status, body='{}', content_type=JSON) for status in responses
+        ])
+
+    def get_published_courses(self):
+        """ Returns the data of the courses sent to the Commerce API, by course ID. """
+        published = {}
+        for request in httpretty.httpretty.latest_requests:
+            if request.method == 'PUT':
+                data = json.loads(request.body)
+                published[data['id']] = data
+        return published
+
+    def test_publish(self):
+        """ Verify the courses are published with the same data as published by LMSPublisher. """
+        for course in self.courses:
+            self.mock_commerce_api(course, [200])
+
+        errors = self.publisher.publish([course.id for course in self.courses] + ['fake/course/id'])
+        self.assertEqual(errors.keys(), [course.id for course in self.courses] + ['fake/course/id'])
+        self.assertEqual(errors.values()[:2], [None, None])
+        self.assertEqual(errors['fake/course/id'], 'Course does not exist.')
+
+        published = self.get_published_courses()
+        lms_publisher = LMSPublisher()
+        for course in self.courses:
+            modes = sorted(published[course.id]['modes'], key=lambda mode: mode['name'])
+            expected = sorted(
+                [lms_publisher.serialize_seat_for_commerce_api(seat) for seat in course.seat_products],
+                key=lambda mode: mode['name']
+            )
+            self.assertEqual(modes, expected)
+            self.assertIsNotNone(next(mode['bulk_sku'] for mode in modes if mode['name'] == 'verified'))
+
+    def test_publish_queries(self):
+        """ Verify the number of queries made to publish a batch does not depend on the number of courses. """
+        for course in self.courses:
+            self.mock_commerce_api(course, [200])
+
+        with self.assertNumQueries(7):
+            self.publisher.publish_batch([self.courses[0].id])
+
+        with self.assertNumQueries(7):
+            self.publisher.publish_batch([course.id for course in self.courses])
+
+    def test_publish_retries(self):
+        """ Verify server errors are retried, while validation errors are not. """
+        self.mock_commerce_api(self.courses[0], [503, 500, 200])
+        self.mock_commerce_api(self.courses[1], [400, 200])
+
+        errors = self.publisher.publish([course.id for course in self.courses])
+        self.assertIsNone(errors[self.courses[0].id])
+        self.assertEqual(errors[self.courses[1].id], 'Failed to publish commerce data for {} to LMS.'.format(
+            self.courses[1].id
+        ))
+
+        paths = [request.path for request in httpretty.httpretty.latest_requests if request.method == 'PUT']
+        self.assertEqual(paths.count('/api/commerce/v1/courses/{}/'.format(self.courses[0].id)), 3)
+        self.assertEqual(paths.count('/api/commerce/v1/courses/{}/'.format(self.courses[1].id)), 1)
+
+    def test_publish_callback(self):
+        """ Verify the callback is called with the publication error of each course. """
+        self.mock_commerce_api(self.courses[0], [200])
+        self.mock_commerce_api(self.courses[1], [500])
+        callback = mock.Mock()
+
+        self.publisher.publish([course.id for course in self.courses], callback=callback)
+        self.assertEqual(callback.call_args_list, [
+            mock.call(self.courses[0].id, None),
+            mock.call(self.courses[1].id, 'Failed to publish commerce data for {} to LMS.'.format(self.courses[1].id)),
+        ])
@@ -6,6 +6,7 @@ from edx_django_utils.cache import TieredCache
 from mock import patch
 from opaque_keys.edx.keys import CourseKey
 from requests.exceptions import ConnectionError
+from slumber.exceptions import SlumberBaseException
 
 from ecommerce.coupons.tests.mixins import DiscoveryMockMixin
 from ecommerce.courses.tests.factories import CourseFactory
@@ -13,7 +14,8 @@ from ecommerce.courses.utils import (
     get_certificate_type_display_value,
     get_course_catalogs,
     get_course_info_from_catalog,
-    mode_for_product
+    mode_for_product,
+    prefetch_course_info_from_catalog
 )
 from ecommerce.entitlements.utils import create_or_update_course_entitlement
 from ecommerce.extensions.catalogue.tests.mixins import DiscoveryTestMixin
@@ -100,6 +102,36 @@ class UtilsTests(DiscoveryTestMixin, DiscoveryMockMixin, TestCase):
             _ = get_course_info_from_catalog(self.request.site, product)
             self.assertEqual(mocked_set_all_tiers.call_count, 2)
 
+    def test_prefetch_course_info_from_catalog(self):
+        """ Verify the course information of several products is retrieved from the Discovery Service and cached. """
+        self.mock_access_token_response()
+        courses = [CourseFactory(partner=self.partner) for __ in range(3)]
+        products = [course.create_or_update_seat('verified', True, 100) for course in courses]
+        entitlement = create_or_update_course_entitlement(
+            'verified', 100, self.partner, 'foo-bar', 'Foo Bar Entitlement')
+        for course in courses[:2]:
+            self.mock_course_run_detail_endpoint(course, discovery_api_url=self.site_configuration.discovery_api_url)
+        self.mock_course_detail_endpoint(entitlement, discovery_api_url=self.site_configuration.discovery_api_url)
+        httpretty.register_uri(
+            httpretty.GET,
+            '{}course_runs/{}/'.format(self.site_configuration.discovery_api_url, courses[2].id),
+            status=500
+        )
+
+        with patch('ecommerce.courses.utils.logger') as mock_logger:
+            prefetch_course_info_from_catalog(self.request.site, products + [entitlement])
+            self.assertEqual(mock_logger.exception.call_count, 1)
+
+        request_count = len(httpretty.httpretty.latest_requests)
+        for course, product in zip(courses[:2], products):
+            self.assertEqual(get_course_info_from_catalog(self.request.site, product)['title'], course.name)
+        self.assertEqual(get_course_info_from_catalog(self.request.site, entitlement)['title'], entitlement.title)
+        self.assertEqual(len(httpretty.httpretty.latest_requests), request_count)
+
+        # The course information which could not be retrieved is not cached.
+        with self.assertRaises(SlumberBaseException):
+            get_course_info_from_catalog(self.request.site, products[2])
+
     @ddt.data(
         ('honor', 'Honor'),
         ('verified', 'Verified'),
@@ -1,12 +1,19 @@
 import hashlib
+import logging
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 from edx_django_utils.cache import TieredCache
 from opaque_keys.edx.keys import CourseKey
+from requests.exceptions import ConnectionError, Timeout
+from slumber.exceptions import SlumberBaseException
 
 from ecommerce.core.utils import deprecated_traverse_pagination
 
+logger = logging.getLogger(__name__)
+
 
 def mode_for_product(product):
     """
@@ -23,18 +30,26 @@ def mode_for_product(product):
     return mode
 
 
+def _get_course_info_key(product):
+    """ Returns the key of the course, or course run, of the product in the Discovery Service. """
+    if product.is_course_entitlement_product:
+        return product.attr.UUID
+    return CourseKey.from_string(product.attr.course_key)
+
+
+def _get_course_info_cache_key(key, partner_short_code):
+    cache_key = 'courses_api_detail_{}{}'.format(key, partner_short_code)
+    return hashlib.md5(cache_key).hexdigest()
+
+
 def get_course_info_from_catalog(site, product):
     """ Get course or course_run information from Discovery Service and cache """
-    if product.is_course_entitlement_product:
-        key = product.attr.UUID
-    else:
-        key = CourseKey.from_string(product.attr.course_key)
+    key = _get_course_info_key(product)
 
     api = site.siteconfiguration.discovery_api_client
     partner_short_code = site.siteconfiguration.partner.short_code
 
-    cache_key = 'courses_api_detail_{}{}'.format(key, partner_short_code)
-    cache_key = hashlib.md5(cache_key).hexdigest()
+    cache_key = _get_course_info_cache_key(key, partner_short_code)
     course_cached_response = TieredCache.get_cached_response(cache_key)
     if course_cached_response.is_found:
         return course_cached_response.value
@@ -48,6 +63,59 @@ def get_course_info_from_catalog(site, product):
     return course
 
 
+def prefetch_course_info_from_catalog(site, products):
+    """
+    Caches the course or course_run information of the given products, for get_course_info_from_catalog.
+
+    The information missing from the cache is retrieved from the Discovery Service with up to
+    COURSES_API_MAX_CONCURRENT_REQUESTS concurrent requests, so that retrieving the information of several
+    products takes about as long as a single request. Failed requests are logged, and left to be retried by
+    get_course_info_from_catalog.
+
+    Arguments:
+        site (Site): Site object containing Site Configuration data
+        products (list of Products): Seats, enrollment codes or course entitlements
+    """
+    api = site.siteconfiguration.discovery_api_client
+    partner_short_code = site.siteconfiguration.partner.short_code
+
+    pending = OrderedDict()
+    for product in products:
+        key = _get_course_info_key(product)
+        cache_key = _get_course_info_cache_key(key, partner_short_code)
+        if cache_key in pending or TieredCache.get_cached_response(cache_key).is_found:
+            continue
+
+        if product.is_course_entitlement_product:
+            pending[cache_key] = (key, api.courses(key).get, {})
+        else:
+            pending[cache_key] = (key, api.course_runs(key).get, {'partner': partner_short_code})
+
+    def get_course_info(request):
+        key, get, params = request
+        try:
+            return get(**params)
+        except (ConnectionError, SlumberBaseException, Timeout):
+            logger.exception('Failed to retrieve data from Discovery Service for course [%s].', key)
+            return None
+
+    # A single request is left to get_course_info_from_catalog, which would otherwise retry it on failure.
+    if len(pending) < 2:
+        return
+
+    # The results are cached from this thread, since the request cache is local to each thread.
+    pool = ThreadPool(min(len(pending), settings.COURSES_API_MAX_CONCURRENT_REQUESTS))
+    try:
+        courses = pool.map(get_course_info, pending.values())
+    finally:
+        pool.close()
+        pool.join()
+
+    for cache_key, course in zip(pending.keys(), courses):
+        if course is not None:
+            TieredCache.set_all_tiers(cache_key, course, settings.COURSES_API_CACHE_TIMEOUT)
+
+
 def get_course_catalogs(site, resource_id=None):
     """
     Get details related to course catalogs from Discovery Service.
@@ -265,3 +265,20 @@ class CheckoutPageTest(DiscoveryTestMixin, TestCase, JwtMixin):
 
         self.assertEqual(provider_info['new_price'], '0.00')
         self.assertEqual(provider_info['discount'], discount)
+
+    @httpretty.activate
+    def test_providers_cached(self):
+        """ Verify the details of the providers are cached, while the eligibility is checked on every page view. """
+        self.course.create_or_update_seat(
+            'credit', True, self.price, self.provider, credit_hours=self.credit_hours
+        )
+        self._mock_eligibility_api(body=self.eligibilities)
+        self._mock_providers_api(body=self.provider_data)
+
+        self._assert_success_checkout_page()
+        self.assertEqual(len(httpretty.httpretty.latest_requests), 2)
+
+        response = self.client.get(self.path)
+        self.assertEqual(response.context['providers'][0]['price'], self.price)
+        self.assertEqual(len(httpretty.httpretty.latest_requests), 3)
+        self.assertEqual(httpretty.last_request().path.split('?')[0], '/api/credit/v1/eligibility/')
@@ -1,19 +1,23 @@
 from __future__ import unicode_literals
 
 import logging
+from multiprocessing.pool import ThreadPool
 
 from dateutil.parser import parse
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import TemplateView
+from edx_django_utils.cache import TieredCache
 from edx_rest_api_client.client import EdxRestApiClient
 from oscar.core.loading import get_model
 from slumber.exceptions import SlumberHttpBaseException
 
 from ecommerce.core.url_utils import get_lms_url
+from ecommerce.core.utils import get_cache_key
 from ecommerce.courses.models import Course
 from ecommerce.extensions.analytics.utils import prepare_analytics_data
 from ecommerce.extensions.offer.utils import format_benefit_value
@@ -36,14 +40,6 @@ class Checkout(TemplateView):
         course = get_object_or_404(Course, id=kwargs.get('course_id'))
         context['course'] = course
 
-        deadline = self._check_credit_eligibility(self.request.user, kwargs.get('course_id'))
-        if not deadline:
-            context.update({
-                'error': _('An error has occurred. We could not confirm that you are eligible for course credit. '
-                           'Try the transaction again.')
-            })
-            return context
-
         partner = get_partner_for_site(self.request)
         strategy = self.request.strategy
         # Audit seats do not have a `certificate_type` attribute, so
@@ -55,9 +51,20 @@ class Checkout(TemplateView):
                 continue
 
             purchase_info = strategy.fetch_for_product(seat)
-            if purchase_info.availability.is_available_to_buy and seat.stockrecords.filter(partner=partner).exists():
+            if purchase_info.availability.is_available_to_buy and self._get_stockrecord(seat, partner):
                 credit_seats.append(seat)
 
+        # The eligibility of the user and the details of the providers are retrieved from LMS concurrently.
+        deadline, providers = self._get_eligibility_and_providers(
+            self.request.user, kwargs.get('course_id'), credit_seats
+        )
+        if not deadline:
+            context.update({
+                'error': _('An error has occurred. We could not confirm that you are eligible for course credit. '
+                           'Try the transaction again.')
+            })
+            return context
+
         if not credit_seats:
             msg = _(
                 'Credit is not currently available for "{course_name}". If you are currently enrolled in the '
@@ -71,7 +78,7 @@ class Checkout(TemplateView):
             context.update({'error': msg})
             return context
 
-        providers = self._get_providers_detail(credit_seats)
+        providers = self._get_providers_detail(credit_seats, providers)
         if not providers:
             context.update({
                 'error': _('An error has occurred. We could not confirm that the institution you selected offers this '
@@ -95,6 +102,50 @@ class Checkout(TemplateView):
     def get(self, request, *args, **kwargs):
         return super(Checkout, self).get(request, args, **kwargs)
 
+    def _get_stockrecord(self, seat, partner):
+        """ Returns the stock record of the seat for the partner, from the stock records prefetched with the seat. """
+        for stockrecord in seat.stockrecords.all():
+            if stockrecord.partner_id == partner.id:
+                return stockrecord
+        return None
+
+    def _get_eligibility_and_providers(self, user, course_key, credit_seats):
+        """ Check that the user is eligible for credit, and get the providers of the credit seats.
+
+        Both are retrieved from LMS concurrently, unless the providers are cached.
+
+        Arguments:
+            user(User): User object for which checking the eligibility.
+            course_key(string): The course identifier.
+            credit_seats (Products[]): List of credit_seats objects.
+
+        Returns:
+            tuple: Eligibility deadline date or None, and the response of `_get_providers_from_lms`.
+        """
+        if not credit_seats:
+            return self._check_credit_eligibility(user, course_key), None
+
+        cache_key = self._get_providers_cache_key(credit_seats)
+        providers_cached_response = TieredCache.get_cached_response(cache_key)
+        if providers_cached_response.is_found:
+            return self._check_credit_eligibility(user, course_key), providers_cached_response.value
+
+        # The client is built from this thread, since it reads the access token of the user from the database.
+        self.credit_api_client  # pylint: disable=pointless-statement
+        pool = ThreadPool(2)
+        try:
+            eligibility = pool.apply_async(self._check_credit_eligibility, (user, course_key))
+            providers = pool.apply_async(self._get_providers_from_lms, (credit_seats,))
+            deadline, providers = eligibility.get(), providers.get()
+        finally:
+            pool.close()
+            pool.join()
+
+        # The providers are cached from this thread, since the request cache is local to each thread.
+        if providers:
+            TieredCache.set_all_tiers(cache_key, providers, settings.CREDIT_PROVIDER_CACHE_TIMEOUT)
+        return deadline, providers
+
     def _check_credit_eligibility(self, user, course_key):
         """ Check that the user is eligible for credit.
 
@@ -121,40 +172,40 @@ class Checkout(TemplateView):
             )
             return None
 
-    def _get_providers_detail(self, credit_seats):
+    def _get_providers_detail(self, credit_seats, providers):
         """ Get details for the credit providers for the given credit seats.
 
         Arguments:
             credit_seats (Products[]): List of credit_seats objects.
+            providers (list): Providers of the credit seats, as returned by `_get_providers_from_lms`.
 
         Returns:
             A list of dictionaries with provider(s) detail.
         """
-        code = self.request.GET.get('code')
-        if code:
-            voucher = Voucher.objects.get(code=code)
-            discount_type = voucher.benefit.type
-            discount_value = voucher.benefit.value
-
-        providers = self._get_providers_from_lms(credit_seats)
         if not providers:
             return None
 
+        benefit = None
+        discount = None
+        code = self.request.GET.get('code')
+        if code:
+            benefit = Voucher.objects.get(code=code).benefit
+            discount = format_benefit_value(benefit)
+
+        # The providers may be shared through the cache, so they are copied before being updated.
         providers_dict = {}
         for provider in providers:
-            providers_dict[provider['id']] = provider
+            providers_dict[provider['id']] = dict(provider)
 
         partner = get_partner_for_site(self.request)
         for seat in credit_seats:
-            stockrecord = seat.stockrecords.filter(partner=partner).first()
+            stockrecord = self._get_stockrecord(seat, partner)
             new_price = None
-            discount = None
-            if code:
-                discount = format_benefit_value(voucher.benefit)
-                if discount_type == 'Percentage':
-                    new_price = stockrecord.price_excl_tax - (stockrecord.price_excl_tax * (discount_value / 100))
+            if benefit:
+                if benefit.type == 'Percentage':
+                    new_price = stockrecord.price_excl_tax - (stockrecord.price_excl_tax * (benefit.value / 100))
                 else:
-                    new_price = stockrecord.price_excl_tax - discount_value
+                    new_price = stockrecord.price_excl_tax - benefit.value
                 new_price = '{0:.2f}'.format(new_price)
             providers_dict[seat.attr.credit_provider].update({
                 'price': stockrecord.price_excl_tax,
@@ -166,6 +217,17 @@ class Checkout(TemplateView):
 
         return providers_dict.values()
 
+    def _get_providers_cache_key(self, credit_seats):
+        """ Returns the key of the cached providers of the given credit seats. """
+        return get_cache_key(
+            resource='credit_providers',
+            provider_ids=self._get_provider_ids(credit_seats),
+        )
+
+    def _get_provider_ids(self, credit_seats):
+        """ Returns the comma-separated IDs of the providers of the given credit seats. """
+        return ",".join([seat.attr.credit_provider for seat in credit_seats if seat.attr.credit_provider])
+
     def _get_providers_from_lms(self, credit_seats):
         """ Helper method for getting provider info from LMS.
 
@@ -176,7 +238,7 @@ class Checkout(TemplateView):
             Response from LMS as json, containing list of providers.
         """
 
-        provider_ids = ",".join([seat.attr.credit_provider for seat in credit_seats if seat.attr.credit_provider])
+        provider_ids = self._get_provider_ids(credit_seats)
 
         try:
             return self.credit_api_client.providers.get(provider_ids=provider_ids)
@@ -15,8 +15,6 @@ from ecommerce.extensions.offer.constants import OFFER_ASSIGNMENT_REVOKED, OFFER
 from ecommerce.extensions.offer.decorators import check_condition_applicability
 from ecommerce.extensions.offer.mixins import ConditionWithoutRangeMixin, SingleItemConsumptionConditionMixin
 
-BasketAttribute = get_model('basket', 'BasketAttribute')
-BasketAttributeType = get_model('basket', 'BasketAttributeType')
 Condition = get_model('offer', 'Condition')
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 OfferAssignment = get_model('offer', 'OfferAssignment')
@@ -141,15 +139,7 @@ class EnterpriseCustomerCondition(ConditionWithoutRangeMixin, SingleItemConsumpt
 
         if not catalog:
             # For actual baskets get `catalog` from basket attribute
-            enterprise_catalog_attribute, __ = BasketAttributeType.objects.get_or_create(
-                name=ENTERPRISE_CATALOG_ATTRIBUTE_TYPE
-            )
-            enterprise_customer_catalog = BasketAttribute.objects.filter(
-                basket=basket,
-                attribute_type=enterprise_catalog_attribute,
-            ).first()
-            if enterprise_customer_catalog:
-                catalog = enterprise_customer_catalog.value_text
+            catalog = basket.get_attribute(ENTERPRISE_CATALOG_ATTRIBUTE_TYPE)
 
         # Return only valid UUID
         try:
@@ -1,3 +1,5 @@
+import six
+from edx_rest_framework_extensions.paginators import DefaultPagination
 from rest_framework import pagination
 
 
@@ -7,3 +9,69 @@ class PageNumberPagination(pagination.PageNumberPagination):
     # NOTE (CCB): This is a hack, necessary until the frontend
     # can properly follow our paginated lists.
     max_page_size = 10000
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination, where every page costs the same regardless of how deep into the list it is.
+
+    The ordering is taken from the view's `cursor_ordering` attribute if set, otherwise from the explicit
+    ordering of the queryset, falling back to the primary key. The leading ordering field should be indexed
+    and unique, or nearly unique.
+    """
+    ordering = 'id'
+    page_size_query_param = 'page_size'
+    max_page_size = 10000
+
+    def get_page_size(self, request):
+        # The cursor paginator shipped with DRF ignores the page size query parameter, unlike its page number
+        # counterpart. Honor it so that clients can switch between the two without changing their page sizes.
+        try:
+            return pagination._positive_int(  # pylint: disable=protected-access
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'cursor_ordering', None) or queryset.query.order_by or self.ordering
+        if isinstance(ordering, six.string_types):
+            return (ordering,)
+        return tuple(ordering)
+
+
+class OptionalCursorPaginationMixin(object):
+    """
+    Switches a paginator to keyset pagination when the `cursor` query parameter is present in the request.
+
+    Clients opt in by passing an empty `cursor` to get the first page, and then follow the `next` and `previous`
+    links. Keyset pages neither count the results nor skip rows with an OFFSET, so walking through a large list
+    costs the same for every page. The page size settings of the paginator are preserved.
+    """
+    cursor_pagination_class = CursorPagination
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_pagination_class.cursor_query_param not in request.query_params:
+            return super(OptionalCursorPaginationMixin, self).paginate_queryset(queryset, request, view=view)
+
+        self.cursor_paginator = self.cursor_pagination_class()
+        self.cursor_paginator.page_size = self.page_size
+        self.cursor_paginator.page_size_query_param = self.page_size_query_param
+        self.cursor_paginator.max_page_size = self.max_page_size
+        return self.cursor_paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super(OptionalCursorPaginationMixin, self).get_paginated_response(data)
+
+
+class OptionalCursorPageNumberPagination(OptionalCursorPaginationMixin, PageNumberPagination):
+    pass
+
+
+class OptionalCursorDefaultPagination(OptionalCursorPaginationMixin, DefaultPagination):
+    pass
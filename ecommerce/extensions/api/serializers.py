@@ -2,14 +2,15 @@
 from __future__ import unicode_literals
 
 import logging
+from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
 
 import waffle
 from dateutil.parser import parse
 from django.contrib.auth import get_user_model
-from django.db import transaction
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 from oscar.core.loading import get_class, get_model
@@ -44,7 +45,6 @@ from ecommerce.invoice.models import Invoice
 logger = logging.getLogger(__name__)
 
 Basket = get_model('basket', 'Basket')
-BasketLine = get_model('basket', 'Line')
 Benefit = get_model('offer', 'Benefit')
 BillingAddress = get_model('order', 'BillingAddress')
 Catalog = get_model('catalogue', 'Catalog')
@@ -53,6 +53,7 @@ Line = get_model('order', 'Line')
 OfferAssignment = get_model('offer', 'OfferAssignment')
 Order = get_model('order', 'Order')
 Partner = get_model('partner', 'Partner')
+PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
 Product = get_model('catalogue', 'Product')
 ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
 ProductCategory = get_model('catalogue', 'ProductCategory')
@@ -159,9 +160,60 @@ class ProductPaymentInfoMixin(serializers.ModelSerializer):
         return None
 
     def _get_info(self, product):
+        purchase_info = getattr(self, '_purchase_info', {}).get(product.id)
+        if purchase_info is None:
+            purchase_info = self._get_strategy().fetch_for_product(product)
+        return purchase_info
+
+    def _get_strategy(self):
         return Selector().strategy(
             request=self.context.get('request')
-        ).fetch_for_product(product)
+        )
+
+    def fetch_purchase_info(self, products):
+        """
+        Compute the purchase info for all of the given products with a single strategy instance.
+
+        The results are cached on the serializer, so that the price and availability fields of each
+        product are served without re-running the strategy.
+        """
+        strategy = self._get_strategy()
+        self._purchase_info = {product.id: strategy.fetch_for_product(product) for product in products}
+
+
+class SparseFieldsSerializerMixin(object):
+    """
+    Serializer mixin which limits the serialized fields to those named in the optional `fields` argument.
+
+    Serializers using this mixin declare the related objects each field needs in `select_related_lookups`
+    and `prefetch_related_lookups`, so that views only load the data needed by the fields being returned.
+    """
+    select_related_lookups = {}
+    prefetch_related_lookups = {}
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super(SparseFieldsSerializerMixin, self).__init__(*args, **kwargs)
+
+        if fields:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    @classmethod
+    def eager_load(cls, queryset, fields=None):
+        """
+        Add the lookups needed to serialize the given fields, or all fields if none are given, to the queryset.
+        """
+        fields = [field for field in cls.Meta.fields if not fields or field in fields]
+        select_related = [lookup for field in fields for lookup in cls.select_related_lookups.get(field, ())]
+        prefetch_related = [lookup for field in fields for lookup in cls.prefetch_related_lookups.get(field, ())]
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        return queryset
 
 
 class BillingAddressSerializer(serializers.ModelSerializer):
@@ -224,6 +276,30 @@ class PartialStockRecordSerializerForUpdate(StockRecordSerializer):
         fields = ('price_currency', 'price_excl_tax',)
 
 
+class ProductListSerializer(serializers.ListSerializer):  # pylint: disable=abstract-method
+    """
+    List serializer for Products.
+
+    The related objects needed to serialize a product are loaded for the whole list at once, and the strategy
+    purchase info is computed once per product, so that serializing a page of products runs a fixed number of
+    queries regardless of its size.
+    """
+    prefetch_lookups = (
+        'product_class',
+        'parent__product_class',
+        'attribute_values__attribute',
+        'stockrecords',
+    )
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        products = list(iterable)
+        prefetch_related_objects(products, *self.prefetch_lookups)
+        self.child.fetch_purchase_info(products)
+
+        return [self.child.to_representation(product) for product in products]
+
+
 class ProductSerializer(ProductPaymentInfoMixin, serializers.HyperlinkedModelSerializer):
     """ Serializer for Products. """
     attribute_values = serializers.SerializerMethodField()
@@ -255,6 +331,7 @@ class ProductSerializer(ProductPaymentInfoMixin, serializers.HyperlinkedModelSer
         extra_kwargs = {
             'url': {'view_name': PRODUCT_DETAIL_VIEW},
         }
+        list_serializer_class = ProductListSerializer
 
 
 class LineSerializer(serializers.ModelSerializer):
@@ -266,7 +343,7 @@ class LineSerializer(serializers.ModelSerializer):
         fields = ('title', 'quantity', 'description', 'status', 'line_price_excl_tax', 'unit_price_excl_tax', 'product')
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for parsing order data."""
     billing_address = BillingAddressSerializer(allow_null=True)
     date_placed = serializers.DateTimeField(format=ISO_8601_FORMAT)
@@ -276,6 +353,19 @@ class OrderSerializer(serializers.ModelSerializer):
     user = UserSerializer()
     vouchers = serializers.SerializerMethodField()
 
+    select_related_lookups = {
+        'billing_address': ('billing_address',),
+        'user': ('user',),
+    }
+    prefetch_related_lookups = {
+        'discount': ('discounts',),
+        'lines': ['lines__attributes'] + [
+            'lines__product__' + lookup for lookup in ProductListSerializer.prefetch_lookups
+        ],
+        'payment_processor': ('sources__source_type',),
+        'vouchers': ('basket__vouchers__offers',),
+    }
+
     def get_vouchers(self, obj):
         try:
             serializer = VoucherSerializer(
@@ -315,7 +405,7 @@ class OrderSerializer(serializers.ModelSerializer):
         )
 
 
-class BasketSerializer(serializers.ModelSerializer):
+class BasketSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for parsing basket data."""
     owner = UserSerializer()
     products = serializers.SerializerMethodField()
@@ -323,6 +413,16 @@ class BasketSerializer(serializers.ModelSerializer):
     payment_status = serializers.SerializerMethodField()
     payment_processor = serializers.SerializerMethodField()
 
+    select_related_lookups = {
+        'owner': ('owner',),
+    }
+    prefetch_related_lookups = {
+        'payment_processor': ('paymentprocessorresponse_set',),
+        'payment_status': ('paymentprocessorresponse_set',),
+        'products': ('lines__product__attribute_values__attribute',),
+        'vouchers': ('vouchers__offers',),
+    }
+
     def get_vouchers(self, obj):
         try:
             serializer = VoucherSerializer(
@@ -333,34 +433,29 @@ class BasketSerializer(serializers.ModelSerializer):
             return None
 
     def get_payment_status(self, obj):
-        successful_payment_notifications = obj.paymentprocessorresponse_set.filter(
-            Q(response__contains='ACCEPT') | Q(response__contains='approved')
-        )
-        if successful_payment_notifications:
-            return "Accepted"
+        response_field = PaymentProcessorResponse._meta.get_field('response')  # pylint: disable=protected-access
+        for payment_notification in obj.paymentprocessorresponse_set.all():
+            response = response_field.value_to_string(payment_notification)
+            if 'ACCEPT' in response or 'approved' in response:
+                return "Accepted"
         return "Declined"
 
     def get_payment_processor(self, obj):
-        payment_notifications = obj.paymentprocessorresponse_set.filter(transaction_id__isnull=False)
-        if payment_notifications:
-            return payment_notifications[0].processor_name
+        for payment_notification in obj.paymentprocessorresponse_set.all():
+            if payment_notification.transaction_id is not None:
+                return payment_notification.processor_name
         return "None"
 
     def get_products(self, obj):
-        lines = BasketLine.objects.filter(basket=obj)
-        products = [line.product for line in lines]
-        serialized_data = []
-        for product in products:
-
-            serialized_data.append(ProductAttributeValueSerializer(
-                product.attr,
+        return [
+            ProductAttributeValueSerializer(
+                line.product.attr,
                 many=True,
                 read_only=True,
                 context={'request': self.context['request']}
-            ).data)
-        # return serializer.data
-        # serializer = ProductSerializer(products, many=True, context={'request': self.context['request']})
-        return serialized_data
+            ).data
+            for line in obj.lines.all()
+        ]
 
     class Meta(object):
         model = Basket
@@ -1267,6 +1362,13 @@ class CouponCodeAssignmentSerializer(serializers.Serializer):  # pylint: disable
 
 
 class CouponCodeRevokeRemindBulkSerializer(serializers.ListSerializer):  # pylint: disable=abstract-method
+    """
+    Validates and processes a list of (code, email) pairs in bulk.
+
+    The coupon's codes and the offer assignments for every pair are resolved with a single query each, instead
+    of once per pair, and the child serializer processes all valid pairs together in `create`. Items that fail
+    validation are reported individually without affecting the rest of the list.
+    """
 
     def to_internal_value(self, data):
         """
@@ -1283,38 +1385,53 @@ class CouponCodeRevokeRemindBulkSerializer(serializers.ListSerializer):  # pylin
             })
 
         ret = []
+        valid_items = []
 
         for item in data:
             try:
-                validated = self.child.run_validation(item)
+                validated = self.child.to_internal_value(item)
             except serializers.ValidationError as exc:
-                ret.append(
-                    {
-                        'non_field_errors': [{
-                            'code': item.get('code'),
-                            'email': item.get('email'),
-                            'detail': 'failure',
-                            'message': exc.detail['non_field_errors'][0]
-                        }]
-                    }
-                )
+                ret.append(self._failure(item, exc))
             else:
+                valid_items.append((len(ret), validated))
                 ret.append(validated)
 
+        lookup = self.child.get_bulk_validation_lookup([attrs for __, attrs in valid_items])
+        for index, attrs in valid_items:
+            try:
+                ret[index] = self.child.validate_with_lookup(attrs, lookup)
+            except serializers.ValidationError as exc:
+                ret[index] = self._failure(attrs, exc)
+
         return ret
 
-    def create(self, validated_data):
+    def _failure(self, item, exc):
         """
-        This selectively calls the child create method based on whether or not validation failed for each payload.
+        Build the failure payload reported for a single item that did not pass validation.
         """
-        ret = []
-        for attrs in validated_data:
-            if 'non_field_errors' not in attrs and not any(isinstance(attrs[field], list) for field in attrs):
-                ret.append(self.child.create(attrs))
-            else:
-                ret.append(attrs)
+        detail = exc.detail
+        if isinstance(detail, dict):
+            detail = detail.get(api_settings.NON_FIELD_ERRORS_KEY) or next(iter(detail.values()), [''])
+        message = detail[0] if isinstance(detail, list) else detail
+        if not isinstance(item, dict):
+            item = {}
 
-        return ret
+        return {
+            'non_field_errors': [{
+                'code': item.get('code'),
+                'email': item.get('email'),
+                'detail': 'failure',
+                'message': message
+            }]
+        }
+
+    def create(self, validated_data):
+        """
+        This calls the child bulk processing method for all payloads that passed validation.
+        """
+        valid_items = [attrs for attrs in validated_data if 'non_field_errors' not in attrs]
+        processed = iter(self.child.process_bulk(valid_items))
+        return [attrs if 'non_field_errors' in attrs else next(processed) for attrs in validated_data]
 
     def to_representation(self, data):
         """
@@ -1333,29 +1450,66 @@ class CouponCodeRevokeRemindBulkSerializer(serializers.ListSerializer):  # pylin
 
 
 class CouponCodeMixin(object):
+    """
+    Shared validation for serializers acting on existing offer assignments of a coupon.
+
+    Serializers using this mixin implement `validate_with_lookup` and `process_bulk`, which operate on the data
+    returned by `get_bulk_validation_lookup` so that a whole list of (code, email) pairs costs a fixed number of
+    queries.
+    """
+    offer_assignment_statuses = (OFFER_ASSIGNED, OFFER_ASSIGNMENT_EMAIL_PENDING)
 
-    def validate_coupon_has_code(self, coupon, code):
+    def get_bulk_validation_lookup(self, items):
         """
-        Validate that the code is associated with the coupon
-        :param coupon: (Product): Coupon product associated with vouchers
-        :param code: (str): Code associated with the voucher
-        :raises rest_framework.exceptions.ValidationError in case code is not associated with the coupon
+        Resolve the coupon codes and offer assignments for all of the given (code, email) pairs.
+        :param items: (list): Validated field data, each with a code and an email
+        :return: dict containing the set of requested codes that belong to the coupon and
+            a mapping of (code, email) to the offer assignments with one of `offer_assignment_statuses`
         """
-        if not coupon.attr.coupon_vouchers.vouchers.filter(code=code).exists():
-            raise serializers.ValidationError('Code {} is not associated with this Coupon'.format(code))
+        lookup = {'coupon_codes': set(), 'offer_assignments': defaultdict(list)}
+        if not items:
+            return lookup
 
-    def get_unredeemed_offer_assignments(self, code, email):
+        coupon = self.context.get('coupon')
+        codes = {item['code'] for item in items}
+        emails = {item['email'] for item in items}
+
+        lookup['coupon_codes'] = set(
+            coupon.attr.coupon_vouchers.vouchers.filter(code__in=codes).values_list('code', flat=True)
+        )
+        offer_assignments = OfferAssignment.objects.filter(
+            code__in=lookup['coupon_codes'],
+            user_email__in=emails,
+            status__in=self.offer_assignment_statuses
+        ).order_by('id')
+        for offer_assignment in offer_assignments:
+            lookup['offer_assignments'][(offer_assignment.code, offer_assignment.user_email)].append(offer_assignment)
+
+        return lookup
+
+    def get_assignments_from_lookup(self, data, lookup):
         """
-        Returns offer assignments associated with the code and email
-        :param code: (str): Code associated with the voucher
-        :param email: (str): Learner email
-        :return: QuerySet containing offer assignments associated with the code and email
+        Validate a single (code, email) pair against the bulk lookup and return its offer assignments.
+        :raises rest_framework.exceptions.ValidationError if the code is not part of the coupon
+            or the pair has no unredeemed offer assignments
         """
-        return OfferAssignment.objects.filter(
-            code=code,
-            user_email=email,
-            status__in=[OFFER_ASSIGNED, OFFER_ASSIGNMENT_EMAIL_PENDING]
-        )
+        code = data.get('code')
+        email = data.get('email')
+        if code not in lookup['coupon_codes']:
+            raise serializers.ValidationError('Code {} is not associated with this Coupon'.format(code))
+
+        offer_assignments = lookup['offer_assignments'].get((code, email), [])
+        unredeemed = [assignment for assignment in offer_assignments if assignment.status != OFFER_REDEEMED]
+        if not unredeemed:
+            raise serializers.ValidationError('No assignments exist for user {} and code {}'.format(email, code))
+
+        return unredeemed, len(offer_assignments) - len(unredeemed)
+
+    def validate(self, data):
+        return self.validate_with_lookup(data, self.get_bulk_validation_lookup([data]))
+
+    def create(self, validated_data):
+        return self.process_bulk([validated_data])[0]
 
 
 class CouponCodeRevokeSerializer(CouponCodeMixin, serializers.Serializer):  # pylint: disable=abstract-method
@@ -1367,50 +1521,57 @@ class CouponCodeRevokeSerializer(CouponCodeMixin, serializers.Serializer):  # py
     email = serializers.EmailField(required=True)
     detail = serializers.CharField(read_only=True)
 
-    def create(self, validated_data):
+    def process_bulk(self, items):
         """
-        Update OfferAssignments to have Revoked status.
+        Update the OfferAssignments of all items to have Revoked status with a single query,
+        then send the revoke emails.
         """
-        offer_assignments = validated_data.get('offer_assignments')
-        email = validated_data.get('email')
-        code = validated_data.get('code')
         template = self.context.get('template')
-        detail = 'success'
+        offer_assignment_ids = [
+            offer_assignment.id for item in items for offer_assignment in item.get('offer_assignments')
+        ]
 
         try:
-            for offer_assignment in offer_assignments:
-                offer_assignment.status = OFFER_ASSIGNMENT_REVOKED
-                offer_assignment.save()
-
-            if template:
-                send_revoked_offer_email(
-                    template=template,
-                    learner_email=email,
-                    code=code
-                )
+            OfferAssignment.objects.filter(id__in=offer_assignment_ids).update(
+                status=OFFER_ASSIGNMENT_REVOKED,
+                modified=timezone.now()
+            )
         except Exception as exc:  # pylint: disable=broad-except
-            logger.exception('Encountered error when revoking code %s for user %s', code, email)
-            detail = unicode(exc)
+            logger.exception('Encountered error when revoking %d offer assignments', len(offer_assignment_ids))
+            for item in items:
+                item['detail'] = unicode(exc)
+            return items
 
-        validated_data['detail'] = detail
-        return validated_data
+        for item in items:
+            email = item.get('email')
+            code = item.get('code')
+            detail = 'success'
 
-    def validate(self, data):
+            try:
+                if template:
+                    send_revoked_offer_email(
+                        template=template,
+                        learner_email=email,
+                        code=code
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception('Encountered error when revoking code %s for user %s', code, email)
+                detail = unicode(exc)
+
+            item['detail'] = detail
+
+        return items
+
+    def validate_with_lookup(self, data, lookup):
         """
         Validate that the code is part of the Coupon and the provided code and email have an active OfferAssignment.
         """
-        code = data.get('code')
-        email = data.get('email')
-        coupon = self.context.get('coupon')
-        self.validate_coupon_has_code(coupon, code)
-        offer_assignments = self.get_unredeemed_offer_assignments(code, email)
-        if not offer_assignments.exists():
-            raise serializers.ValidationError('No assignments exist for user {} and code {}'.format(email, code))
-        data['offer_assignments'] = offer_assignments
+        data['offer_assignments'], __ = self.get_assignments_from_lookup(data, lookup)
         return data
 
 
 class CouponCodeRemindSerializer(CouponCodeMixin, serializers.Serializer):  # pylint: disable=abstract-method
+    offer_assignment_statuses = (OFFER_ASSIGNED, OFFER_ASSIGNMENT_EMAIL_PENDING, OFFER_REDEEMED)
 
     class Meta:  # pylint: disable=old-style-class
         list_serializer_class = CouponCodeRevokeRemindBulkSerializer
@@ -1419,51 +1580,40 @@ class CouponCodeRemindSerializer(CouponCodeMixin, serializers.Serializer):  # py
     email = serializers.EmailField(required=True)
     detail = serializers.CharField(read_only=True)
 
-    def create(self, validated_data):
+    def process_bulk(self, items):
         """
         Send remind email(s) for pending OfferAssignments.
         """
-        offer_assignments = validated_data.get('offer_assignments')
-        email = validated_data.get('email')
-        code = validated_data.get('code')
-        redeemed_offer_count = validated_data.get('redeemed_offer_count')
-        total_offer_count = validated_data.get('total_offer_count')
         template = self.context.get('template')
-        detail = 'success'
 
-        try:
-            self._trigger_email_sending_task(
-                template,
-                offer_assignments.first(),
-                redeemed_offer_count,
-                total_offer_count
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.exception('Encountered error during reminder email for code %s of user %s', code, email)
-            detail = unicode(exc)
+        for item in items:
+            email = item.get('email')
+            code = item.get('code')
+            detail = 'success'
 
-        validated_data['detail'] = detail
-        return validated_data
+            try:
+                self._trigger_email_sending_task(
+                    template,
+                    item.get('offer_assignments')[0],
+                    item.get('redeemed_offer_count'),
+                    item.get('total_offer_count')
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception('Encountered error during reminder email for code %s of user %s', code, email)
+                detail = unicode(exc)
 
-    def validate(self, data):
+            item['detail'] = detail
+
+        return items
+
+    def validate_with_lookup(self, data, lookup):
         """
         Validate that the code is part of the Coupon the code and email provided have an active OfferAssignment.
         """
-        code = data.get('code')
-        email = data.get('email')
-        coupon = self.context.get('coupon')
-        self.validate_coupon_has_code(coupon, code)
-        offer_assignments = self.get_unredeemed_offer_assignments(code, email)
-        offer_assignments_redeemed = OfferAssignment.objects.filter(
-            code=code,
-            user_email=email,
-            status=OFFER_REDEEMED
-        )
-        if not offer_assignments.exists():
-            raise serializers.ValidationError('No assignments exist for user {} and code {}'.format(email, code))
+        offer_assignments, redeemed_offer_count = self.get_assignments_from_lookup(data, lookup)
         data['offer_assignments'] = offer_assignments
-        data['redeemed_offer_count'] = offer_assignments_redeemed.count()
-        data['total_offer_count'] = offer_assignments.count()
+        data['redeemed_offer_count'] = redeemed_offer_count
+        data['total_offer_count'] = len(offer_assignments)
         return data
 
     def _trigger_email_sending_task(self, template, assigned_offer, redeemed_offer_count, total_offer_count):
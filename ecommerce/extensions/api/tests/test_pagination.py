@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from ecommerce.extensions.api.pagination import CursorPagination, OptionalCursorPageNumberPagination
+from ecommerce.tests.testcases import TestCase
+
+User = get_user_model()
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        super(CursorPaginationTests, self).setUp()
+        self.paginator = CursorPagination()
+
+    def test_get_ordering(self):
+        """ The ordering should come from the view, then the queryset, and finally default to the primary key. """
+        queryset = User.objects.all()
+
+        view = type(str('View'), (object,), {'cursor_ordering': '-id'})()
+        self.assertEqual(self.paginator.get_ordering(None, queryset, view), ('-id',))
+        self.assertEqual(self.paginator.get_ordering(None, queryset.order_by('username'), None), ('username',))
+        self.assertEqual(self.paginator.get_ordering(None, queryset, None), ('id',))
+
+
+class OptionalCursorPageNumberPaginationTests(TestCase):
+    def setUp(self):
+        super(OptionalCursorPageNumberPaginationTests, self).setUp()
+        self.paginator = OptionalCursorPageNumberPagination()
+        self.users = [self.create_user() for __ in range(3)]
+
+    def paginate(self, path):
+        request = Request(APIRequestFactory().get(path))
+        queryset = User.objects.filter(id__in=[user.id for user in self.users])
+        page = self.paginator.paginate_queryset(queryset, request)
+        return page, self.paginator.get_paginated_response([user.id for user in page]).data
+
+    def test_page_number_pagination(self):
+        """ Without a cursor, the paginator should behave like a page number paginator. """
+        __, data = self.paginate('/?page=2&page_size=2')
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(data['results'], [self.users[2].id])
+
+    def test_cursor_pagination(self):
+        """ With a cursor, the paginator should page through the queryset without counting it. """
+        page, data = self.paginate('/?cursor=&page_size=2')
+        self.assertNotIn('count', data)
+        self.assertEqual(page, self.users[:2])
+        self.assertIsNotNone(data['next'])
+        self.assertIsNone(data['previous'])
+
+        self.paginator = OptionalCursorPageNumberPagination()
+        page, data = self.paginate(data['next'])
+        self.assertEqual(page, self.users[2:])
+        self.assertIsNone(data['next'])
@@ -9,6 +9,8 @@ import ddt
 import httpretty
 import mock
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.http import urlencode
 from django.utils.timezone import now
@@ -1487,6 +1489,38 @@ class EnterpriseCouponViewSetTest(CouponMixin, DiscoveryTestMixin, DiscoveryMock
         for offer_assignment in OfferAssignment.objects.filter(user_email=offer_assignment.user_email):
             assert offer_assignment.status == OFFER_ASSIGNMENT_REVOKED
 
+    @ddt.data('revoke', 'remind')
+    def test_coupon_codes_revoke_remind_bulk_query_count(self, action):
+        """Test that bulk revoke and remind requests run a fixed number of queries regardless of the list size."""
+        Switch.objects.update_or_create(name=ENTERPRISE_OFFERS_FOR_COUPONS_SWITCH, defaults={'active': True})
+
+        emails = ['test{}@example.com'.format(i) for i in range(4)]
+        coupon_post_data = dict(self.data, voucher_type=Voucher.SINGLE_USE, quantity=4)
+        coupon = self.get_response('POST', ENTERPRISE_COUPONS_LINK, coupon_post_data)
+        coupon_id = coupon.json()['coupon_id']
+        with mock.patch('ecommerce.extensions.offer.utils.send_offer_assignment_email.delay'):
+            self.get_response(
+                'POST',
+                '/api/v2/enterprise/coupons/{}/assign/'.format(coupon_id),
+                {'template': 'Test template', 'emails': emails}
+            )
+
+        assignments = [
+            {'email': offer_assignment.user_email, 'code': offer_assignment.code}
+            for offer_assignment in OfferAssignment.objects.filter(user_email__in=emails).order_by('id')
+        ]
+        path = '/api/v2/enterprise/coupons/{}/{}/'.format(coupon_id, action)
+        num_queries = []
+        with mock.patch('ecommerce.extensions.offer.utils.send_offer_update_email.delay') as mock_send_email:
+            for batch in (assignments[:1], assignments[1:]):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.get_response('POST', path, {'template': 'Test template', 'assignments': batch})
+                num_queries.append(len(queries))
+                assert [item['detail'] for item in response.json()] == ['success'] * len(batch)
+
+        assert mock_send_email.call_count == len(assignments)
+        assert num_queries[0] == num_queries[1]
+
     @ddt.data(
         (Voucher.SINGLE_USE, 2, None),
         (Voucher.MULTI_USE_PER_CUSTOMER, 2, 3),
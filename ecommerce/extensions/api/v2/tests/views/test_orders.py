@@ -4,7 +4,9 @@ import ddt
 import httpretty
 import mock
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from oscar.core.loading import get_class, get_model
 
@@ -18,6 +20,7 @@ from ecommerce.tests.factories import SiteConfigurationFactory
 from ecommerce.tests.mixins import ThrottlingMixin
 from ecommerce.tests.testcases import TestCase
 
+FulfillmentOutboxEntry = get_model('order', 'FulfillmentOutboxEntry')
 Order = get_model('order', 'Order')
 ShippingEventType = get_model('order', 'ShippingEventType')
 post_checkout = get_class('checkout.signals', 'post_checkout')
@@ -85,6 +88,53 @@ class OrderListViewTests(AccessTokenMixin, ThrottlingMixin, TestCase):
         self.assertEqual(content['results'][0]['number'], unicode(order_2.number))
         self.assertEqual(content['results'][1]['number'], unicode(order.number))
 
+    def test_list_query_count(self):
+        """ The number of queries needed to list orders should not depend on the number of orders. """
+        create_order(site=self.site, user=self.user)
+
+        def get_num_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.path, HTTP_AUTHORIZATION=self.token)
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        # Warm up the site configuration and waffle caches, which are populated by the first request.
+        get_num_queries()
+        num_queries = get_num_queries()
+        for __ in range(3):
+            create_order(site=self.site, user=self.user)
+
+        self.assertEqual(get_num_queries(), num_queries)
+
+    def test_sparse_fields(self):
+        """ The view should only return the fields requested with the fields query parameter. """
+        order = create_order(site=self.site, user=self.user)
+        response = self.client.get(
+            '{path}?fields=number,status,total_excl_tax'.format(path=self.path), HTTP_AUTHORIZATION=self.token
+        )
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content)
+        self.assertEqual(
+            content['results'],
+            [{'number': order.number, 'status': order.status, 'total_excl_tax': str(order.total_excl_tax)}]
+        )
+
+    def test_cursor_pagination(self):
+        """ The view should page through the orders with a cursor when the cursor query parameter is present. """
+        orders = [create_order(site=self.site, user=self.user) for __ in range(3)]
+        url = '{path}?cursor=&page_size=2'.format(path=self.path)
+
+        numbers = []
+        while url:
+            response = self.client.get(url, HTTP_AUTHORIZATION=self.token)
+            self.assertEqual(response.status_code, 200)
+            content = json.loads(response.content)
+            self.assertNotIn('count', content)
+            numbers += [result['number'] for result in content['results']]
+            url = content['next']
+
+        self.assertEqual(numbers, [order.number for order in reversed(orders)])
+
     def test_with_other_users_orders(self):
         """ The view should only return orders for the authenticated users. """
         other_user = self.create_user()
@@ -281,6 +331,34 @@ class OrderFulfillViewTests(TestCase):
         self.order.save()
         self.assertEqual(406, self._put_to_view().status_code)
 
+    def test_fulfillment_acknowledged(self):
+        """ The fulfillment outbox entry of the order, if any, should be acknowledged once the order is fulfilled. """
+        entry = FulfillmentOutboxEntry.objects.create(order=self.order, site_code=self.partner.short_code)
+        self._assert_fulfillment_success()
+
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.acknowledged)
+
+    def test_fulfillment_acknowledged_if_complete(self):
+        """ The fulfillment outbox entry should be acknowledged if the order was already fulfilled. """
+        entry = FulfillmentOutboxEntry.objects.create(order=self.order, site_code=self.partner.short_code)
+        self.order.status = ORDER.COMPLETE
+        self.order.save()
+
+        self.assertEqual(406, self._put_to_view().status_code)
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.acknowledged)
+
+    def test_fulfillment_not_acknowledged(self):
+        """ The fulfillment outbox entry should not be acknowledged if the fulfillment of the order fails. """
+        entry = FulfillmentOutboxEntry.objects.create(order=self.order, site_code=self.partner.short_code)
+        self.order.status = ORDER.FULFILLMENT_ERROR
+        self.order.save()
+
+        self.assertEqual(500, self._put_to_view().status_code)
+        entry.refresh_from_db()
+        self.assertIsNone(entry.acknowledged)
+
     @ddt.data(ORDER.OPEN, ORDER.FULFILLMENT_ERROR)
     def test_ideal_conditions(self, order_status):
         """
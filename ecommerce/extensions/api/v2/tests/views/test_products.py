@@ -6,7 +6,9 @@ import uuid
 
 import ddt
 import pytz
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from oscar.core.loading import get_model
 
@@ -104,6 +106,25 @@ class ProductViewSetTests(ProductViewSetBase):
         expected = {'count': 2, 'next': None, 'previous': None, 'results': results}
         self.assertDictEqual(json.loads(response.content), expected)
 
+    def test_list_query_count(self):
+        """ Verify the number of queries needed to list products does not depend on the number of products. """
+        path = reverse('api:v2:course-product-list', kwargs={'parent_lookup_course_id': self.course.id})
+
+        def get_num_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        # Warm up the site configuration and waffle caches, which are populated by the first request.
+        get_num_queries()
+        num_queries = get_num_queries()
+        self.course.create_or_update_seat('verified', True, 10)
+        self.course.create_or_update_seat('professional', True, 100)
+        self.course.create_or_update_seat('credit', True, 200, credit_provider='ASU', credit_hours=9)
+
+        self.assertEqual(get_num_queries(), num_queries)
+
     def test_get_partner_products(self):
         """Verify the endpoint returns the list of products associated with a
         partner.
@@ -23,15 +23,16 @@ class SDNCheckViewSetTests(TestCase):
         self.site.siteconfiguration.enable_sdn_check = True
         self.site.siteconfiguration.save()
 
-    def make_request(self):
+    def make_request(self, **data):
         """Make a POST request to the endpoint."""
+        data.update({
+            'name': 'Tester',
+            'city': 'Testlandia',
+            'country': 'TE'
+        })
         return self.client.post(
             self.PATH,
-            data=json.dumps({
-                'name': 'Tester',
-                'city': 'Testlandia',
-                'country': 'TE'
-            }),
+            data=json.dumps(data),
             content_type=JSON_CONTENT_TYPE
         )
 
@@ -64,3 +65,16 @@ class SDNCheckViewSetTests(TestCase):
             sdn_validator_mock.side_effect = side_effect
             response = self.make_request()
             self.assertEqual(json.loads(response.content)['hits'], 0)
+
+    @ddt.data(True, False)
+    def test_prescreen(self, enable_sdn_check):
+        """Verify pre-screening starts the SDN check in the background, without deactivating the user."""
+        self.site.siteconfiguration.enable_sdn_check = enable_sdn_check
+        self.site.siteconfiguration.save()
+
+        with mock.patch.object(SDNClient, 'prescreen') as prescreen_mock:
+            with mock.patch.object(SDNClient, 'search') as sdn_validator_mock:
+                response = self.make_request(prescreen=True)
+                self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+                self.assertEqual(prescreen_mock.called, enable_sdn_check)
+                self.assertFalse(sdn_validator_mock.called)
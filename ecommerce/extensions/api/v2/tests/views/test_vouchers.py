@@ -255,6 +255,72 @@ class VoucherViewSetTests(DiscoveryMockMixin, DiscoveryTestMixin, LmsApiMockMixi
         self.assertNotIn(expired_seat, products)
         self.assertNotIn(future_enrollment_seat, products)
 
+    def test_retrieve_course_objects_for_multiple_seat_types(self):
+        """ Verify the products of all seat types are retrieved at once, grouped in the order of the seat types. """
+        course = CourseFactory(partner=self.partner)
+        verified_seat = course.create_or_update_seat('verified', True, 100)
+        professional_seat = CourseFactory(partner=self.partner).create_or_update_seat('professional', False, 100)
+        course_discovery_results = [{'key': verified_seat.course_id}, {'key': professional_seat.course_id}]
+
+        with self.assertNumQueries(1):
+            products, __, __ = VoucherViewSet().retrieve_course_objects(
+                course_discovery_results, 'professional,verified'
+            )
+            self.assertEqual(
+                [product.seat_attributes.certificate_type for product in products], ['professional', 'verified']
+            )
+        self.assertEqual(products, [professional_seat, verified_seat])
+
+    @httpretty.activate
+    def test_offers_are_cached(self):
+        """ Verify the offers are cached, until the prices behind the voucher change. """
+        self.mock_access_token_response()
+        products, __, voucher = self.prepare_get_offers_response(quantity=2)
+        url = self.build_offers_url(voucher)
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 2)
+
+        with mock.patch.object(VoucherViewSet, 'get_offers') as mock_get_offers:
+            self.assertEqual(self.client.get(url).data, response.data)
+            self.assertFalse(mock_get_offers.called)
+
+        # Seats unavailable to learners are available to staff, so offers are cached separately for staff.
+        self.client.logout()
+        self.client.login(username=self.create_user().username, password=self.password)
+        with mock.patch.object(
+            VoucherViewSet, 'get_offers', autospec=True, side_effect=VoucherViewSet.get_offers
+        ) as mock_get_offers:
+            self.assertEqual(self.client.get(url).data, response.data)
+            self.assertTrue(mock_get_offers.called)
+
+        stock_record = products[0].stockrecords.first()
+        stock_record.price_excl_tax += 10
+        stock_record.save()
+        response = self.client.get(url)
+        self.assertIn(str(stock_record.price_excl_tax), [
+            result['stockrecords']['price_excl_tax'] for result in response.data['results']
+        ])
+
+    @ddt.data(
+        ('http://discovery.example.com/api/v1/course_runs/?limit=20&offset=40', '40'),
+        ('http://discovery.example.com/api/v1/course_runs/?limit=20', None),
+        (None, None),
+    )
+    @ddt.unpack
+    def test_prefetch_next_catalog_page(self, next_page, expected_offset):
+        """ Verify the next catalog page, if any, is fetched in the background. """
+        fetch = mock.Mock()
+        result = VoucherViewSet().prefetch_next_catalog_page(
+            {'next': next_page}, 'offset', fetch, site=self.site, query='*:*', limit='20'
+        )
+
+        if expected_offset:
+            result.wait()
+            fetch.assert_called_once_with(site=self.site, query='*:*', limit='20', offset=expected_offset)
+        else:
+            self.assertIsNone(result)
+            self.assertFalse(fetch.called)
+
 
 @ddt.ddt
 @httpretty.activate
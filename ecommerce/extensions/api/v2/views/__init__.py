@@ -3,3 +3,26 @@ from rest_framework import viewsets, mixins
 
 class NonDestroyableModelViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets.ReadOnlyModelViewSet):
     pass
+
+
+class SparseFieldsViewMixin(object):
+    """
+    View mixin which limits the serialized fields to those named in the comma-separated `fields` query parameter.
+
+    The serializer class must use `SparseFieldsSerializerMixin`. Only the related objects needed by the
+    requested fields are loaded.
+    """
+
+    def get_requested_fields(self):
+        fields = self.request.query_params.get('fields')
+        if fields:
+            return [field.strip() for field in fields.split(',') if field.strip()]
+        return None
+
+    def get_queryset(self):
+        queryset = super(SparseFieldsViewMixin, self).get_queryset()
+        return self.get_serializer_class().eager_load(queryset, self.get_requested_fields())
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super(SparseFieldsViewMixin, self).get_serializer(*args, **kwargs)
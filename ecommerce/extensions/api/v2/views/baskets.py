@@ -26,6 +26,7 @@ from ecommerce.extensions.api import exceptions as api_exceptions
 from ecommerce.extensions.api.permissions import IsStaffOrOwner
 from ecommerce.extensions.api.serializers import BasketSerializer, OrderSerializer
 from ecommerce.extensions.api.throttles import ServiceUserThrottle
+from ecommerce.extensions.api.v2.views import SparseFieldsViewMixin
 from ecommerce.extensions.basket.constants import TEMPORARY_BASKET_CACHE_KEY
 from ecommerce.extensions.basket.utils import attribute_cookie_data
 from ecommerce.extensions.checkout.mixins import EdxOrderPlacementMixin
@@ -335,9 +336,10 @@ class OrderByBasketRetrieveView(generics.RetrieveAPIView):
         return queryset
 
 
-class BasketViewSet(viewsets.ReadOnlyModelViewSet):
+class BasketViewSet(SparseFieldsViewMixin, viewsets.ReadOnlyModelViewSet):
     """ View Set for Baskets"""
     permission_classes = (IsAuthenticated, IsStaffOrOwner, DjangoModelPermissions,)
+    queryset = Basket.objects.all()
     serializer_class = BasketSerializer
     throttle_classes = (ServiceUserThrottle,)
 
@@ -347,7 +349,7 @@ class BasketViewSet(viewsets.ReadOnlyModelViewSet):
         if not user.is_staff:
             raise PermissionDenied
 
-        return Basket.objects.filter(site=self.request.site)
+        return super(BasketViewSet, self).get_queryset().filter(site=self.request.site)
 
 
 class BasketDestroyView(generics.DestroyAPIView):
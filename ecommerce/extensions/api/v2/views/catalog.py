@@ -77,8 +77,7 @@ class CatalogViewSet(NestedViewSetMixin, ReadOnlyModelViewSet):
             seats = serializers.ProductSerializer(
                 Product.objects.filter(
                     course_id__in=course_ids,
-                    attributes__name='certificate_type',
-                    attribute_values__value_text__in=seat_types
+                    seat_attributes__certificate_type__in=seat_types
                 ),
                 many=True,
                 context={'request': request}
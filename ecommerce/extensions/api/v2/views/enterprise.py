@@ -5,7 +5,6 @@ import logging
 import waffle
 from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
-from edx_rest_framework_extensions.paginators import DefaultPagination
 from oscar.core.loading import get_model
 from rest_framework import generics, serializers, status
 from rest_framework.decorators import detail_route, list_route
@@ -13,9 +12,11 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
 from ecommerce.core.constants import COUPON_PRODUCT_CLASS_NAME
+from ecommerce.core.read_replica import use_read_replica
 from ecommerce.core.utils import log_message_and_raise_validation_error
 from ecommerce.enterprise.constants import ENTERPRISE_OFFERS_FOR_COUPONS_SWITCH
 from ecommerce.enterprise.utils import get_enterprise_customers
+from ecommerce.extensions.api.pagination import OptionalCursorDefaultPagination
 from ecommerce.extensions.api.serializers import (
     CouponCodeAssignmentSerializer,
     CouponCodeRemindSerializer,
@@ -72,7 +73,7 @@ class EnterpriseCustomerViewSet(generics.GenericAPIView):
 
 class EnterpriseCouponViewSet(CouponViewSet):
     """ Coupon resource. """
-    pagination_class = DefaultPagination
+    pagination_class = OptionalCursorDefaultPagination
 
     def get_queryset(self):
         enterprise_id = self.kwargs.get('enterprise_id')
@@ -209,6 +210,7 @@ class EnterpriseCouponViewSet(CouponViewSet):
             super(EnterpriseCouponViewSet, self).update_range_data(request_data, vouchers)
 
     @detail_route(url_path='codes')
+    @use_read_replica
     def codes(self, request, pk, format=None):  # pylint: disable=unused-argument, redefined-builtin
         """
         GET codes belong to a `coupon`.
@@ -350,6 +352,7 @@ class EnterpriseCouponViewSet(CouponViewSet):
         ).values('voucher__code', 'user__email').distinct().order_by('user__email')
 
     @list_route(url_path=r'(?P<enterprise_id>.+)/overview')
+    @use_read_replica
     def overview(self, request, enterprise_id):     # pylint: disable=unused-argument
         """
         Overview of Enterprise coupons.
@@ -8,10 +8,15 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import DjangoModelPermissions, IsAuthenticated
 from rest_framework.response import Response
 
+from ecommerce.core.read_replica import ReadReplicaMixin
 from ecommerce.extensions.api import serializers
 from ecommerce.extensions.api.filters import OrderFilter
+from ecommerce.extensions.api.pagination import OptionalCursorPageNumberPagination
 from ecommerce.extensions.api.permissions import IsStaffOrOwner
 from ecommerce.extensions.api.throttles import ServiceUserThrottle
+from ecommerce.extensions.api.v2.views import SparseFieldsViewMixin
+from ecommerce.extensions.fulfillment.status import ORDER
+from ecommerce.extensions.order.outbox import acknowledge_fulfillment
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +24,13 @@ Order = get_model('order', 'Order')
 post_checkout = get_class('checkout.signals', 'post_checkout')
 
 
-class OrderViewSet(viewsets.ReadOnlyModelViewSet):
+class OrderViewSet(ReadReplicaMixin, SparseFieldsViewMixin, viewsets.ReadOnlyModelViewSet):
     lookup_field = 'number'
     permission_classes = (IsAuthenticated, IsStaffOrOwner, DjangoModelPermissions,)
     queryset = Order.objects.all()
     serializer_class = serializers.OrderSerializer
+    pagination_class = OptionalCursorPageNumberPagination
+    cursor_ordering = '-id'
     throttle_classes = (ServiceUserThrottle,)
     filter_backends = (filters.DjangoFilterBackend,)
     filter_class = OrderFilter
@@ -49,6 +56,9 @@ class OrderViewSet(viewsets.ReadOnlyModelViewSet):
         order = self.get_object()
 
         if not order.is_fulfillable:
+            if order.status == ORDER.COMPLETE:
+                # The order was fulfilled by an earlier request, which may have failed before acknowledging it.
+                acknowledge_fulfillment(order)
             return Response(status=status.HTTP_406_NOT_ACCEPTABLE)
 
         # Get email_opt_in from the query parameters if it exists, defaulting to false
@@ -61,5 +71,6 @@ class OrderViewSet(viewsets.ReadOnlyModelViewSet):
             logger.warning('Fulfillment of order [%s] failed!', order.number)
             return Response(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+        acknowledge_fulfillment(order)
         serializer = self.get_serializer(order)
         return Response(serializer.data)
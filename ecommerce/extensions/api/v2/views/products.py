@@ -13,6 +13,7 @@ from ecommerce.core.constants import COURSE_ENTITLEMENT_PRODUCT_CLASS_NAME
 from ecommerce.entitlements.utils import create_or_update_course_entitlement
 from ecommerce.extensions.api import serializers
 from ecommerce.extensions.api.filters import ProductFilter
+from ecommerce.extensions.api.pagination import OptionalCursorPageNumberPagination
 from ecommerce.extensions.api.v2.views import NonDestroyableModelViewSet
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class ProductViewSet(NestedViewSetMixin, NonDestroyableModelViewSet):
     filter_backends = (filters.DjangoFilterBackend,)
     filter_class = ProductFilter
     permission_classes = (IsAuthenticated, IsAdminUser,)
+    pagination_class = OptionalCursorPageNumberPagination
 
     def get_queryset(self):
         self.queryset = Product.objects.all()
@@ -2,6 +2,7 @@
 from django.contrib.auth import logout
 from oscar.core.loading import get_model
 from requests.exceptions import HTTPError, Timeout
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -20,10 +21,14 @@ class SDNCheckViewSet(APIView):
         POST handler for the view. User data is posted to this handler
         which performs an SDN check and returns whether the user passed
         or failed.
+
+        When `prescreen` is set, the check is performed in the background while the user is still
+        filling out the payment form, and its results are cached for the check on payment submission.
         """
         name = request.data['name']
         city = request.data['city']
         country = request.data['country']
+        prescreen = request.data.get('prescreen', False)
         hits = 0
 
         site_configuration = request.site.siteconfiguration
@@ -35,6 +40,10 @@ class SDNCheckViewSet(APIView):
                 api_key=site_configuration.sdn_api_key,
                 sdn_list=site_configuration.sdn_api_list
             )
+            if prescreen:
+                sdn_check.prescreen(name, city, country)
+                return Response(status=status.HTTP_202_ACCEPTED)
+
             try:
                 response = sdn_check.search(name, city, country)
                 hits = response['total']
@@ -51,5 +60,7 @@ class SDNCheckViewSet(APIView):
                 # If the SDN API endpoint is down or times out
                 # the user is allowed to make the purchase.
                 pass
+        elif prescreen:
+            return Response(status=status.HTTP_202_ACCEPTED)
 
         return Response({'hits': hits})
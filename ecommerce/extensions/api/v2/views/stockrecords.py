@@ -5,6 +5,7 @@ from rest_framework import status, viewsets
 from rest_framework.response import Response
 
 from ecommerce.extensions.api import serializers
+from ecommerce.extensions.api.pagination import OptionalCursorPageNumberPagination
 from ecommerce.extensions.api.permissions import IsStaffOrModelPermissionsOrAnonReadOnly
 
 StockRecord = get_model('partner', 'StockRecord')
@@ -13,6 +14,7 @@ StockRecord = get_model('partner', 'StockRecord')
 class StockRecordViewSet(viewsets.ModelViewSet):
     permission_classes = (IsStaffOrModelPermissionsOrAnonReadOnly,)
     serializer_class = serializers.StockRecordSerializer
+    pagination_class = OptionalCursorPageNumberPagination
 
     def get_queryset(self):
         return StockRecord.objects.filter(partner=self.request.site.siteconfiguration.partner).order_by('id')
@@ -1,13 +1,16 @@
 """HTTP endpoints for interacting with vouchers."""
 import logging
-from urlparse import urlparse
+from urlparse import parse_qs, urlparse
 
 import django_filters
 import pytz
 from dateutil.parser import parse
 from dateutil.utils import default_tzinfo
+from django.conf import settings
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
 from django.utils.timezone import now
+from edx_django_utils.cache import TieredCache
 from opaque_keys.edx.keys import CourseKey
 from oscar.core.loading import get_model
 from requests.exceptions import ConnectionError, Timeout
@@ -16,14 +19,19 @@ from rest_framework.decorators import list_route
 from rest_framework.response import Response
 from slumber.exceptions import SlumberBaseException
 
+from ecommerce.core.background import BackgroundPool
 from ecommerce.core.constants import DEFAULT_CATALOG_PAGE_SIZE
+from ecommerce.core.read_replica import use_read_replica
+from ecommerce.core.utils import get_cache_key
 from ecommerce.coupons.utils import fetch_course_catalog, get_catalog_course_runs
 from ecommerce.courses.models import Course
 from ecommerce.courses.utils import get_course_info_from_catalog
 from ecommerce.enterprise.utils import get_enterprise_catalog
 from ecommerce.extensions.api import serializers
+from ecommerce.extensions.api.pagination import OptionalCursorPageNumberPagination
 from ecommerce.extensions.api.permissions import IsOffersOrIsAuthenticatedAndStaff
 from ecommerce.extensions.api.v2.views import NonDestroyableModelViewSet
+from ecommerce.extensions.voucher.utils import get_voucher_offers_cache_version
 
 logger = logging.getLogger(__name__)
 Order = get_model('order', 'Order')
@@ -32,6 +40,33 @@ StockRecord = get_model('partner', 'StockRecord')
 Voucher = get_model('voucher', 'Voucher')
 
 
+def parse_course_run_datetime(value):
+    """ Parses a Discovery datetime, using the fast ISO 8601 parser for the common case. """
+    return default_tzinfo(parse_datetime(value) or parse(value), pytz.UTC)
+
+
+catalog_prefetch_pool = BackgroundPool(
+    'catalog_prefetch', settings.CATALOG_PREFETCH_MAX_WORKERS, settings.CATALOG_PREFETCH_MAX_PENDING
+)
+
+
+def prefetch_catalog_page(fetch, **kwargs):
+    """
+    Calls a cached catalog API function in the background, so that the page is already
+    cached when the client asks for it.
+
+    Returns:
+        AsyncResult: The result of the prefetch, or None if too many prefetches are pending.
+    """
+    def run():
+        try:
+            fetch(**kwargs)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning('Failed to prefetch catalog page with %s.', kwargs, exc_info=True)
+
+    return catalog_prefetch_pool.submit(run)
+
+
 class VoucherFilter(django_filters.FilterSet):
     """
     Filter for vouchers via query string parameters.
@@ -50,6 +85,7 @@ class VoucherViewSet(NonDestroyableModelViewSet):
     permission_classes = (IsOffersOrIsAuthenticatedAndStaff,)
     filter_backends = (filters.DjangoFilterBackend,)
     filter_class = VoucherFilter
+    pagination_class = OptionalCursorPageNumberPagination
 
     def get_queryset(self):
         return Voucher.objects.filter(
@@ -57,6 +93,7 @@ class VoucherViewSet(NonDestroyableModelViewSet):
         )
 
     @list_route()
+    @use_read_replica
     def offers(self, request):
         """ Preview the courses offered by the voucher.
 
@@ -79,7 +116,7 @@ class VoucherViewSet(NonDestroyableModelViewSet):
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            offers_data = self.get_offers(request, voucher)
+            offers_data = self.get_cached_offers(request, voucher)
         except (ConnectionError, SlumberBaseException, Timeout):
             logger.error('Could not connect to Discovery Service.')
             return Response(status=status.HTTP_400_BAD_REQUEST)
@@ -116,11 +153,11 @@ class VoucherViewSet(NonDestroyableModelViewSet):
             #   if end date is not set or is in the future
             #   if enrollment start is not set or is in the past
             #   if enrollment end is not set or is in the future
-            end = course_run.get('end') and default_tzinfo(parse(course_run['end']), pytz.UTC)
+            end = course_run.get('end') and parse_course_run_datetime(course_run['end'])
             enrollment_start = (course_run.get('enrollment_start') and
-                                default_tzinfo(parse(course_run['enrollment_start']), pytz.UTC))
+                                parse_course_run_datetime(course_run['enrollment_start']))
             enrollment_end = (course_run.get('enrollment_end') and
-                              default_tzinfo(parse(course_run['enrollment_end']), pytz.UTC))
+                              parse_course_run_datetime(course_run['enrollment_end']))
             current_time = now()
 
             return (
@@ -141,13 +178,18 @@ class VoucherViewSet(NonDestroyableModelViewSet):
             elif is_course_run_enrollable(result):
                 course_run_metadata[result['key']] = result
 
-        products = []
-        for seat_type in course_seat_types.split(','):
-            products.extend(Product.objects.filter(
-                course_id__in=course_run_metadata.keys(),
-                attributes__name='certificate_type',
-                attribute_values__value_text=seat_type
-            ))
+        seat_types = course_seat_types.split(',')
+        products = Product.objects.filter(
+            course_id__in=course_run_metadata.keys(),
+            seat_attributes__certificate_type__in=seat_types
+        ).select_related('seat_attributes')
+
+        seat_type_products = {seat_type: [] for seat_type in seat_types}
+        for product in products:
+            seat_type_products[product.seat_attributes.certificate_type].append(product)
+
+        # Keep the products grouped by seat type, in the order the seat types are listed in.
+        products = [product for seat_type in seat_types for product in seat_type_products[seat_type]]
         stock_records = StockRecord.objects.filter(product__in=products)
         return products, stock_records, course_run_metadata
 
@@ -165,6 +207,8 @@ class VoucherViewSet(NonDestroyableModelViewSet):
             response['results'], course_seat_types
         )
         contains_verified_course = ('verified' in course_seat_types)
+        product_stock_records = {stock_record.product_id: stock_record for stock_record in stock_records}
+        courses = Course.objects.in_bulk({product.course_id for product in products})
         for product in products:
             # Omit unavailable seats from the offer results so that one seat does not cause an
             # error message for every seat in the query result.
@@ -181,7 +225,9 @@ class VoucherViewSet(NonDestroyableModelViewSet):
                         continue
                 else:
                     continue
-                credit_seats = Product.objects.filter(parent=product.parent, attributes__name='credit_provider')
+                credit_seats = Product.objects.filter(
+                    parent=product.parent, seat_attributes__credit_provider__isnull=False
+                )
 
                 if credit_seats.count() > 1:
                     multiple_credit_providers = True
@@ -190,16 +236,12 @@ class VoucherViewSet(NonDestroyableModelViewSet):
                     multiple_credit_providers = False
                     credit_provider_price = StockRecord.objects.get(product=product).price_excl_tax
 
-            try:
-                stock_record = stock_records.get(product__id=product.id)
-            except StockRecord.DoesNotExist:
-                stock_record = None
+            stock_record = product_stock_records.get(product.id)
+            if not stock_record:
                 logger.error('Stock Record for product %s not found.', product.id)
 
-            try:
-                course = Course.objects.get(id=course_id)
-            except Course.DoesNotExist:  # pragma: no cover
-                course = None
+            course = courses.get(course_id)
+            if not course:  # pragma: no cover
                 logger.error('Course %s not found.', course_id)
 
             if course_catalog_data and course and stock_record:
@@ -247,20 +289,28 @@ class VoucherViewSet(NonDestroyableModelViewSet):
         if not catalog_query and not enterprise_customer:
             return None, None
 
+        limit = request.GET.get('limit', DEFAULT_CATALOG_PAGE_SIZE)
         if enterprise_catalog:
             response = get_enterprise_catalog(
                 site=request.site,
                 enterprise_catalog=enterprise_catalog,
-                limit=request.GET.get('limit', DEFAULT_CATALOG_PAGE_SIZE),
+                limit=limit,
                 page=request.GET.get('page'),
             )
+            self.prefetch_next_catalog_page(
+                response, 'page', get_enterprise_catalog,
+                site=request.site, enterprise_catalog=enterprise_catalog, limit=limit
+            )
         elif catalog_query:
             response = get_catalog_course_runs(
                 site=request.site,
                 query=catalog_query,
-                limit=request.GET.get('limit', DEFAULT_CATALOG_PAGE_SIZE),
+                limit=limit,
                 offset=request.GET.get('offset'),
             )
+            self.prefetch_next_catalog_page(
+                response, 'offset', get_catalog_course_runs, site=request.site, query=catalog_query, limit=limit
+            )
         else:
             logger.warning(
                 'User is trying to redeem Voucher %s, but no catalog information is configured!',
@@ -273,6 +323,68 @@ class VoucherViewSet(NonDestroyableModelViewSet):
 
         return offers, next_page
 
+    def prefetch_next_catalog_page(self, response, page_param, fetch, **kwargs):
+        """
+        Starts fetching the catalog page following the given response in the background.
+
+        Learners browsing the offers of a voucher usually move on to the next page, and the
+        catalog API functions cache their responses, so the next page is served from the cache.
+
+        Args:
+            response (dict): Paginated catalog API response.
+            page_param (str): Name of the query parameter identifying the page in the next link.
+            fetch (function): Catalog API function returning the page.
+            **kwargs: Arguments for the catalog API function, other than the page.
+
+        Returns:
+            AsyncResult: The result of the prefetch, or None if there is no next page or it was not started.
+        """
+        next_page = response.get('next')
+        next_page_value = next_page and parse_qs(urlparse(next_page).query).get(page_param)
+        if not next_page_value:
+            return None
+
+        kwargs[page_param] = next_page_value[0]
+        return prefetch_catalog_page(fetch, **kwargs)
+
+    def get_cached_offers(self, request, voucher):
+        """
+        Get the course offers associated with the voucher, from the cache if possible.
+
+        Offers are cached per voucher and catalog page, and separately for staff, to whom seats
+        which are no longer available to learners are still available. Credit offers depend on the
+        eligibility and purchases of the learner, so they are not cached.
+
+        Arguments:
+            request (HttpRequest): Request data.
+            voucher (Voucher): Oscar Voucher for which the offers are returned.
+        Returns:
+            dict: Dictionary containing a link to the next page of Course Discovery results and
+                  a List of course offers where each offer is represented as a dictionary.
+        """
+        product_range = voucher.best_offer.benefit.range
+        if product_range and product_range.course_seat_types == 'credit':
+            return self.get_offers(request, voucher)
+
+        cache_key = get_cache_key(
+            site_domain=request.site.domain,
+            resource='voucher_offers',
+            voucher_id=voucher.id,
+            voucher_end_datetime=voucher.end_datetime,
+            version=get_voucher_offers_cache_version(),
+            limit=request.GET.get('limit'),
+            offset=request.GET.get('offset'),
+            page=request.GET.get('page'),
+            is_staff=request.user.is_staff,
+        )
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return dict(cached_response.value)
+
+        offers_data = self.get_offers(request, voucher)
+        TieredCache.set_all_tiers(cache_key, offers_data, settings.VOUCHER_OFFERS_CACHE_TIMEOUT)
+        return dict(offers_data)
+
     def get_offers(self, request, voucher):
         """
         Get the course offers associated with the voucher.
@@ -343,7 +455,7 @@ class VoucherViewSet(NonDestroyableModelViewSet):
             'multiple_credit_providers': multiple_credit_providers,
             'organization': CourseKey.from_string(course.id).org,
             'credit_provider_price': credit_provider_price,
-            'seat_type': product.attr.certificate_type,
+            'seat_type': product.seat_attributes.certificate_type,
             'stockrecords': serializers.StockRecordSerializer(stock_record).data,
             'title': course_info.get('title', course.name),
             'voucher_end_date': voucher.end_datetime
@@ -0,0 +1,122 @@
+""" Batched deletion of the baskets which are no longer needed. """
+from __future__ import unicode_literals
+
+import datetime
+import logging
+import time
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from oscar.core.loading import get_model
+
+from ecommerce.core.read_replica import get_replication_lag
+from ecommerce.core.utils import use_read_replica_if_available
+
+logger = logging.getLogger(__name__)
+
+Basket = get_model('basket', 'Basket')
+BasketAttribute = get_model('basket', 'BasketAttribute')
+Invoice = get_model('invoice', 'Invoice')
+Line = get_model('basket', 'Line')
+LineAttribute = get_model('basket', 'LineAttribute')
+Order = get_model('order', 'Order')
+PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+Referral = get_model('referrals', 'Referral')
+
+
+def get_ordered_baskets():
+    """ Returns the baskets for which orders have been placed, except for those linked to an invoice. """
+    # TODO: Simplify this query when the foreign key to Basket is removed from Invoice.
+    return Basket.objects.filter(order__isnull=False, invoice__isnull=True)
+
+
+def get_stale_baskets(days):
+    """
+    Returns the open baskets which have not been used for the given number of days.
+
+    Baskets are considered unused if neither they nor any of their lines were created, and their owner has not
+    logged in, during that time.
+    """
+    cutoff = timezone.now() - datetime.timedelta(days=days)
+    return Basket.objects.filter(
+        Q(owner__isnull=True) | Q(owner__last_login__isnull=True) | Q(owner__last_login__lt=cutoff),
+        status=Basket.OPEN,
+        date_created__lt=cutoff,
+        invoice__isnull=True,
+    ).exclude(lines__date_created__gte=cutoff)
+
+
+class BasketCleaner(object):
+    """
+    Deletes baskets, along with their lines, attributes and voucher links, in batches.
+
+    The IDs of the baskets to delete are walked in order, from the read replica if there is one, so that each batch
+    only reads baskets which are to be deleted. Batches are deleted in their own transactions, child rows first, with
+    one bulk delete per table, after which the cleaner sleeps to let other connections, and the replica, catch up.
+    """
+
+    def __init__(self, batch_size=1000, sleep_seconds=3, max_replication_lag=10):
+        self.batch_size = batch_size
+        self.sleep_seconds = sleep_seconds
+        self.max_replication_lag = max_replication_lag
+
+    def count(self, queryset):
+        return use_read_replica_if_available(queryset).count()
+
+    def iter_batches(self, queryset):
+        """ Yields the IDs of the baskets of the queryset, in batches, walking them by ID. """
+        queryset = use_read_replica_if_available(queryset).order_by('id').distinct()
+        last_id = 0
+        while True:
+            ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:self.batch_size])
+            if not ids:
+                return
+
+            yield ids
+            last_id = ids[-1]
+
+    def delete(self, queryset):
+        """
+        Deletes the baskets of the queryset, in batches.
+
+        Yields:
+            list of int: The IDs of the baskets deleted by each batch.
+        """
+        for ids in self.iter_batches(queryset):
+            yield self.delete_batch(queryset, ids)
+            self.wait()
+
+    def delete_batch(self, queryset, ids):
+        """ Deletes the baskets of the queryset with the given IDs, and returns the IDs of those deleted. """
+        with transaction.atomic():
+            # The replica may lag behind, so the baskets are checked against the primary database again.
+            ids = list(queryset.filter(id__in=ids).order_by().values_list('id', flat=True).distinct())
+            if not ids:
+                return ids
+
+            for model in (Invoice, Order, PaymentProcessorResponse, Referral):
+                model.objects.filter(basket_id__in=ids).update(basket=None)
+
+            self._bulk_delete(LineAttribute.objects.filter(line__basket_id__in=ids))
+            self._bulk_delete(Line.objects.filter(basket_id__in=ids))
+            self._bulk_delete(BasketAttribute.objects.filter(basket_id__in=ids))
+            self._bulk_delete(Basket.vouchers.through.objects.filter(basket_id__in=ids))
+            self._bulk_delete(Basket.objects.filter(id__in=ids))
+
+        return ids
+
+    def _bulk_delete(self, queryset):
+        # Deleting the rows with a single query, rather than collecting them, and their related rows, first. The
+        # rows related to those deleted are always deleted, or unlinked, beforehand.
+        return queryset._raw_delete(queryset.db)  # pylint: disable=protected-access
+
+    def wait(self):
+        """ Sleeps between batches, for longer if the replica lags too far behind. """
+        time.sleep(self.sleep_seconds)
+
+        lag = get_replication_lag()
+        while lag is not None and lag > self.max_replication_lag:
+            logger.info('The read replica lags [%d] seconds behind. Waiting for it to catch up.', lag)
+            time.sleep(lag)
+            lag = get_replication_lag()
@@ -1,2 +1,3 @@
 TEMPORARY_BASKET_CACHE_KEY = "ecommerce.is_calculate_temporary_basket"
+BASKET_ATTRIBUTES_CACHE_KEY_TPL = "ecommerce.basket_attributes.{basket_id}"
 EMAIL_OPT_IN_ATTRIBUTE = "email_opt_in"
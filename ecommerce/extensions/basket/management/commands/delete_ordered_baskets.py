@@ -5,13 +5,9 @@ These baskets don't have much value once the order is placed, and unnecessarily
 """
 from __future__ import unicode_literals
 
-import time
-
 from django.core.management import BaseCommand
-from django.db import transaction
-from oscar.core.loading import get_model
 
-Basket = get_model('basket', 'Basket')
+from ecommerce.extensions.basket.cleanup import BasketCleaner, get_ordered_baskets
 
 
 class Command(BaseCommand):
@@ -32,34 +28,39 @@ class Command(BaseCommand):
                             default=3,
                             type=int,
                             help='Seconds to sleep between each batch deletion.')
+        parser.add_argument('--max-replication-lag',
+                            action='store',
+                            dest='max_replication_lag',
+                            default=10,
+                            type=int,
+                            help='Seconds the read replica may lag behind before deletion pauses for it.')
         parser.add_argument('--commit',
                             action='store_true',
                             dest='commit',
                             default=False,
                             help='Actually delete the baskets.')
 
+    def get_queryset(self, options):  # pylint: disable=unused-argument
+        return get_ordered_baskets()
+
     def handle(self, *args, **options):
-        # Only select those baskets linked to an order, and those not linked to an invoice.
-        # TODO: Simplify this query when the foreign key to Basket is removed from Invoice.
-        queryset = Basket.objects.filter(order__isnull=False, invoice__isnull=True)
-        count = queryset.count()
+        queryset = self.get_queryset(options)
+        cleaner = BasketCleaner(
+            batch_size=options['batch_size'],
+            sleep_seconds=options['sleep_seconds'],
+            max_replication_lag=options['max_replication_lag']
+        )
+        count = cleaner.count(queryset)
 
         if options['commit']:
             if count:
                 self.stderr.write('Deleting [{}] baskets.'.format(count))
 
-                batch_size = options['batch_size']
-                sleep_seconds = options['sleep_seconds']
-
-                max_id = queryset.order_by('-id')[0].id
-                for start in range(0, max_id, batch_size):
-                    end = min(start + batch_size, max_id)
-                    self.stderr.write('Deleting baskets [{start}] through [{end}].'.format(start=start, end=end))
-                    with transaction.atomic():
-                        queryset.filter(pk__gte=start, pk__lte=end).delete()
-
-                    self.stderr.write('Complete. Sleeping.'.format(start=start, end=end))
-                    time.sleep(sleep_seconds)
+                for ids in cleaner.delete(queryset):
+                    if ids:
+                        self.stderr.write('Deleted baskets [{start}] through [{end}]. Sleeping.'.format(
+                            start=ids[0], end=ids[-1]
+                        ))
 
                 self.stderr.write('All baskets deleted.')
             else:
@@ -0,0 +1,26 @@
+"""
+Management command that deletes abandoned open baskets.
+
+Learners abandon many baskets without ever placing an order for them. Those left unused for long enough are
+unlikely to ever be, and unnecessarily take up space.
+"""
+from __future__ import unicode_literals
+
+from ecommerce.extensions.basket.cleanup import get_stale_baskets
+from ecommerce.extensions.basket.management.commands.delete_ordered_baskets import Command as BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Delete open baskets which have not been used for a number of days.'
+
+    def add_arguments(self, parser):
+        super(Command, self).add_arguments(parser)
+        parser.add_argument('-d', '--days',
+                            action='store',
+                            dest='days',
+                            default=90,
+                            type=int,
+                            help='Number of days after which unused open baskets are deleted.')
+
+    def get_queryset(self, options):
+        return get_stale_baskets(options['days'])
@@ -1,11 +1,13 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from edx_django_utils.cache import DEFAULT_REQUEST_CACHE
 from oscar.apps.basket.abstract_models import AbstractBasket
 from oscar.core.loading import get_class
 
 from ecommerce.extensions.analytics.utils import track_segment_event, translate_basket_line_for_segment
-from ecommerce.extensions.basket.constants import TEMPORARY_BASKET_CACHE_KEY
+from ecommerce.extensions.basket.constants import BASKET_ATTRIBUTES_CACHE_KEY_TPL, TEMPORARY_BASKET_CACHE_KEY
 
 OrderNumberGenerator = get_class('order.utils', 'OrderNumberGenerator')
 Selector = get_class('partner.strategy', 'Selector')
@@ -49,6 +51,23 @@ class Basket(AbstractBasket):
 
         return basket
 
+    def all_lines(self):
+        """
+        Return a cached set of basket lines.
+
+        Unlike Oscar, the parents of the products are selected along with the lines, so that checking the product
+        class of child products does not hit the database.
+        """
+        if self.id is None:
+            return self.lines.none()
+        if self._lines is None:
+            self._lines = (
+                self.lines
+                .select_related('product', 'product__parent', 'stockrecord')
+                .prefetch_related('attributes', 'product__images')
+                .order_by(self._meta.pk.name))
+        return self._lines
+
     def flush(self):
         """Remove all products in basket and fire Segment 'Product Removed' Analytic event for each"""
         cached_response = DEFAULT_REQUEST_CACHE.get_cached_response(TEMPORARY_BASKET_CACHE_KEY)
@@ -85,6 +104,32 @@ class Basket(AbstractBasket):
             track_segment_event(self.site, self.owner, 'Product Added', properties)
         return line, created
 
+    def get_attributes(self):
+        """
+        Returns the values of the attributes of the basket, by attribute type name.
+
+        All attributes are loaded with a single query, and cached for the rest of the request. The cache is
+        invalidated whenever an attribute of the basket is saved or deleted.
+        """
+        if self.id is None:
+            return {}
+
+        cache_key = BASKET_ATTRIBUTES_CACHE_KEY_TPL.format(basket_id=self.id)
+        cached_response = DEFAULT_REQUEST_CACHE.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
+
+        attributes = {
+            attribute.attribute_type.name: attribute.value_text
+            for attribute in BasketAttribute.objects.filter(basket_id=self.id).select_related('attribute_type')
+        }
+        DEFAULT_REQUEST_CACHE.set(cache_key, attributes)
+        return attributes
+
+    def get_attribute(self, name, default=None):
+        """ Returns the value of the attribute of the basket with the given type name, or the default if unset. """
+        return self.get_attributes().get(name, default)
+
     def clear_vouchers(self):
         """Remove all vouchers applied to the basket."""
         for v in self.vouchers.all():
@@ -104,9 +149,33 @@ class BasketAttributeType(models.Model):
     """
     name = models.CharField(_("Name"), max_length=128, unique=True)
 
+    # In-process cache of attribute type IDs, by name.
+    _ids_by_name = {}
+
     def __unicode__(self):
         return self.name
 
+    @classmethod
+    def get_id(cls, name):
+        """
+        Returns the ID of the attribute type with the given name, creating the attribute type if needed.
+
+        There are only a handful of attribute types, and they are practically never modified, so their IDs are
+        cached in process. The cache is cleared whenever an attribute type is saved or deleted.
+        """
+        attribute_type_id = cls._ids_by_name.get(name)
+        if attribute_type_id is None:
+            attribute_type, created = cls.objects.get_or_create(name=name)
+            attribute_type_id = attribute_type.id
+            # Types created here are not cached, as they would be lost if the enclosing transaction is rolled back.
+            if not created:
+                cls._ids_by_name[name] = attribute_type_id
+        return attribute_type_id
+
+    @classmethod
+    def clear_ids(cls):
+        cls._ids_by_name = {}
+
 
 class BasketAttribute(models.Model):
     """
@@ -123,5 +192,19 @@ class BasketAttribute(models.Model):
     class Meta(object):
         unique_together = ('basket', 'attribute_type')
 
+
+@receiver(post_save, sender=BasketAttributeType)
+@receiver(post_delete, sender=BasketAttributeType)
+def clear_basket_attribute_type_ids(sender, **kwargs):  # pylint: disable=unused-argument
+    """Clears the cached attribute type IDs when an attribute type is modified."""
+    BasketAttributeType.clear_ids()
+
+
+@receiver(post_save, sender=BasketAttribute)
+@receiver(post_delete, sender=BasketAttribute)
+def clear_basket_attributes_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Clears the cached attributes of a basket when one of them is modified."""
+    DEFAULT_REQUEST_CACHE.delete(BASKET_ATTRIBUTES_CACHE_KEY_TPL.format(basket_id=instance.basket_id))
+
 # noinspection PyUnresolvedReferences
 from oscar.apps.basket.models import *  # noqa isort:skip pylint: disable=wildcard-import,unused-wildcard-import,wrong-import-position,wrong-import-order,ungrouped-imports
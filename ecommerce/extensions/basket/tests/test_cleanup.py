@@ -0,0 +1,130 @@
+import datetime
+
+import mock
+from django.utils import timezone
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+from ecommerce.extensions.basket.cleanup import BasketCleaner, get_stale_baskets
+from ecommerce.extensions.test.factories import create_basket, create_order
+from ecommerce.tests.testcases import TestCase
+
+Basket = get_model('basket', 'Basket')
+BasketAttribute = get_model('basket', 'BasketAttribute')
+BasketAttributeType = get_model('basket', 'BasketAttributeType')
+Line = get_model('basket', 'Line')
+LineAttribute = get_model('basket', 'LineAttribute')
+Order = get_model('order', 'Order')
+PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
+
+
+class BasketCleanerTests(TestCase):
+    def setUp(self):
+        super(BasketCleanerTests, self).setUp()
+        self.cleaner = BasketCleaner(batch_size=2, sleep_seconds=0)
+
+    def make_stale(self, basket, days=100):
+        date = timezone.now() - datetime.timedelta(days=days)
+        Basket.objects.filter(id=basket.id).update(date_created=date)
+        Line.objects.filter(basket=basket).update(date_created=date)
+        basket.owner.last_login = date
+        basket.owner.save()
+
+    def test_iter_batches(self):
+        """ The IDs of the baskets should be walked in batches, from the last one of the previous batch. """
+        baskets = [factories.BasketFactory() for __ in range(5)]
+        factories.BasketFactory(status=Basket.SUBMITTED)
+        queryset = Basket.objects.filter(status=Basket.OPEN)
+
+        with self.assertNumQueries(4):
+            actual = list(self.cleaner.iter_batches(queryset))
+
+        ids = [basket.id for basket in baskets]
+        self.assertEqual(actual, [ids[:2], ids[2:4], ids[4:]])
+
+    def test_delete_batch(self):
+        """ The baskets should be deleted along with their lines, attributes and voucher links. """
+        basket = create_basket(site=self.site)
+        line = basket.lines.first()
+        LineAttribute.objects.create(line=line, option=factories.OptionFactory(), value='value')
+        BasketAttribute.objects.create(
+            basket=basket, attribute_type_id=BasketAttributeType.get_id('email_opt_in'), value_text='True'
+        )
+        basket.vouchers.add(factories.VoucherFactory())
+        response = PaymentProcessorResponse.objects.create(processor_name='test', basket=basket)
+        other_basket = create_basket(site=self.site)
+
+        deleted = self.cleaner.delete_batch(Basket.objects.all(), [basket.id])
+
+        self.assertEqual(deleted, [basket.id])
+        self.assertEqual(list(Basket.objects.all()), [other_basket])
+        self.assertEqual(list(Line.objects.all()), list(other_basket.lines.all()))
+        self.assertFalse(LineAttribute.objects.exists())
+        self.assertFalse(BasketAttribute.objects.exists())
+        self.assertFalse(Basket.vouchers.through.objects.exists())
+        response.refresh_from_db()
+        self.assertIsNone(response.basket)
+
+    def test_delete_batch_unlinks_orders(self):
+        """ The orders of deleted baskets should be kept. """
+        order = create_order(site=self.site)
+
+        self.cleaner.delete_batch(Basket.objects.all(), [order.basket.id])
+
+        order.refresh_from_db()
+        self.assertIsNone(order.basket)
+
+    def test_delete_batch_rechecks_baskets(self):
+        """ Baskets which no longer match the queryset, e.g. according to a lagging replica, should be kept. """
+        basket = factories.BasketFactory(status=Basket.SUBMITTED)
+
+        self.assertEqual(self.cleaner.delete_batch(Basket.objects.filter(status=Basket.OPEN), [basket.id]), [])
+        self.assertTrue(Basket.objects.filter(id=basket.id).exists())
+
+    def test_delete(self):
+        """ All the baskets of the queryset should be deleted, in batches. """
+        baskets = [factories.BasketFactory() for __ in range(3)]
+
+        with mock.patch.object(BasketCleaner, 'wait') as mock_wait:
+            actual = list(self.cleaner.delete(Basket.objects.all()))
+
+        self.assertEqual(actual, [[baskets[0].id, baskets[1].id], [baskets[2].id]])
+        self.assertFalse(Basket.objects.exists())
+        self.assertEqual(mock_wait.call_count, 2)
+
+    @mock.patch('ecommerce.extensions.basket.cleanup.time.sleep')
+    def test_wait(self, mock_sleep):
+        """ The cleaner should wait for the replica to catch up if it lags too far behind. """
+        self.cleaner.max_replication_lag = 10
+
+        with mock.patch('ecommerce.extensions.basket.cleanup.get_replication_lag', side_effect=[30, 15, 5]):
+            self.cleaner.wait()
+
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list], [0, 30, 15])
+
+    def test_get_stale_baskets(self):
+        """ Only open baskets which have not been used recently should be stale. """
+        stale = create_basket(site=self.site)
+        self.make_stale(stale)
+
+        anonymous = factories.BasketFactory()
+        Basket.objects.filter(id=anonymous.id).update(date_created=timezone.now() - datetime.timedelta(days=100))
+
+        recent = create_basket(site=self.site)
+
+        submitted = create_basket(site=self.site)
+        self.make_stale(submitted)
+        Basket.objects.filter(id=submitted.id).update(status=Basket.SUBMITTED)
+
+        active_owner = create_basket(site=self.site)
+        self.make_stale(active_owner)
+        active_owner.owner.last_login = timezone.now()
+        active_owner.owner.save()
+
+        recent_line = create_basket(site=self.site)
+        self.make_stale(recent_line)
+        Line.objects.filter(basket=recent_line).update(date_created=timezone.now())
+
+        actual = set(get_stale_baskets(90))
+        self.assertEqual(actual, {stale, anonymous})
+        self.assertNotIn(recent, actual)
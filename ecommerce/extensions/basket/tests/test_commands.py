@@ -1,9 +1,11 @@
 from __future__ import unicode_literals
 
+import datetime
 from StringIO import StringIO
 
 from django.contrib.sites.models import Site
 from django.core.management import CommandError, call_command
+from django.utils import timezone
 from oscar.core.loading import get_model
 from oscar.test import factories
 
@@ -78,6 +80,40 @@ class DeleteOrderedBasketsCommandTests(TestCase):
         self.assertEqual(out.getvalue().strip(), 'No baskets to delete.')
 
 
+class DeleteStaleBasketsCommandTests(TestCase):
+    command = 'delete_stale_baskets'
+
+    def setUp(self):
+        super(DeleteStaleBasketsCommandTests, self).setUp()
+        self.baskets = [factories.BasketFactory() for __ in range(0, 3)]
+        Basket.objects.filter(id__in=[basket.id for basket in self.baskets[:2]]).update(
+            date_created=timezone.now() - datetime.timedelta(days=40)
+        )
+
+    def test_without_commit(self):
+        """ Verify the command does not delete baskets if the commit flag is not set. """
+        out = StringIO()
+        call_command(self.command, days=30, stderr=out)
+
+        self.assertEqual(Basket.objects.count(), len(self.baskets))
+        expected = 'This has been an example operation. If the --commit flag had been included, the command ' \
+                   'would have deleted [2] baskets.'
+        self.assertEqual(out.getvalue().strip(), expected)
+
+    def test_with_commit(self):
+        """ Verify the command, when called with the commit flag, deletes baskets unused for the given days. """
+        out = StringIO()
+        call_command(self.command, days=30, batch_size=1, sleep_seconds=0, commit=True, stderr=out)
+
+        self.assertEqual(list(Basket.objects.all()), self.baskets[2:])
+        self.assertEqual(out.getvalue().strip().splitlines(), [
+            'Deleting [2] baskets.',
+            'Deleted baskets [{id}] through [{id}]. Sleeping.'.format(id=self.baskets[0].id),
+            'Deleted baskets [{id}] through [{id}]. Sleeping.'.format(id=self.baskets[1].id),
+            'All baskets deleted.',
+        ])
+
+
 class AddSiteToBasketsBasketsCommandTests(TestCase):
     command = 'add_site_to_baskets'
 
@@ -17,6 +17,8 @@ from ecommerce.tests.factories import SiteConfigurationFactory
 from ecommerce.tests.testcases import TestCase
 
 Basket = get_model('basket', 'Basket')
+BasketAttribute = get_model('basket', 'BasketAttribute')
+BasketAttributeType = get_model('basket', 'BasketAttributeType')
 OrderNumberGenerator = get_class('order.utils', 'OrderNumberGenerator')
 
 
@@ -167,6 +169,27 @@ class BasketTests(CatalogMixin, BasketMixin, TestCase):
             properties['cart_id'] = basket.id
             mock_track.assert_called_once_with(basket.site, basket.owner, 'Product Added', properties)
 
+    def test_all_lines_product_class_checks(self):
+        """ Verify checking the product class of the products in a basket does not hit the database. """
+        basket = create_basket(empty=True, site=self.site)
+        with mock.patch('ecommerce.extensions.basket.models.track_segment_event'):
+            for __ in range(25):
+                course = CourseFactory(partner=self.partner)
+                basket.add_product(course.create_or_update_seat('verified', True, 100))
+                basket.add_product(course.create_or_update_seat('professional', True, 100))
+
+        basket = Basket.objects.get(id=basket.id)
+        lines = list(basket.all_lines())
+        self.assertEqual(len(lines), 50)
+
+        # Warm up the product class registry.
+        self.assertTrue(lines[0].product.is_seat_product)
+        with self.assertNumQueries(0):
+            for line in basket.all_lines():
+                self.assertTrue(line.product.is_seat_product)
+                self.assertFalse(line.product.is_enrollment_code_product)
+                self.assertFalse(line.product.is_coupon_product)
+
     def test_add_product_not_tracked_for_temporary_basket_calculation(self):
         """
         Verify the method does NOT fire Product Added analytic event when a product is added to the basket
@@ -192,6 +215,42 @@ class BasketTests(CatalogMixin, BasketMixin, TestCase):
             basket.flush()
             self.assertEqual(mock_track.call_count, 0)
 
+    def test_get_attributes(self):
+        """ Verify the attributes of a basket are loaded at once, and reloaded once one of them is modified. """
+        basket = create_basket(empty=True, site=self.site)
+        BasketAttribute.objects.create(
+            basket=basket, attribute_type_id=BasketAttributeType.get_id('bundle_identifier'), value_text='bundle'
+        )
+        attribute = BasketAttribute.objects.create(
+            basket=basket, attribute_type_id=BasketAttributeType.get_id('email_opt_in'), value_text='True'
+        )
+
+        same_basket = Basket.objects.get(id=basket.id)
+        with self.assertNumQueries(1):
+            self.assertEqual(basket.get_attributes(), {'bundle_identifier': 'bundle', 'email_opt_in': 'True'})
+            self.assertEqual(same_basket.get_attribute('bundle_identifier'), 'bundle')
+        with self.assertNumQueries(0):
+            self.assertEqual(basket.get_attribute('email_opt_in'), 'True')
+            self.assertIsNone(basket.get_attribute('sailthru_bid'))
+
+        attribute.value_text = 'False'
+        attribute.save()
+        self.assertEqual(basket.get_attribute('email_opt_in'), 'False')
+
+        attribute.delete()
+        self.assertEqual(basket.get_attribute('email_opt_in', 'default'), 'default')
+
+    def test_get_attribute_type_id(self):
+        """ Verify the IDs of attribute types are cached, until an attribute type is modified. """
+        attribute_type = BasketAttributeType.objects.create(name='test_attribute')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(BasketAttributeType.get_id('test_attribute'), attribute_type.id)
+            self.assertEqual(BasketAttributeType.get_id('test_attribute'), attribute_type.id)
+
+        attribute_type.delete()
+        self.assertNotEqual(BasketAttributeType.get_id('test_attribute'), attribute_type.id)
+
     def _create_basket_with_product(self):
         basket = create_basket(empty=True, site=self.site)
         course = CourseFactory(partner=self.partner)
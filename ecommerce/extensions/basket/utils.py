@@ -279,10 +279,9 @@ def basket_add_organization_attribute(basket, request_data):
     business_client = request_data.get(ORGANIZATION_ATTRIBUTE_TYPE)
 
     if business_client:
-        organization_attribute, __ = BasketAttributeType.objects.get_or_create(name=ORGANIZATION_ATTRIBUTE_TYPE)
         BasketAttribute.objects.get_or_create(
             basket=basket,
-            attribute_type=organization_attribute,
+            attribute_type_id=BasketAttributeType.get_id(ORGANIZATION_ATTRIBUTE_TYPE),
             value_text=business_client.strip()
         )
 
@@ -301,20 +300,18 @@ def basket_add_enterprise_catalog_attribute(basket, request_data):
     # Value of enterprise catalog UUID is being passed as `catalog` from
     # basket page
     enterprise_catalog_uuid = request_data.get('catalog') if request_data else None
-    enterprise_catalog_attribute, __ = BasketAttributeType.objects.get_or_create(
-        name=ENTERPRISE_CATALOG_ATTRIBUTE_TYPE
-    )
+    enterprise_catalog_attribute_id = BasketAttributeType.get_id(ENTERPRISE_CATALOG_ATTRIBUTE_TYPE)
     if enterprise_catalog_uuid:
         BasketAttribute.objects.update_or_create(
             basket=basket,
-            attribute_type=enterprise_catalog_attribute,
+            attribute_type_id=enterprise_catalog_attribute_id,
             defaults={
                 'value_text': enterprise_catalog_uuid.strip()
             }
         )
     else:
         # Remove the enterprise catalog attribute for future update in basket
-        BasketAttribute.objects.filter(basket=basket, attribute_type=enterprise_catalog_attribute).delete()
+        BasketAttribute.objects.filter(basket=basket, attribute_type_id=enterprise_catalog_attribute_id).delete()
 
 
 @newrelic.agent.function_trace()
@@ -338,7 +335,7 @@ def _set_basket_bundle_status(bundle, basket):
     if bundle:
         BasketAttribute.objects.update_or_create(
             basket=basket,
-            attribute_type=BasketAttributeType.objects.get(name=BUNDLE),
+            attribute_type_id=BasketAttributeType.get_id(BUNDLE),
             defaults={'value_text': bundle}
         )
         basket.clear_vouchers()
@@ -386,11 +383,7 @@ def validate_voucher(voucher, user, basket, request_site):
         return False, message
 
     # Do not allow single course run coupons used on bundles.
-    bundle_attribute = BasketAttribute.objects.filter(
-        basket=basket,
-        attribute_type=BasketAttributeType.objects.get(name=BUNDLE)
-    )
-    is_bundle_purchase = len(bundle_attribute) > 0
+    is_bundle_purchase = basket.get_attribute(BUNDLE) is not None
     voucher_program_uuid = voucher.best_offer.condition.program_uuid
     is_voucher_valid_for_bundle = voucher_program_uuid or voucher.usage == Voucher.MULTI_USE
 
@@ -21,7 +21,11 @@ from slumber.exceptions import SlumberBaseException
 
 from ecommerce.core.exceptions import SiteConfigurationError
 from ecommerce.core.url_utils import get_lms_course_about_url, get_lms_url
-from ecommerce.courses.utils import get_certificate_type_display_value, get_course_info_from_catalog
+from ecommerce.courses.utils import (
+    get_certificate_type_display_value,
+    get_course_info_from_catalog,
+    prefetch_course_info_from_catalog
+)
 from ecommerce.enterprise.entitlements import get_enterprise_code_redemption_redirect
 from ecommerce.enterprise.utils import CONSENT_FAILED_PARAM, get_enterprise_customer_from_voucher, has_enterprise_offer
 from ecommerce.extensions.analytics.utils import (
@@ -105,7 +109,7 @@ class BasketAddItemsView(View):
         # order to opt them in later as part of fulfillment
         BasketAttribute.objects.update_or_create(
             basket=request.basket,
-            attribute_type=BasketAttributeType.objects.get(name=EMAIL_OPT_IN_ATTRIBUTE),
+            attribute_type_id=BasketAttributeType.get_id(EMAIL_OPT_IN_ATTRIBUTE),
             defaults={'value_text': request.GET.get('email_opt_in') == 'true'},
         )
 
@@ -236,6 +240,12 @@ class BasketSummaryView(BasketView):
         is_enrollment_code_purchase = False
         switch_link_text = partner_sku = order_details_msg = None
 
+        prefetch_course_info_from_catalog(self.request.site, [
+            line.product for line in lines
+            if line.product.is_seat_product or line.product.is_course_entitlement_product or
+            line.product.is_enrollment_code_product
+        ])
+
         for line in lines:
             if line.product.is_seat_product or line.product.is_course_entitlement_product:
                 line_data = self._get_course_data(line.product)
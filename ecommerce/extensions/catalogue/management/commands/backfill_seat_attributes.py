@@ -0,0 +1,85 @@
+from __future__ import unicode_literals
+
+import logging
+import time
+from collections import defaultdict
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from oscar.core.loading import get_model
+
+logger = logging.getLogger(__name__)
+Product = get_model('catalogue', 'Product')
+ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+SeatAttributes = get_model('catalogue', 'SeatAttributes')
+
+
+class Command(BaseCommand):
+    """
+    Command to (re)build the denormalized seat attributes of products from their attribute values.
+
+    The seat attributes of existing products are created by a data migration. The command is idempotent, and may
+    be run at any time to repair the seat attributes.
+
+    Example:
+
+        ./manage.py backfill_seat_attributes
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=1000,
+                            help='Maximum number of products to update per transaction. '
+                                 'This helps avoid locking the database while updating large amount of data.')
+        parser.add_argument('--sleep_time',
+                            action='store',
+                            dest='sleep_time',
+                            type=int,
+                            default=0,
+                            help='Sleep time in seconds between update of batches')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        sleep_time = options['sleep_time']
+
+        product_ids = Product.objects.filter(
+            attribute_values__attribute__code__in=SeatAttributes.ATTRIBUTE_CODES
+        ).order_by('id').values_list('id', flat=True).distinct()
+
+        last_id = 0
+        total = 0
+        while True:
+            batch = list(product_ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            self.backfill(batch)
+            total += len(batch)
+            last_id = batch[-1]
+            logger.info('Backfilled seat attributes of %d products, up to product [%d].', total, last_id)
+
+            if sleep_time:
+                time.sleep(sleep_time)
+
+    def backfill(self, product_ids):
+        """ Replaces the seat attributes of the given products with the values of their attributes. """
+        values = ProductAttributeValue.objects.filter(
+            product_id__in=product_ids,
+            attribute__code__in=SeatAttributes.ATTRIBUTE_CODES
+        ).select_related('attribute')
+
+        seat_attributes = defaultdict(dict)
+        for value in values:
+            seat_attributes[value.product_id][value.attribute.code] = value.value
+
+        with transaction.atomic():
+            SeatAttributes.objects.filter(product_id__in=product_ids).delete()
+            SeatAttributes.objects.bulk_create(
+                SeatAttributes(product_id=product_id, **attributes)
+                for product_id, attributes in seat_attributes.items()
+            )
@@ -57,8 +57,7 @@ class Command(BaseCommand):
 
             if save_to_db:
                 course_seats = course.seat_products.filter(
-                    attributes__name='certificate_type',
-                    attribute_values__value_text__in=seats_to_update
+                    seat_attributes__certificate_type__in=seats_to_update
                 )
                 expires = parser.parse(enrollment_end_date)
                 course_seats.update(expires=expires)
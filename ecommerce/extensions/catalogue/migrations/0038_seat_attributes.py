@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 10:33
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogue', '0037_add_sec_disc_reward_coupon_category'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeatAttributes',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='seat_attributes', serialize=False, to='catalogue.Product')),
+                ('course_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('certificate_type', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+                ('seat_type', models.CharField(blank=True, max_length=255, null=True)),
+                ('id_verification_required', models.NullBooleanField()),
+                ('credit_provider', models.CharField(blank=True, db_index=True, max_length=255, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'seat attributes',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='seatattributes',
+            index_together=set([('course_key', 'certificate_type')]),
+        ),
+    ]
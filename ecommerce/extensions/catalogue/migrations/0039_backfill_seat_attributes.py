@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Creates the seat attributes of existing products from their course related attribute values.
+"""
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.db import migrations
+
+ATTRIBUTE_CODES = ('course_key', 'certificate_type', 'seat_type', 'id_verification_required', 'credit_provider',)
+BATCH_SIZE = 1000
+
+
+def backfill_seat_attributes(apps, schema_editor):
+    """ Creates the seat attributes of the products with course related attribute values, in batches. """
+    ProductAttributeValue = apps.get_model('catalogue', 'ProductAttributeValue')
+    SeatAttributes = apps.get_model('catalogue', 'SeatAttributes')
+
+    product_ids = ProductAttributeValue.objects.filter(
+        attribute__code__in=ATTRIBUTE_CODES
+    ).order_by('product_id').values_list('product_id', flat=True).distinct()
+
+    last_id = 0
+    while True:
+        batch = list(product_ids.filter(product_id__gt=last_id)[:BATCH_SIZE])
+        if not batch:
+            break
+
+        values = ProductAttributeValue.objects.filter(
+            product_id__in=batch,
+            attribute__code__in=ATTRIBUTE_CODES
+        ).select_related('attribute')
+
+        # Historical models lack the value property of attribute values, which reads the field of the attribute type.
+        seat_attributes = defaultdict(dict)
+        for value in values:
+            seat_attributes[value.product_id][value.attribute.code] = getattr(
+                value, 'value_{}'.format(value.attribute.type)
+            )
+
+        SeatAttributes.objects.filter(product_id__in=batch).delete()
+        SeatAttributes.objects.bulk_create(
+            SeatAttributes(product_id=product_id, **attributes)
+            for product_id, attributes in seat_attributes.items()
+        )
+        last_id = batch[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogue', '0038_seat_attributes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_seat_attributes, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,12 @@
+import uuid
+
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.db import models
-from django.db.models.signals import post_init, post_save
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
+from edx_django_utils.cache import TieredCache
 from oscar.apps.catalogue.abstract_models import AbstractProduct
 
 from ecommerce.core.constants import (
@@ -16,6 +19,55 @@ from ecommerce.core.utils import log_message_and_raise_validation_error
 from ecommerce.journals.constants import JOURNAL_PRODUCT_CLASS_NAME  # TODO: journals dependency
 
 
+class ProductClassRegistry(object):
+    """
+    In-process registry of product classes, keyed by ID.
+
+    There are only a handful of product classes, and they are practically never modified, so all of them are
+    loaded at once the first time one is needed, and kept along with the version of the registry they were loaded
+    with. The version is kept in TieredCache, and changed whenever a product class is saved or deleted, so that
+    every process reloads them. They are also reloaded when an unknown ID is requested.
+    """
+    VERSION_KEY = 'product_class_registry_version'
+
+    _product_classes = (None, {})
+
+    @classmethod
+    def get(cls, product_class_id):
+        """ Returns the product class with the given ID, or None if there is no such product class. """
+        if product_class_id is None:
+            return None
+
+        version = cls.get_version()
+        cached_version, product_classes = cls._product_classes
+        if cached_version != version or product_class_id not in product_classes:
+            product_classes = ProductClass.objects.in_bulk()
+            cls._product_classes = (version, product_classes)
+        return product_classes.get(product_class_id)
+
+    @classmethod
+    def get_version(cls):
+        """
+        Returns the version of the product classes cached in process memory.
+
+        Returns:
+            str: The current version.
+        """
+        cached_response = TieredCache.get_cached_response(cls.VERSION_KEY)
+        if cached_response.is_found:
+            return cached_response.value
+
+        version = uuid.uuid4().hex
+        TieredCache.set_all_tiers(cls.VERSION_KEY, version, None)
+        return version
+
+    @classmethod
+    def clear(cls):
+        """ Clears the product classes cached in the memory of every process. """
+        TieredCache.delete_all_tiers(cls.VERSION_KEY)
+        cls._product_classes = (None, {})
+
+
 class Product(AbstractProduct):
     course = models.ForeignKey(
         'courses.Course', null=True, blank=True, related_name='products', on_delete=models.CASCADE
@@ -24,6 +76,17 @@ class Product(AbstractProduct):
                                    help_text=_('Last date/time on which this product can be purchased.'))
     original_expires = None
 
+    def get_product_class(self):
+        """
+        Return a product's item class. Child products inherit their parent's.
+
+        The class is served from the product class registry, so this only hits the database to fetch the parent
+        of a child product, if it was not selected along with the product.
+        """
+        product = self.parent if self.is_child else self
+        return ProductClassRegistry.get(product.product_class_id)
+    get_product_class.short_description = _("Product class")
+
     @property
     def is_seat_product(self):
         return self.get_product_class().name == SEAT_PRODUCT_CLASS_NAME
@@ -99,6 +162,67 @@ def update_enrollment_code(sender, **kwargs):  # pylint: disable=unused-argument
         instance.original_expires = instance.expires
 
 
+@receiver(post_save, sender='catalogue.ProductClass')
+@receiver(post_delete, sender='catalogue.ProductClass')
+def clear_product_class_registry(sender, **kwargs):  # pylint: disable=unused-argument
+    """Clears the product class registry of every process when a product class is modified."""
+    ProductClassRegistry.clear()
+
+
+class SeatAttributes(models.Model):
+    """
+    Denormalized copy of the course related attributes of a product.
+
+    Oscar stores product attributes as entity-attribute-value rows, so every attribute used to filter products
+    adds two joins, and reading `product.attr` loads all attribute values of the product. These columns are
+    kept in sync with the attribute values of the product by signal handlers, can be filtered on with indexes
+    and selected along with the product. Rows of existing products are created by a data migration, and can be
+    rebuilt with the `backfill_seat_attributes` management command.
+    """
+    ATTRIBUTE_CODES = ('course_key', 'certificate_type', 'seat_type', 'id_verification_required', 'credit_provider',)
+
+    product = models.OneToOneField(
+        'catalogue.Product', primary_key=True, related_name='seat_attributes', on_delete=models.CASCADE
+    )
+    course_key = models.CharField(max_length=255, null=True, blank=True)
+    certificate_type = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+    seat_type = models.CharField(max_length=255, null=True, blank=True)
+    id_verification_required = models.NullBooleanField()
+    credit_provider = models.CharField(max_length=255, null=True, blank=True, db_index=True)
+
+    class Meta(object):
+        index_together = (('course_key', 'certificate_type'),)
+        verbose_name_plural = 'seat attributes'
+
+    def __unicode__(self):
+        return u'{product_id}: {course_key} {certificate_type}'.format(
+            product_id=self.product_id,
+            course_key=self.course_key,
+            certificate_type=self.certificate_type
+        )
+
+
+@receiver(post_save, sender='catalogue.ProductAttributeValue')
+def save_seat_attribute(sender, **kwargs):  # pylint: disable=unused-argument
+    """Copies a saved course related attribute value of a product to its seat attributes."""
+    instance = kwargs['instance']
+    code = instance.attribute.code
+    if code in SeatAttributes.ATTRIBUTE_CODES:
+        SeatAttributes.objects.update_or_create(product_id=instance.product_id, defaults={code: instance.value})
+
+
+@receiver(post_delete, sender='catalogue.ProductAttributeValue')
+def delete_seat_attribute(sender, **kwargs):  # pylint: disable=unused-argument
+    """Clears a deleted course related attribute value of a product from its seat attributes.
+
+    The row is only updated, never created, as the product itself may be in the process of being deleted.
+    """
+    instance = kwargs['instance']
+    code = instance.attribute.code
+    if code in SeatAttributes.ATTRIBUTE_CODES:
+        SeatAttributes.objects.filter(product_id=instance.product_id).update(**{code: None})
+
+
 class Catalog(models.Model):
     name = models.CharField(max_length=255)
     partner = models.ForeignKey('partner.Partner', related_name='catalogs', on_delete=models.CASCADE)
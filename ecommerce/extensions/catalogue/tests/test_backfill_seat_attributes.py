@@ -0,0 +1,28 @@
+from __future__ import unicode_literals
+
+from django.core.management import call_command
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.catalogue.tests.mixins import DiscoveryTestMixin
+from ecommerce.tests.testcases import TestCase
+
+SeatAttributes = get_model('catalogue', 'SeatAttributes')
+
+
+class BackfillSeatAttributesTests(DiscoveryTestMixin, TestCase):
+    """Tests the backfill seat attributes command."""
+
+    def test_backfill(self):
+        """Verify the command creates missing seat attributes and repairs stale ones, in batches."""
+        course, seat, enrollment_code = self.create_course_seat_and_enrollment_code(seat_type='verified')
+        __, other_seat = self.create_course_and_seat(seat_type='professional')
+        SeatAttributes.objects.filter(product__in=[seat, enrollment_code]).delete()
+        SeatAttributes.objects.filter(product=other_seat).update(certificate_type='honor')
+
+        call_command('backfill_seat_attributes', batch_size=1)
+
+        seat_attributes = SeatAttributes.objects.get(product=seat)
+        self.assertEqual(seat_attributes.course_key, course.id)
+        self.assertEqual(seat_attributes.certificate_type, 'verified')
+        self.assertEqual(SeatAttributes.objects.get(product=enrollment_code).seat_type, 'verified')
+        self.assertEqual(SeatAttributes.objects.get(product=other_seat).certificate_type, 'professional')
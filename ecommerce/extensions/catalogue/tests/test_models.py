@@ -1,16 +1,19 @@
 import ddt
 from django.core.exceptions import ValidationError
 from django.utils.timezone import now, timedelta
+from edx_django_utils.cache import TieredCache
 from oscar.core.loading import get_model
 from oscar.test import factories
 
 from ecommerce.coupons.tests.mixins import CouponMixin
+from ecommerce.extensions.catalogue.models import ProductClassRegistry
 from ecommerce.extensions.catalogue.tests.mixins import DiscoveryTestMixin
 from ecommerce.extensions.voucher.models import CouponVouchers
 from ecommerce.tests.testcases import TestCase
 
 Product = get_model('catalogue', 'Product')
 ProductClass = get_model('catalogue', 'ProductClass')
+SeatAttributes = get_model('catalogue', 'SeatAttributes')
 
 
 @ddt.ddt
@@ -109,3 +112,69 @@ class ProductTests(CouponMixin, DiscoveryTestMixin, TestCase):
 
         exception = ve.exception
         self.assertIn('Notification email must be a valid email address.', exception.message)
+
+
+class ProductClassRegistryTests(DiscoveryTestMixin, TestCase):
+    def test_get_product_class(self):
+        """Verify product classes are served from the registry, which is cleared when a product class changes."""
+        __, seat = self.create_course_and_seat()
+        seat = Product.objects.select_related('parent').get(id=seat.id)
+        seat_product_class = self.seat_product_class
+        ProductClassRegistry.clear()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(seat.get_product_class(), seat_product_class)
+            self.assertTrue(seat.is_seat_product)
+            self.assertTrue(seat.parent.is_seat_product)
+            self.assertFalse(seat.is_coupon_product)
+
+        seat_product_class.name = 'Renamed'
+        seat_product_class.save()
+        self.assertEqual(seat.get_product_class().name, 'Renamed')
+        self.assertIsNone(ProductClassRegistry.get(None))
+
+    def test_version(self):
+        """Verify the registry is reloaded when its version is changed, e.g. by another process."""
+        __, seat = self.create_course_and_seat()
+        name = seat.get_product_class().name
+        ProductClass.objects.filter(id=seat.get_product_class().id).update(name='Renamed')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(seat.get_product_class().name, name)
+
+        TieredCache.delete_all_tiers(ProductClassRegistry.VERSION_KEY)
+        with self.assertNumQueries(1):
+            self.assertEqual(seat.get_product_class().name, 'Renamed')
+
+
+class SeatAttributesTests(DiscoveryTestMixin, TestCase):
+    def test_seat_attributes_sync(self):
+        """Verify the seat attributes follow the course related attribute values of products."""
+        course, seat, enrollment_code = self.create_course_seat_and_enrollment_code(
+            seat_type='verified', id_verification=True
+        )
+
+        seat_attributes = SeatAttributes.objects.get(product=seat)
+        self.assertEqual(seat_attributes.course_key, course.id)
+        self.assertEqual(seat_attributes.certificate_type, 'verified')
+        self.assertTrue(seat_attributes.id_verification_required)
+        self.assertIsNone(seat_attributes.seat_type)
+
+        enrollment_code_attributes = SeatAttributes.objects.get(product=enrollment_code)
+        self.assertEqual(enrollment_code_attributes.course_key, course.id)
+        self.assertEqual(enrollment_code_attributes.seat_type, 'verified')
+        self.assertIsNone(enrollment_code_attributes.certificate_type)
+
+        seat.attr.credit_provider = 'test-provider'
+        seat.save()
+        self.assertEqual(SeatAttributes.objects.get(product=seat).credit_provider, 'test-provider')
+
+        seat.attr.credit_provider = None
+        seat.save()
+        self.assertIsNone(SeatAttributes.objects.get(product=seat).credit_provider)
+
+    def test_seat_attributes_deleted_with_product(self):
+        """Verify the seat attributes of a product are deleted along with it."""
+        __, seat = self.create_course_and_seat()
+        seat.delete()
+        self.assertFalse(SeatAttributes.objects.filter(product_id=seat.id).exists())
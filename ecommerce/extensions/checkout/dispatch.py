@@ -0,0 +1,93 @@
+from __future__ import unicode_literals
+
+import logging
+import time
+
+import newrelic.agent
+from django.conf import settings
+from django.db import transaction
+from oscar.core.loading import get_class
+
+from ecommerce.core.background import BackgroundPool
+
+logger = logging.getLogger(__name__)
+post_checkout = get_class('checkout.signals', 'post_checkout')
+
+METRIC_PREFIX = 'Custom/PostCheckout'
+
+# Receivers are never dropped, since they send emails and track orders, so only the number of threads is bounded.
+post_checkout_pool = BackgroundPool('post_checkout', settings.POST_CHECKOUT_BACKGROUND_MAX_WORKERS)
+
+
+def get_receiver_path(receiver):
+    """ Returns the dotted path of a signal receiver, e.g. ecommerce.sailthru.signals.process_checkout_complete. """
+    return '{}.{}'.format(receiver.__module__, getattr(receiver, '__name__', type(receiver).__name__))
+
+
+def record_receiver_metric(receiver_path, name, value):
+    """ Records a custom metric of a post_checkout receiver, from a request or a background thread. """
+    newrelic.agent.record_custom_metric(
+        '{}/{}/{}'.format(METRIC_PREFIX, receiver_path, name), value, application=newrelic.agent.application()
+    )
+
+
+def run_receiver(receiver, sender, **named):
+    """
+    Calls a post_checkout receiver, recording how long it took, and whether it failed.
+
+    Exceptions raised by the receiver are re-raised.
+    """
+    receiver_path = get_receiver_path(receiver)
+    start = time.time()
+    try:
+        receiver(signal=post_checkout, sender=sender, **named)
+    except Exception:
+        record_receiver_metric(receiver_path, 'Failures', 1)
+        raise
+    finally:
+        record_receiver_metric(receiver_path, 'Duration', time.time() - start)
+
+
+def run_receiver_in_background(receiver, sender, **named):
+    """
+    Calls a post_checkout receiver in the background thread pool. Failures are logged, not raised.
+
+    Returns:
+        AsyncResult: The result of the receiver.
+    """
+    def run():
+        try:
+            run_receiver(receiver, sender, **named)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                'Post-checkout receiver [%s] failed for order [%s].',
+                get_receiver_path(receiver),
+                named['order'].number
+            )
+
+    return post_checkout_pool.submit(run)
+
+
+def send_post_checkout(sender, order, request=None, email_opt_in=False):
+    """
+    Sends the post_checkout signal for a placed order.
+
+    The receivers in POST_CHECKOUT_BACKGROUND_RECEIVERS do not fulfill the order (e.g. tracking
+    and emails). They are run concurrently in a bounded pool of background threads once the order
+    is committed, so that the receipt page waits on the fulfillment of the order only. The other
+    receivers are run synchronously, in order, with their exceptions propagated as by
+    post_checkout.send().
+    """
+    named = {'order': order, 'request': request, 'email_opt_in': email_opt_in}
+    background_receivers = []
+
+    for receiver in post_checkout._live_receivers(sender):  # pylint: disable=protected-access
+        if get_receiver_path(receiver) in settings.POST_CHECKOUT_BACKGROUND_RECEIVERS:
+            background_receivers.append(receiver)
+        else:
+            run_receiver(receiver, sender, **named)
+
+    if background_receivers:
+        transaction.on_commit(lambda: [
+            run_receiver_in_background(receiver, sender, **named) for receiver in background_receivers
+        ])
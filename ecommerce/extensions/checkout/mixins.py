@@ -6,29 +6,29 @@ import logging
 
 import waffle
 from django.db import transaction
-from ecommerce_worker.fulfillment.v1.tasks import fulfill_order
 from oscar.apps.checkout.mixins import OrderPlacementMixin
-from oscar.core.loading import get_class, get_model
+from oscar.core.loading import get_model
 
 from ecommerce.core.models import BusinessClient
+from ecommerce.core.read_replica import is_read_replica_configured, pin_to_primary
 from ecommerce.extensions.analytics.utils import audit_log, track_segment_event
 from ecommerce.extensions.api import data as data_api
 from ecommerce.extensions.basket.constants import EMAIL_OPT_IN_ATTRIBUTE
 from ecommerce.extensions.basket.utils import ORGANIZATION_ATTRIBUTE_TYPE
+from ecommerce.extensions.checkout.dispatch import send_post_checkout
 from ecommerce.extensions.checkout.exceptions import BasketNotFreeError
 from ecommerce.extensions.customer.utils import Dispatcher
 from ecommerce.extensions.offer.constants import OFFER_ASSIGNED, OFFER_ASSIGNMENT_REVOKED, OFFER_REDEEMED
 from ecommerce.extensions.order.constants import PaymentEventTypeName
+from ecommerce.extensions.order.outbox import enqueue_fulfillment
 from ecommerce.invoice.models import Invoice
+from ecommerce.notifications.templates import get_notification_templates
 
 CommunicationEventType = get_model('customer', 'CommunicationEventType')
 logger = logging.getLogger(__name__)
 Basket = get_model('basket', 'Basket')
-BasketAttribute = get_model('basket', 'BasketAttribute')
-BasketAttributeType = get_model('basket', 'BasketAttributeType')
 OfferAssignment = get_model('offer', 'OfferAssignment')
 Order = get_model('order', 'Order')
-post_checkout = get_class('checkout.signals', 'post_checkout')
 PaymentEvent = get_model('order', 'PaymentEvent')
 PaymentEventType = get_model('order', 'PaymentEventType')
 Source = get_model('payment', 'Source')
@@ -159,13 +159,7 @@ class EdxOrderPlacementMixin(OrderPlacementMixin):
         )
 
         # Check for the user's email opt in preference, defaulting to false if it hasn't been set
-        try:
-            email_opt_in = BasketAttribute.objects.get(
-                basket=order.basket,
-                attribute_type=BasketAttributeType.objects.get(name=EMAIL_OPT_IN_ATTRIBUTE),
-            ).value_text == 'True'
-        except BasketAttribute.DoesNotExist:
-            email_opt_in = False
+        email_opt_in = order.basket.get_attribute(EMAIL_OPT_IN_ATTRIBUTE) == 'True'
 
         # create offer assignment for MULTI_USE_PER_CUSTOMER
         self.create_assignments_for_multi_use_per_customer(order)
@@ -173,18 +167,18 @@ class EdxOrderPlacementMixin(OrderPlacementMixin):
         # update offer assignment with voucher application
         self.update_assigned_voucher_offer_assignment(order)
 
+        # Orders are also placed while handling GET requests (e.g. PayPal payment executions, and free checkouts),
+        # which ReadReplicaPinningMiddleware does not pin. Pinning here ensures the user sees the order they placed.
+        if is_read_replica_configured():
+            pin_to_primary(order.user)
+
         if waffle.sample_is_active('async_order_fulfillment'):
-            # Always commit transactions before sending tasks depending on state from the current transaction!
-            # There's potential for a race condition here if the task starts executing before the active
-            # transaction has been committed; the necessary order doesn't exist in the database yet.
-            # See http://celery.readthedocs.org/en/latest/userguide/tasks.html#database-transactions.
-            fulfill_order.delay(
-                order.number,
-                site_code=order.site.siteconfiguration.partner.short_code,
-                email_opt_in=email_opt_in
-            )
+            # The fulfillment task is published from an outbox entry written in the current transaction, once it is
+            # committed, so that the task never runs before the order exists in the database. Entries that fail to
+            # be published are retried by the dispatch_fulfillment_outbox command.
+            enqueue_fulfillment(order, order.site.siteconfiguration.partner.short_code, email_opt_in=email_opt_in)
         else:
-            post_checkout.send(sender=self, order=order, request=request, email_opt_in=email_opt_in)
+            send_post_checkout(self, order, request=request, email_opt_in=email_opt_in)
 
         return order
 
@@ -239,10 +233,10 @@ class EdxOrderPlacementMixin(OrderPlacementMixin):
             # type and render them immediately to get the messages.  Since we
             # have not CommunicationEventType to link to, we can't create a
             # CommunicationEvent instance.
-            messages = CommunicationEventType.objects.get_and_render(code, ctx)
+            messages = get_notification_templates(CommunicationEventType(code=code), site).render(ctx)
             event_type = None
         else:
-            messages = event_type.get_messages(ctx)
+            messages = get_notification_templates(event_type, site).render(ctx)
 
         if messages and messages['body']:
             logger.info("Order #%s - sending %s messages", order.number, code)
@@ -267,16 +261,9 @@ class EdxOrderPlacementMixin(OrderPlacementMixin):
             line.product.is_enrollment_code_product for line in order.basket.all_lines()
         )
 
-        organization_attribute = BasketAttributeType.objects.filter(name=ORGANIZATION_ATTRIBUTE_TYPE).first()
-        if not organization_attribute:
-            return None
-
-        business_client = BasketAttribute.objects.filter(
-            basket=order.basket,
-            attribute_type=organization_attribute,
-        ).first()
+        business_client = order.basket.get_attribute(ORGANIZATION_ATTRIBUTE_TYPE)
         if basket_has_enrollment_code_product and business_client:
-            client, __ = BusinessClient.objects.get_or_create(name=business_client.value_text)
+            client, __ = BusinessClient.objects.get_or_create(name=business_client)
             Invoice.objects.create(
                 order=order, business_client=client, type=Invoice.BULK_PURCHASE, state=Invoice.PAID
             )
@@ -2,7 +2,7 @@ import logging
 
 import waffle
 from django.dispatch import receiver
-from oscar.core.loading import get_class, get_model
+from oscar.core.loading import get_class
 
 from ecommerce.courses.utils import mode_for_product
 from ecommerce.extensions.analytics.utils import silence_exceptions, track_segment_event
@@ -10,8 +10,6 @@ from ecommerce.extensions.checkout.utils import get_credit_provider_details, get
 from ecommerce.notifications.notifications import send_notification
 from ecommerce.programs.utils import get_program
 
-BasketAttribute = get_model('basket', 'BasketAttribute')
-BasketAttributeType = get_model('basket', 'BasketAttributeType')
 BUNDLE = 'bundle_identifier'
 logger = logging.getLogger(__name__)
 post_checkout = get_class('checkout.signals', 'post_checkout')
@@ -70,8 +68,8 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
     coupon = voucher.voucher_code if voucher else None
     properties['coupon'] = coupon
 
-    try:
-        bundle_id = BasketAttribute.objects.get(basket=order.basket, attribute_type__name=BUNDLE).value_text
+    bundle_id = order.basket.get_attribute(BUNDLE)
+    if bundle_id:
         program = get_program(bundle_id, order.basket.site.siteconfiguration)
         if len(order.lines.all()) < len(program.get('courses')):
             variant = 'partial'
@@ -86,7 +84,7 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
             'name': program.get('title')
         }
         properties['products'].append(bundle_product)
-    except BasketAttribute.DoesNotExist:
+    else:
         logger.info('There is no program or bundle associated with order number %s', order.number)
 
     track_segment_event(order.site, order.user, 'Order Completed', properties)
@@ -0,0 +1,140 @@
+import mock
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import override_settings
+from django.utils.module_loading import import_string
+from oscar.test.factories import BasketFactory, create_order
+
+from ecommerce.core.tests import toggle_switch
+from ecommerce.courses.tests.factories import CourseFactory
+from ecommerce.extensions.checkout.dispatch import post_checkout, run_receiver, send_post_checkout
+from ecommerce.tests.testcases import TestCase
+
+CALLS = []
+DISPATCH = 'ecommerce.extensions.checkout.dispatch'
+
+
+def fulfill(sender, order=None, **kwargs):  # pylint: disable=unused-argument
+    CALLS.append(('fulfill', order.number))
+
+
+def track(sender, order=None, **kwargs):  # pylint: disable=unused-argument
+    CALLS.append(('track', order.number))
+
+
+def fail(sender, order=None, **kwargs):  # pylint: disable=unused-argument
+    raise ValueError('Failed')
+
+
+@override_settings(POST_CHECKOUT_BACKGROUND_RECEIVERS=(
+    'ecommerce.extensions.checkout.tests.test_dispatch.track',
+    'ecommerce.extensions.checkout.tests.test_dispatch.fail',
+))
+class SendPostCheckoutTests(TestCase):
+    def setUp(self):
+        super(SendPostCheckoutTests, self).setUp()
+        del CALLS[:]
+        self.order = create_order()
+
+    def send(self, receivers):
+        """ Sends post_checkout to the given receivers, returning the function run once the order is committed. """
+        with mock.patch.object(post_checkout, '_live_receivers', return_value=receivers):
+            with mock.patch(DISPATCH + '.transaction.on_commit') as on_commit:
+                send_post_checkout(self, self.order)
+        return on_commit.call_args[0][0] if on_commit.called else None
+
+    def test_background_receivers_run_after_commit(self):
+        """ Fulfillment receivers should run immediately, others in the background once the order is committed. """
+        on_commit = self.send([fulfill, track])
+        self.assertEqual(CALLS, [('fulfill', self.order.number)])
+
+        for result in on_commit():
+            result.wait()
+        self.assertEqual(CALLS, [('fulfill', self.order.number), ('track', self.order.number)])
+
+    def test_no_background_receivers(self):
+        """ Nothing should be deferred if all receivers fulfill the order. """
+        self.assertIsNone(self.send([fulfill]))
+        self.assertEqual(CALLS, [('fulfill', self.order.number)])
+
+    @mock.patch(DISPATCH + '.newrelic.agent.record_custom_metric')
+    def test_background_failure(self, mock_record):
+        """ Failures of background receivers should be logged and recorded, without affecting other receivers. """
+        on_commit = self.send([fail, track])
+        with mock.patch(DISPATCH + '.logger.exception') as mock_log:
+            for result in on_commit():
+                result.wait()
+
+        self.assertEqual(CALLS, [('track', self.order.number)])
+        mock_log.assert_called_once_with(
+            'Post-checkout receiver [%s] failed for order [%s].',
+            'ecommerce.extensions.checkout.tests.test_dispatch.fail', self.order.number
+        )
+        metrics = [call[0][0] for call in mock_record.call_args_list]
+        self.assertIn('Custom/PostCheckout/ecommerce.extensions.checkout.tests.test_dispatch.fail/Failures', metrics)
+        self.assertIn('Custom/PostCheckout/ecommerce.extensions.checkout.tests.test_dispatch.track/Duration', metrics)
+
+    @override_settings(POST_CHECKOUT_BACKGROUND_RECEIVERS=())
+    @mock.patch(DISPATCH + '.newrelic.agent.record_custom_metric')
+    def test_fulfillment_failure(self, mock_record):
+        """ Failures of receivers run synchronously should be recorded and raised. """
+        with self.assertRaises(ValueError):
+            self.send([fail, track])
+
+        self.assertEqual(CALLS, [])
+        metrics = [call[0][0] for call in mock_record.call_args_list]
+        self.assertEqual(metrics, [
+            'Custom/PostCheckout/ecommerce.extensions.checkout.tests.test_dispatch.fail/Failures',
+            'Custom/PostCheckout/ecommerce.extensions.checkout.tests.test_dispatch.fail/Duration',
+        ])
+
+
+@override_settings(POST_CHECKOUT_BACKGROUND_RECEIVERS=(
+    'ecommerce.extensions.checkout.signals.track_completed_order',
+    'ecommerce.extensions.checkout.signals.send_course_purchase_email',
+    'ecommerce.sailthru.signals.process_checkout_complete',
+))
+class BackgroundReceiversTests(TestCase):
+    """ Tests of the receivers run in the background, in threads without a current request. """
+
+    def setUp(self):
+        super(BackgroundReceiversTests, self).setUp()
+        toggle_switch('sailthru_enable', True)
+        self.site_configuration.enable_sailthru = True
+        self.site_configuration.save()
+
+        course = CourseFactory(id='edX/toy/2012_Fall', partner=self.partner)
+        seat = course.create_or_update_seat('verified', False, 99, None)
+        basket = BasketFactory(owner=self.create_user(), site=self.site)
+        basket.add_product(seat, 1)
+        self.order = create_order(basket=basket, user=basket.owner, site=self.site)
+        self.connection = connections[DEFAULT_DB_ALIAS]
+
+    def run_receiver_sharing_connection(self, *args, **kwargs):
+        """ Runs a receiver on the connection of the test, since the in-memory database is per connection. """
+        connections[DEFAULT_DB_ALIAS] = self.connection
+        try:
+            run_receiver(*args, **kwargs)
+        finally:
+            del connections[DEFAULT_DB_ALIAS]
+
+    @mock.patch('ecommerce.sailthru.signals.update_course_enrollment.delay')
+    def test_receivers(self, mock_update_course_enrollment):
+        """ The configured receivers should succeed in the background, building URLs from the site of the order. """
+        receivers = [import_string(path) for path in settings.POST_CHECKOUT_BACKGROUND_RECEIVERS]
+        with mock.patch.object(post_checkout, '_live_receivers', return_value=receivers):
+            with mock.patch(DISPATCH + '.transaction.on_commit') as on_commit:
+                send_post_checkout(self, self.order, request=self.request)
+
+        with mock.patch.object(connection, 'allow_thread_sharing', True), \
+                mock.patch(DISPATCH + '.run_receiver', self.run_receiver_sharing_connection), \
+                mock.patch(DISPATCH + '.logger.exception') as mock_log:
+            for result in on_commit.call_args[0][0]():
+                result.wait()
+
+        self.assertFalse(mock_log.called)
+        self.assertTrue(mock_update_course_enrollment.called)
+        self.assertEqual(
+            mock_update_course_enrollment.call_args[0][1],
+            'http://lms.testserver.fake/courses/edX/toy/2012_Fall/info'
+        )
@@ -12,6 +12,7 @@ from waffle.models import Sample
 
 from ecommerce.core.constants import ENROLLMENT_CODE_PRODUCT_CLASS_NAME, ENROLLMENT_CODE_SWITCH
 from ecommerce.core.models import BusinessClient, SegmentClient
+from ecommerce.core.read_replica import is_pinned_to_primary
 from ecommerce.core.tests import toggle_switch
 from ecommerce.courses.tests.factories import CourseFactory
 from ecommerce.extensions.analytics.utils import (
@@ -175,6 +176,13 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, PaymentEventsMixin,
                 )
             )
 
+    @mock.patch('ecommerce.extensions.checkout.mixins.is_read_replica_configured', mock.Mock(return_value=True))
+    def test_handle_successful_order_pins_user(self, __):
+        """ Users should read from the primary database after placing an order, whatever the request method. """
+        self.assertFalse(is_pinned_to_primary(self.order.user))
+        EdxOrderPlacementMixin().handle_successful_order(self.order)
+        self.assertTrue(is_pinned_to_primary(self.order.user))
+
     def test_handle_post_order_for_bulk_purchase(self, __):
         """
         Ensure that the bulk purchase order is linked to the provided business
@@ -284,19 +292,32 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, PaymentEventsMixin,
             sample.percent = 100.0
             sample.save()
 
-        with mock.patch('ecommerce.extensions.checkout.mixins.fulfill_order.delay') as mock_delay:
-            EdxOrderPlacementMixin().handle_successful_order(self.order)
-            mock_delay.assert_called_once_with(self.order.number, site_code=self.partner.short_code, email_opt_in=False)
+        with mock.patch('ecommerce.extensions.order.outbox.transaction.on_commit') as mock_on_commit:
+            with mock.patch('ecommerce.extensions.order.outbox.fulfill_order.apply_async') as mock_apply_async:
+                EdxOrderPlacementMixin().handle_successful_order(self.order)
+                self.assertFalse(mock_apply_async.called)
+
+                # The task should only be published once the order is committed.
+                mock_on_commit.call_args[0][0]()
+                mock_apply_async.assert_called_once_with(
+                    args=(self.order.number,),
+                    kwargs={'site_code': self.partner.short_code, 'email_opt_in': False},
+                    producer=mock.ANY
+                )
+
+        entry = self.order.fulfillment_outbox_entry
+        entry.refresh_from_db()
+        self.assertEqual(entry.attempts, 1)
+        self.assertIsNone(entry.acknowledged)
 
     def test_handle_successful_order_no_email_opt_in(self, _):
         """
         Verify that the post checkout defaults email_opt_in to false.
         """
-        with mock.patch('ecommerce.extensions.checkout.mixins.post_checkout.send') as mock_send:
+        with mock.patch('ecommerce.extensions.checkout.mixins.send_post_checkout') as mock_send:
             mixin = EdxOrderPlacementMixin()
             mixin.handle_successful_order(self.order)
-            send_arguments = {'sender': mixin, 'order': self.order, 'request': None, 'email_opt_in': False}
-            mock_send.assert_called_once_with(**send_arguments)
+            mock_send.assert_called_once_with(mixin, self.order, request=None, email_opt_in=False)
 
     @ddt.data(True, False)
     def test_handle_successful_order_with_email_opt_in(self, expected_opt_in, _):
@@ -309,16 +330,10 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, PaymentEventsMixin,
             value_text=expected_opt_in,
         )
 
-        with mock.patch('ecommerce.extensions.checkout.mixins.post_checkout.send') as mock_send:
+        with mock.patch('ecommerce.extensions.checkout.mixins.send_post_checkout') as mock_send:
             mixin = EdxOrderPlacementMixin()
             mixin.handle_successful_order(self.order)
-            send_arguments = {
-                'sender': mixin,
-                'order': self.order,
-                'request': None,
-                'email_opt_in': expected_opt_in,
-            }
-            mock_send.assert_called_once_with(**send_arguments)
+            mock_send.assert_called_once_with(mixin, self.order, request=None, email_opt_in=expected_opt_in)
 
     def test_place_free_order(self, __):
         """ Verify an order is placed and the basket is submitted. """
@@ -364,15 +379,13 @@ class EdxOrderPlacementMixinTests(BusinessIntelligenceMixin, PaymentEventsMixin,
         self.assertEqual(len(mail.outbox), 0)
 
         # Invalid messages container path (graceful exit)
-        with mock.patch('ecommerce.extensions.checkout.mixins.CommunicationEventType.objects.get') as mock_get:
-            mock_event_type = mock.Mock()
-            mock_event_type.get_messages.return_value = {}
-            mock_get.return_value = mock_event_type
+        with mock.patch('ecommerce.extensions.checkout.mixins.get_notification_templates') as mock_get_templates:
+            mock_templates = mock_get_templates.return_value
+            mock_templates.render.return_value = {}
             mixin.send_confirmation_message(order, 'ORDER_PLACED', request.site)
             self.assertEqual(len(mail.outbox), 0)
 
-            mock_event_type.get_messages.return_value = {'body': None}
-            mock_get.return_value = mock_event_type
+            mock_templates.render.return_value = {'body': None}
             mixin.send_confirmation_message(order, 'ORDER_PLACED', request.site)
             self.assertEqual(len(mail.outbox), 0)
 
@@ -26,9 +26,8 @@ from ecommerce.extensions.checkout.utils import get_receipt_page_url
 
 Applicator = get_class('offer.applicator', 'Applicator')
 Basket = get_model('basket', 'Basket')
-BasketAttribute = get_model('basket', 'BasketAttribute')
-BasketAttributeType = get_model('basket', 'BasketAttributeType')
 Order = get_model('order', 'Order')
+BUNDLE = 'bundle_identifier'
 
 
 def get_program_uuid(order):
@@ -41,12 +40,7 @@ def get_program_uuid(order):
     Returns:
         string: The program UUID if the order is associated with a bundled purchase, otherwise None.
     """
-    bundle_attributes = BasketAttribute.objects.filter(
-        basket=order.basket,
-        attribute_type=BasketAttributeType.objects.get(name='bundle_identifier')
-    )
-    bundle_attribute = bundle_attributes.first()
-    return bundle_attribute.value_text if bundle_attribute else None
+    return order.basket.get_attribute(BUNDLE)
 
 
 class FreeCheckoutView(EdxOrderPlacementMixin, RedirectView):
@@ -2,7 +2,7 @@ import os
 from unittest import skipIf
 
 from django.contrib.messages import constants as MSG
-from django.test import override_settings
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 from nose.plugins.skip import SkipTest
 from oscar.core.loading import get_model
@@ -11,7 +11,7 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.firefox.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
 
-from ecommerce.extensions.dashboard.orders.views import queryset_orders_for_user
+from ecommerce.extensions.dashboard.orders.views import OrderListView, queryset_orders_for_user
 from ecommerce.extensions.dashboard.tests import DashboardViewTestMixin
 from ecommerce.extensions.fulfillment.signals import SHIPPING_EVENT_NAME
 from ecommerce.extensions.fulfillment.status import LINE, ORDER
@@ -262,6 +262,66 @@ class OrderDetailViewBrowserTests(OrderViewTestsMixin, RefundTestMixin, OrderVie
         self.assert_retry_fulfillment_failed(self.order.number)
 
 
+class OrderListViewTests(TestCase):
+    def setUp(self):
+        super(OrderListViewTests, self).setUp()
+        self.user = self.create_user(username='learner', email='learner@example.com', first_name='Ada',
+                                     last_name='Lovelace')
+        self.order = create_order(user=self.user)
+        self.other_order = create_order(user=self.create_user(username='other', email='other@example.com'))
+
+    def get_view(self, **params):
+        view = OrderListView()
+        view.request = RequestFactory().get('/', params)
+        view.request.user = self.create_user(is_staff=True)
+        view.base_queryset = queryset_orders_for_user(view.request.user)
+        view.kwargs = {}
+        return view
+
+    def assert_search_results(self, expected, **params):
+        self.assertEqual(list(self.get_view(**params).get_queryset()), expected)
+
+    def test_search(self):
+        """ Orders should be searched for with the order search index. """
+        line = self.order.lines.first()
+        self.assert_search_results([self.order], username='LEARN')
+        self.assert_search_results([self.order], email='learner@')
+        self.assert_search_results([self.order], order_number=self.order.number)
+        self.assert_search_results([self.order], partner_sku=line.partner_sku, username='learner')
+        self.assert_search_results([], partner_sku=line.partner_sku[:-1], username='learner')
+        self.assert_search_results([self.order], name='Ada Lovelace')
+        self.assert_search_results([self.order], name='lovelace')
+
+    def test_keyset_pagination(self):
+        """ Orders should be paginated by ID, latest first, with links to the previous and next pages. """
+        orders = [self.order, self.other_order, create_order()]
+        view = self.get_view(username='')
+
+        __, page, objects, is_paginated = view.paginate_queryset(Order.objects.all(), 2)
+        self.assertEqual(objects, orders[:0:-1])
+        self.assertTrue(is_paginated)
+        self.assertIsNone(page.previous_url)
+        self.assertEqual(page.next_url, '?username=&after={}'.format(orders[1].id))
+
+        view = self.get_view(after=orders[1].id)
+        __, page, objects, __ = view.paginate_queryset(Order.objects.all(), 2)
+        self.assertEqual(objects, [orders[0]])
+        self.assertEqual(page.previous_url, '?before={}'.format(orders[0].id))
+        self.assertIsNone(page.next_url)
+
+        view = self.get_view(before=orders[0].id)
+        __, page, objects, __ = view.paginate_queryset(Order.objects.all(), 2)
+        self.assertEqual(objects, orders[:0:-1])
+        self.assertIsNone(page.previous_url)
+        self.assertEqual(page.next_url, '?after={}'.format(orders[1].id))
+
+    def test_sorted_pagination(self):
+        """ Sorted orders should be paginated by page number. """
+        paginator, page, __, __ = self.get_view(sort='number').paginate_queryset(Order.objects.all(), 1)
+        self.assertEqual(paginator.count, 2)
+        self.assertEqual(page.number, 1)
+
+
 class HelperMethodTests(TestCase):
     def test_queryset_orders_for_user_select_related(self):
         """ Verify the method only selects the related user. """
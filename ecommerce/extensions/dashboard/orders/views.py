@@ -1,14 +1,21 @@
+import datetime
+
 from django.contrib import messages
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 from oscar.apps.dashboard.orders.views import OrderDetailView as CoreOrderDetailView
 from oscar.apps.dashboard.orders.views import OrderListView as CoreOrderListView
 from oscar.core.loading import get_model
+from oscar.core.utils import datetime_combine
+from oscar.views import sort_queryset
 
-from ecommerce.extensions.dashboard.views import FilterFieldsMixin
+from ecommerce.core.read_replica import ReadReplicaMixin
+from ecommerce.extensions.dashboard.views import FilterFieldsMixin, KeysetPaginationMixin
 
 Order = get_model('order', 'Order')
+OrderSearchTerm = get_model('order', 'OrderSearchTerm')
 Partner = get_model('partner', 'Partner')
 Refund = get_model('refund', 'Refund')
 
@@ -26,9 +33,19 @@ def queryset_orders_for_user(user):  # pylint: disable=unused-argument
     return Order._default_manager.select_related('user').prefetch_related('lines')  # pylint: disable=protected-access
 
 
-class OrderListView(FilterFieldsMixin, CoreOrderListView):
+class OrderListView(ReadReplicaMixin, KeysetPaginationMixin, FilterFieldsMixin, CoreOrderListView):
     base_queryset = None
     form = None
+    # Search form fields matched against the order search index, with the indexed fields they match, and whether
+    # they match prefixes of their values.
+    search_fields = {
+        'order_number': (OrderSearchTerm.NUMBER, True),
+        'username': (OrderSearchTerm.USERNAME, True),
+        'email': (OrderSearchTerm.EMAIL, True),
+        'product_title': (OrderSearchTerm.PRODUCT_TITLE, True),
+        'upc': (OrderSearchTerm.UPC, False),
+        'partner_sku': (OrderSearchTerm.PARTNER_SKU, False),
+    }
 
     def dispatch(self, request, *args, **kwargs):
         # NOTE: This method is overridden so that we can use our override of `queryset_orders_for_user`.
@@ -40,18 +57,46 @@ class OrderListView(FilterFieldsMixin, CoreOrderListView):
         return super(CoreOrderListView, self).dispatch(request, *args, **kwargs)  # pylint: disable=bad-super-call
 
     def get_queryset(self):
-        queryset = super(OrderListView, self).get_queryset()
+        """
+        Filters orders by the search form.
+
+        Unlike the core view, the names, numbers and products of orders, and their users, are searched for with the
+        order search index, rather than across the joins of orders with their lines and users.
+        """
+        queryset = sort_queryset(self.base_queryset, self.request, ['number', 'total_incl_tax'])
 
         # Note (CCB): We set self.form here because the super method does not always pass request.GET
         # to the form constructor. This results in the form not being populated when re-rendered.
         self.form = self.form_class(self.request.GET)
-        if self.form.is_valid():
-            for field, value in self.form.cleaned_data.iteritems():
-                if value:
-                    _filter = self.get_filter_fields().get(field)
-
-                    if _filter:
-                        queryset = queryset.filter(**{_filter['query_filter']: value})
+        if not self.form.is_valid():
+            return queryset
+
+        data = self.form.cleaned_data
+        for field, (search_field, prefix) in self.search_fields.items():
+            if data.get(field):
+                queryset = queryset.filter(
+                    id__in=OrderSearchTerm.match(search_field, data[field], prefix=prefix).values('order_id')
+                )
+
+        if data['name']:
+            # If the value is two words, then assume they are first name and last name
+            parts = data['name'].split()
+            first_name, last_name = (parts[0], ' '.join(parts[1:])) if len(parts) > 1 else (data['name'],) * 2
+            queryset = queryset.filter(
+                Q(id__in=OrderSearchTerm.match(OrderSearchTerm.FIRST_NAME, first_name).values('order_id')) |
+                Q(id__in=OrderSearchTerm.match(OrderSearchTerm.LAST_NAME, last_name).values('order_id'))
+            )
+
+        if data['date_from']:
+            queryset = queryset.filter(date_placed__gte=datetime_combine(data['date_from'], datetime.time.min))
+        if data['date_to']:
+            queryset = queryset.filter(date_placed__lt=datetime_combine(data['date_to'], datetime.time.max))
+        if data['voucher']:
+            queryset = queryset.filter(discounts__voucher_code=data['voucher']).distinct()
+        if data['payment_method']:
+            queryset = queryset.filter(sources__source_type__code=data['payment_method']).distinct()
+        if data['status']:
+            queryset = queryset.filter(status=data['status'])
 
         return queryset
 
@@ -2,13 +2,14 @@ from django.views.generic import DetailView, ListView
 from oscar.core.loading import get_class, get_model
 from oscar.views import sort_queryset
 
+from ecommerce.core.read_replica import ReadReplicaMixin
 from ecommerce.extensions.dashboard.views import FilterFieldsMixin
 
 Refund = get_model('refund', 'Refund')
 RefundSearchForm = get_class('dashboard.refunds.forms', 'RefundSearchForm')
 
 
-class RefundListView(FilterFieldsMixin, ListView):
+class RefundListView(ReadReplicaMixin, FilterFieldsMixin, ListView):
     """ Dashboard view to list refunds. """
     model = Refund
     context_object_name = 'refunds'
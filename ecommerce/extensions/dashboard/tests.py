@@ -1,8 +1,13 @@
 from django.urls import reverse
+from django.utils.timezone import now
+from oscar.core.loading import get_model
 from oscar.test.factories import OrderFactory, UserFactory
 
+from ecommerce.extensions.dashboard.views import ExtendedIndexView
 from ecommerce.tests.testcases import TestCase
 
+FulfillmentOutboxEntry = get_model('order', 'FulfillmentOutboxEntry')
+
 
 class DashboardViewTestMixin(object):
     def assert_message_equals(self, response, msg, level):  # pylint: disable=unused-argument
@@ -30,3 +35,10 @@ class ExtendedIndexViewTests(TestCase):
         order = OrderFactory()
         actual = response.context['average_paid_order_costs']
         self.assertEqual(actual, order.total_incl_tax)
+
+    def test_pending_fulfillments(self):
+        """ Verify the stats contain the number of orders whose fulfillment was not acknowledged by the worker. """
+        FulfillmentOutboxEntry.objects.create(order=OrderFactory(), site_code='edX')
+        FulfillmentOutboxEntry.objects.create(order=OrderFactory(), site_code='edX', acknowledged=now())
+
+        self.assertEqual(ExtendedIndexView().get_stats()['pending_fulfillments'], 1)
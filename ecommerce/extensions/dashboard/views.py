@@ -1,5 +1,8 @@
+from django.http import Http404
 from oscar.apps.dashboard.views import *  # pylint: disable=wildcard-import, unused-wildcard-import
 
+from ecommerce.extensions.order.outbox import get_pending_entries
+
 
 class ExtendedIndexView(IndexView):
     def get_stats(self):
@@ -39,6 +42,8 @@ class ExtendedIndexView(IndexView):
             'total_products': Product.objects.count(),
 
             'total_vouchers': self.get_active_vouchers().count(),
+
+            'pending_fulfillments': get_pending_entries().count(),
         }
 
         return stats
@@ -67,3 +72,65 @@ class FilterFieldsMixin(object):
         context['exposed_field_ids'] = ['id_{}'.format(field) for field in self.exposed_fields().keys()]
 
         return context
+
+
+class KeysetPage(object):
+    """ Page of a list paginated by the IDs of its objects. """
+
+    def __init__(self, object_list, previous_url=None, next_url=None):
+        self.object_list = object_list
+        self.previous_url = previous_url
+        self.next_url = next_url
+
+    def has_previous(self):
+        return self.previous_url is not None
+
+    def has_next(self):
+        return self.next_url is not None
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+
+class KeysetPaginationMixin(object):
+    """
+    Paginates lists by the IDs of their objects, latest first, rather than by page number.
+
+    Pages are fetched from the ID of the last object of the previous page, or of the first of the next, so that
+    neither counting the objects nor skipping those of the previous pages is needed, however many there are.
+    Lists sorted by another field are still paginated by page number.
+    """
+
+    def get_page_url(self, **params):
+        query = self.request.GET.copy()
+        for param in ('after', 'before', 'page'):
+            query.pop(param, None)
+        query.update(params)
+        return '?{}'.format(query.urlencode())
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.request.GET.get('sort'):
+            return super(KeysetPaginationMixin, self).paginate_queryset(queryset, page_size)
+
+        try:
+            after = int(self.request.GET.get('after', 0))
+            before = int(self.request.GET.get('before', 0))
+        except ValueError:
+            raise Http404
+
+        if before:
+            objects = list(queryset.filter(id__gt=before).order_by('id')[:page_size + 1])
+            has_previous, has_next = len(objects) > page_size, True
+            objects = objects[:page_size][::-1]
+        else:
+            queryset = queryset.filter(id__lt=after) if after else queryset
+            objects = list(queryset.order_by('-id')[:page_size + 1])
+            has_previous, has_next = bool(after), len(objects) > page_size
+            objects = objects[:page_size]
+
+        page = KeysetPage(
+            objects,
+            previous_url=self.get_page_url(before=objects[0].id) if has_previous and objects else None,
+            next_url=self.get_page_url(after=objects[-1].id) if has_next and objects else None,
+        )
+        return None, page, page.object_list, page.has_other_pages()
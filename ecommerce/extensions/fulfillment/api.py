@@ -45,7 +45,7 @@ def fulfill_order(order, lines, email_opt_in=False):
         raise exceptions.IncorrectOrderStatusError(error_msg)
 
     # Construct a dict of lines by their product type.
-    line_items = list(lines.all())
+    line_items = list(lines.all().select_related('product__parent'))
 
     try:
         # Iterate over the Fulfillment Modules defined in our configuration and determine if they support
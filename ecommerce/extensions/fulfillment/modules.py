@@ -7,9 +7,11 @@ import abc
 import datetime
 import json
 import logging
+import operator
 
 import requests
 from django.conf import settings
+from django.db.models import Q, prefetch_related_objects
 from django.urls import reverse
 from edx_rest_api_client.client import EdxRestApiClient
 from oscar.core.loading import get_model
@@ -20,7 +22,6 @@ from ecommerce.core.constants import (
     DONATIONS_FROM_CHECKOUT_TESTS_PRODUCT_TYPE_NAME,
     ENROLLMENT_CODE_PRODUCT_CLASS_NAME
 )
-from ecommerce.core.url_utils import get_lms_enrollment_api_url, get_lms_entitlement_api_url
 from ecommerce.courses.models import Course
 from ecommerce.courses.utils import mode_for_product
 from ecommerce.enterprise.utils import get_or_create_enterprise_customer_user
@@ -171,8 +172,9 @@ class EnrollmentFulfillmentModule(BaseFulfillmentModule):
     Allows the enrollment of a student via purchase of a 'seat'.
     """
 
-    def _post_to_enrollment_api(self, data, user):
-        enrollment_api_url = get_lms_enrollment_api_url()
+    def _post_to_enrollment_api(self, data, user, site):
+        # Built from the site, since lines are also revoked by refunds approved outside of requests.
+        enrollment_api_url = site.siteconfiguration.build_lms_url('/api/enrollment/v1/enrollment')
         timeout = settings.ENROLLMENT_FULFILLMENT_TIMEOUT
         headers = {
             'Content-Type': 'application/json',
@@ -314,7 +316,7 @@ class EnrollmentFulfillmentModule(BaseFulfillmentModule):
 
                 # Post to the Enrollment API. The LMS will take care of posting a new EnterpriseCourseEnrollment to
                 # the Enterprise service if the user+course has a corresponding EnterpriseCustomerUser.
-                response = self._post_to_enrollment_api(data, user=order.user)
+                response = self._post_to_enrollment_api(data, user=order.user, site=order.site)
 
                 if response.status_code == status.HTTP_200_OK:
                     line.set_status(LINE.COMPLETE)
@@ -372,7 +374,7 @@ class EnrollmentFulfillmentModule(BaseFulfillmentModule):
                 },
             }
 
-            response = self._post_to_enrollment_api(data, user=line.order.user)
+            response = self._post_to_enrollment_api(data, user=line.order.user, site=line.order.site)
 
             if response.status_code == status.HTTP_200_OK:
                 audit_log(
@@ -506,23 +508,26 @@ class EnrollmentCodeFulfillmentModule(BaseFulfillmentModule):
         )
         logger.info(msg)
 
-        for line in lines:
-            name = 'Enrollment Code Range for {}'.format(line.product.attr.course_key)
-            seat = Product.objects.filter(
-                attributes__name='course_key',
-                attribute_values__value_text=line.product.attr.course_key
-            ).get(
-                attributes__name='certificate_type',
-                attribute_values__value_text=line.product.attr.seat_type
-            )
-            _range, created = Range.objects.get_or_create(name=name)
-            if created:
-                _range.add_product(seat)
+        prefetch_related_objects(lines, 'product__seat_attributes')
+        seats = self.get_seats(line.product.seat_attributes for line in lines)
+        ranges = self.get_ranges(seats.values())
+        stock_records = self.get_stock_records(seats.values())
+        coupon_catalogs = {}
 
-            stock_record = StockRecord.objects.get(product=seat, partner=seat.course.partner)
-            coupon_catalog = CouponViewSet.get_coupon_catalog([stock_record.id], seat.course.partner)
-            _range.catalog = coupon_catalog
-            _range.save()
+        for line in lines:
+            enrollment_code_attributes = line.product.seat_attributes
+            seat = seats[(enrollment_code_attributes.course_key, enrollment_code_attributes.seat_type)]
+            _range = ranges[seat.id]
+
+            stock_record = stock_records[seat.id]
+            if stock_record.id not in coupon_catalogs:
+                coupon_catalogs[stock_record.id] = CouponViewSet.get_coupon_catalog(
+                    [stock_record.id], seat.course.partner
+                )
+            coupon_catalog = coupon_catalogs[stock_record.id]
+            if _range.catalog_id != coupon_catalog.id:
+                _range.catalog = coupon_catalog
+                _range.save()
 
             vouchers = create_vouchers(
                 name=unicode('Enrollment code voucher [{}]').format(line.product.title),
@@ -540,8 +545,7 @@ class EnrollmentCodeFulfillmentModule(BaseFulfillmentModule):
             )
 
             line_vouchers = OrderLineVouchers.objects.create(line=line)
-            for voucher in vouchers:
-                line_vouchers.vouchers.add(voucher)
+            line_vouchers.vouchers.add(*vouchers)
 
             line.set_status(LINE.COMPLETE)
 
@@ -549,6 +553,91 @@ class EnrollmentCodeFulfillmentModule(BaseFulfillmentModule):
         logger.info("Finished fulfilling 'Enrollment code' product types for order [%s]", order.number)
         return order, lines
 
+    def get_seats(self, enrollment_codes_attributes):
+        """ Returns the seats of the given enrollment codes.
+
+        Args:
+            enrollment_codes_attributes (iterable of SeatAttributes): Seat attributes of the enrollment codes.
+
+        Returns:
+            dict: Seats, keyed by their course key and certificate type.
+
+        Raises:
+            Product.DoesNotExist: If the seat of any of the enrollment codes does not exist.
+            Product.MultipleObjectsReturned: If several seats exist for any of the enrollment codes.
+        """
+        keys = {(attributes.course_key, attributes.seat_type) for attributes in enrollment_codes_attributes}
+        if not keys:
+            return {}
+
+        seats = {}
+        duplicates = set()
+        lookups = [
+            Q(seat_attributes__course_key=course_key, seat_attributes__certificate_type=certificate_type)
+            for course_key, certificate_type in keys
+        ]
+        queryset = Product.objects.filter(reduce(operator.or_, lookups))
+        for seat in queryset.select_related('course__partner', 'seat_attributes'):
+            key = (seat.seat_attributes.course_key, seat.seat_attributes.certificate_type)
+            if key in seats:
+                duplicates.add(key)
+            seats[key] = seat
+
+        if duplicates:
+            raise Product.MultipleObjectsReturned(
+                'Several seats exist for the enrollment codes of {}.'.format(sorted(duplicates))
+            )
+
+        missing = keys.difference(seats)
+        if missing:
+            raise Product.DoesNotExist('No seats exist for the enrollment codes of {}.'.format(sorted(missing)))
+
+        return seats
+
+    def get_stock_records(self, seats):
+        """ Returns the stock records of the given seats from the partners of their courses.
+
+        Args:
+            seats (iterable of Products): Seats of the enrollment codes, with their courses.
+
+        Returns:
+            dict: Stock records, keyed by the ID of their seat.
+
+        Raises:
+            StockRecord.DoesNotExist: If any of the seats has no stock record from the partner of its course.
+        """
+        seats = list(seats)
+        stock_records = {
+            (stock_record.product_id, stock_record.partner_id): stock_record
+            for stock_record in StockRecord.objects.filter(product__in=seats)
+        }
+
+        missing = [seat.id for seat in seats if (seat.id, seat.course.partner_id) not in stock_records]
+        if missing:
+            raise StockRecord.DoesNotExist('No stock records exist for the seats {}.'.format(sorted(missing)))
+
+        return {seat.id: stock_records[(seat.id, seat.course.partner_id)] for seat in seats}
+
+    def get_ranges(self, seats):
+        """ Returns the enrollment code ranges of the given seats, creating the missing ones.
+
+        Args:
+            seats (iterable of Products): Seats of the enrollment codes.
+
+        Returns:
+            dict: Ranges, keyed by the ID of their seat.
+        """
+        names = {seat.id: 'Enrollment Code Range for {}'.format(seat.seat_attributes.course_key) for seat in seats}
+        ranges = {_range.name: _range for _range in Range.objects.filter(name__in=names.values())}
+
+        for seat in seats:
+            if names[seat.id] not in ranges:
+                _range = Range.objects.create(name=names[seat.id])
+                _range.add_product(seat)
+                ranges[_range.name] = _range
+
+        return {seat.id: ranges[names[seat.id]] for seat in seats}
+
     def revoke_line(self, line):
         """ Revokes the specified line.
 
@@ -650,7 +739,7 @@ class CourseEntitlementFulfillmentModule(BaseFulfillmentModule):
                 entitlement_option = Option.objects.get(code='course_entitlement')
 
                 entitlement_api_client = EdxRestApiClient(
-                    get_lms_entitlement_api_url(),
+                    order.site.siteconfiguration.build_lms_url('/api/entitlements/v1/'),
                     jwt=order.site.siteconfiguration.access_token
                 )
 
@@ -693,7 +782,7 @@ class CourseEntitlementFulfillmentModule(BaseFulfillmentModule):
             course_entitlement_uuid = line.attributes.get(option=entitlement_option).value
 
             entitlement_api_client = EdxRestApiClient(
-                get_lms_entitlement_api_url(),
+                line.order.site.siteconfiguration.build_lms_url('/api/entitlements/v1/'),
                 jwt=line.order.site.siteconfiguration.access_token
             )
 
@@ -6,7 +6,9 @@ import uuid
 import ddt
 import httpretty
 import mock
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from oscar.core.loading import get_class, get_model
 from oscar.test import factories
 from requests.exceptions import ConnectionError, Timeout
@@ -50,6 +52,7 @@ Option = get_model('catalogue', 'Option')
 Product = get_model('catalogue', 'Product')
 ProductAttribute = get_model('catalogue', 'ProductAttribute')
 ProductClass = get_model('catalogue', 'ProductClass')
+SeatAttributes = get_model('catalogue', 'SeatAttributes')
 StockRecord = get_model('partner', 'StockRecord')
 Voucher = get_model('voucher', 'Voucher')
 
@@ -411,7 +414,7 @@ class EnrollmentFulfillmentModuleTests(ProgramTestMixin, DiscoveryTestMixin, Ful
         # not available for ecommerce tests.
         try:
             # pylint: disable=protected-access
-            EnrollmentFulfillmentModule()._post_to_enrollment_api(data=data, user=self.user)
+            EnrollmentFulfillmentModule()._post_to_enrollment_api(data=data, user=self.user, site=self.site)
         except ConnectionError as exp:
             # Check that the enrollment request object has the analytics header
             # 'x-edx-ga-client-id' and 'x-forwarded-for'.
@@ -559,6 +562,58 @@ class EnrollmentCodeFulfillmentModuleTests(DiscoveryTestMixin, TestCase):
         self.assertEqual(OrderLineVouchers.objects.first().vouchers.count(), self.QUANTITY)
         self.assertIsNotNone(OrderLineVouchers.objects.first().vouchers.first().benefit.range.catalog)
 
+    def test_fulfill_product_in_bulk(self):
+        """ Fulfillment issues a number of queries that does not depend on the quantity of enrollment codes. """
+        enrollment_code = self.order.lines.first().product
+        EnrollmentCodeFulfillmentModule().fulfill_product(self.order, list(self.order.lines.all()))
+
+        orders = []
+        for number, quantity in ((2, 1), (3, 100)):
+            basket = factories.BasketFactory(owner=self.order.user, site=self.site)
+            basket.add_product(enrollment_code, quantity)
+            orders.append(create_order(number=number, basket=basket, user=self.order.user))
+
+        with CaptureQueriesContext(connection) as queries:
+            EnrollmentCodeFulfillmentModule().fulfill_product(orders[0], list(orders[0].lines.all()))
+
+        with self.assertNumQueries(len(queries)):
+            __, lines = EnrollmentCodeFulfillmentModule().fulfill_product(orders[1], list(orders[1].lines.all()))
+
+        self.assertEqual(lines[0].status, LINE.COMPLETE)
+        self.assertEqual(OrderLineVouchers.objects.get(line=lines[0]).vouchers.count(), 100)
+
+    def test_get_seats(self):
+        """ Seats should be looked up for all enrollment codes at once, failing if any are missing or duplicated. """
+        module = EnrollmentCodeFulfillmentModule()
+        self.assertEqual(module.get_seats([]), {})
+
+        attributes = self.order.lines.first().product.seat_attributes
+        seat = Product.objects.get(
+            seat_attributes__course_key=attributes.course_key, seat_attributes__certificate_type='verified'
+        )
+        self.assertEqual(module.get_seats([attributes]), {(attributes.course_key, 'verified'): seat})
+
+        duplicate = Product.objects.create(product_class=seat.get_product_class(), title='Duplicate seat')
+        SeatAttributes.objects.create(product=duplicate, course_key=attributes.course_key, certificate_type='verified')
+        with self.assertRaises(Product.MultipleObjectsReturned):
+            module.get_seats([attributes])
+
+        SeatAttributes.objects.filter(product__in=[seat, duplicate]).delete()
+        with self.assertRaises(Product.DoesNotExist):
+            module.get_seats([attributes])
+
+    def test_fulfill_product_without_stock_record(self):
+        """ Fulfillment should fail, before creating vouchers, if the seat has no stock record. """
+        attributes = self.order.lines.first().product.seat_attributes
+        StockRecord.objects.filter(
+            product__seat_attributes__course_key=attributes.course_key,
+            product__seat_attributes__certificate_type='verified'
+        ).delete()
+
+        with self.assertRaises(StockRecord.DoesNotExist):
+            EnrollmentCodeFulfillmentModule().fulfill_product(self.order, list(self.order.lines.all()))
+        self.assertFalse(OrderLineVouchers.objects.exists())
+
     def test_revoke_line(self):
         line = self.order.lines.first()
         with self.assertRaises(NotImplementedError):
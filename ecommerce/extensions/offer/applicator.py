@@ -8,8 +8,6 @@ from oscar.core.loading import get_model
 from ecommerce.extensions.offer.constants import CUSTOM_APPLICATOR_LOG_FLAG
 
 logger = logging.getLogger(__name__)
-BasketAttribute = get_model('basket', 'BasketAttribute')
-BasketAttributeType = get_model('basket', 'BasketAttributeType')
 BUNDLE = 'bundle_identifier'
 
 
@@ -36,12 +34,9 @@ class CustomApplicator(Applicator):
             list of Offer: A sorted list of all the offers that apply to the
                 basket.
         """
-        bundle_attributes = BasketAttribute.objects.filter(
-            basket=basket,
-            attribute_type=BasketAttributeType.objects.get(name=BUNDLE)
-        )
-        if bundle_attributes.count() > 0:
-            program_offers = self.get_program_offers(bundle_attributes.first())
+        bundle_id = basket.get_attribute(BUNDLE)
+        if bundle_id is not None:
+            program_offers = self.get_program_offers(bundle_id)
             site_offers = []
             if waffle.flag_is_active(request, CUSTOM_APPLICATOR_LOG_FLAG):
                 logger.warning(
@@ -80,18 +75,17 @@ class CustomApplicator(Applicator):
         qs = ConditionalOffer.active.filter(offer_type=ConditionalOffer.SITE, condition__program_uuid__isnull=True)
         return qs.select_related('condition', 'benefit')
 
-    def get_program_offers(self, bundle_attribute):
+    def get_program_offers(self, bundle_id):
         """
         Returns offers that apply to the program by matching the bundle id.
 
         Args:
-            bundle_attribute (BasketAttribute): The BasketAttribute object
-                associated with program bundling for this basket.
+            bundle_id (str): The value of the basket attribute associated with
+                program bundling for this basket.
 
         Returns:
             list of Offer: List of all the offers applicable to the program.
         """
-        bundle_id = bundle_attribute.value_text
         ConditionalOffer = get_model('offer', 'ConditionalOffer')
         offers = ConditionalOffer.active.filter(offer_type=ConditionalOffer.SITE, condition__program_uuid=bundle_id)
 
@@ -0,0 +1,46 @@
+from __future__ import unicode_literals
+
+import logging
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+
+from ecommerce.extensions.order.outbox import dispatch_pending_entries, get_pending_entries
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to publish the fulfillment tasks of orders that were not published, or not acknowledged by the worker.
+
+    It is meant to be run periodically, e.g. by cron.
+
+    Example:
+
+        ./manage.py dispatch_fulfillment_outbox --batch_size 100
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=100,
+                            help='Number of fulfillment tasks published over a single broker connection.')
+        parser.add_argument('--retry_delay',
+                            action='store',
+                            dest='retry_delay',
+                            type=int,
+                            default=None,
+                            help='Seconds after which unacknowledged tasks are published again. '
+                                 'Defaults to the FULFILLMENT_OUTBOX_RETRY_DELAY setting.')
+
+    def handle(self, *args, **options):
+        published = dispatch_pending_entries(batch_size=options['batch_size'], retry_delay=options['retry_delay'])
+        logger.info(
+            'Published %d fulfillment tasks. %d orders are pending fulfillment.',
+            published,
+            get_pending_entries().count()
+        )
@@ -0,0 +1,67 @@
+from __future__ import unicode_literals
+
+import logging
+import time
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from oscar.core.loading import get_model
+
+logger = logging.getLogger(__name__)
+Order = get_model('order', 'Order')
+OrderSearchTerm = get_model('order', 'OrderSearchTerm')
+
+
+class Command(BaseCommand):
+    """
+    Command to (re)build the search index of orders used by the dashboard.
+
+    Orders are indexed when they are placed, or updated. This command indexes those placed before the index existed.
+    Orders are walked by ID, in batches, so that the command can be resumed from the last ID it logged.
+
+    Example:
+
+        ./manage.py index_orders --batch_size 1000 --start_id 1
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=1000,
+                            help='Number of orders indexed per batch.')
+        parser.add_argument('--start_id',
+                            action='store',
+                            dest='start_id',
+                            type=int,
+                            default=1,
+                            help='ID of the order to start indexing from.')
+        parser.add_argument('--sleep_seconds',
+                            action='store',
+                            dest='sleep_seconds',
+                            type=float,
+                            default=0,
+                            help='Seconds to sleep between batches.')
+
+    def handle(self, *args, **options):
+        queryset = Order.objects.select_related('user').prefetch_related('lines').order_by('id')
+        last_id = options['start_id'] - 1
+        indexed = 0
+
+        while True:
+            orders = list(queryset.filter(id__gt=last_id)[:options['batch_size']])
+            if not orders:
+                break
+
+            with transaction.atomic():
+                OrderSearchTerm.index_orders(orders)
+
+            indexed += len(orders)
+            last_id = orders[-1].id
+            logger.info('Indexed %d orders, through order [%d].', indexed, last_id)
+            time.sleep(options['sleep_seconds'])
+
+        logger.info('Indexed %d orders.', indexed)
@@ -0,0 +1,36 @@
+import datetime
+
+from django.core.management import call_command
+from django.utils.timezone import now
+from mock import ANY, patch
+from oscar.core.loading import get_model
+from testfixtures import LogCapture
+
+from ecommerce.extensions.test.factories import create_order
+from ecommerce.tests.testcases import TestCase
+
+FulfillmentOutboxEntry = get_model('order', 'FulfillmentOutboxEntry')
+LOGGER_NAME = 'ecommerce.extensions.order.management.commands.dispatch_fulfillment_outbox'
+
+
+class DispatchFulfillmentOutboxTests(TestCase):
+    """Tests for dispatch_fulfillment_outbox management command."""
+
+    def test_dispatch(self):
+        """ Unacknowledged entries older than the retry delay should be published again. """
+        order = create_order()
+        FulfillmentOutboxEntry.objects.create(
+            order=order, site_code='edX', attempts=1, last_dispatched=now() - datetime.timedelta(seconds=120)
+        )
+        FulfillmentOutboxEntry.objects.create(order=create_order(), site_code='edX', attempts=1, last_dispatched=now())
+
+        with patch('ecommerce.extensions.order.outbox.fulfill_order.apply_async') as mock_apply_async:
+            with LogCapture(LOGGER_NAME) as log:
+                call_command('dispatch_fulfillment_outbox', '--retry_delay=60')
+                log.check(
+                    (LOGGER_NAME, 'INFO', 'Published 1 fulfillment tasks. 2 orders are pending fulfillment.')
+                )
+
+        mock_apply_async.assert_called_once_with(
+            args=(order.number,), kwargs={'site_code': 'edX', 'email_opt_in': False}, producer=ANY
+        )
@@ -0,0 +1,30 @@
+from django.core.management import call_command
+from oscar.core.loading import get_model
+from testfixtures import LogCapture
+
+from ecommerce.extensions.test.factories import create_order
+from ecommerce.tests.testcases import TestCase
+
+OrderSearchTerm = get_model('order', 'OrderSearchTerm')
+LOGGER_NAME = 'ecommerce.extensions.order.management.commands.index_orders'
+
+
+class IndexOrdersTests(TestCase):
+    """Tests for index_orders management command."""
+
+    def test_index_orders(self):
+        """ Orders from the start ID should be indexed, in batches. """
+        orders = [create_order() for __ in range(3)]
+        expected = set(OrderSearchTerm.objects.filter(order__in=orders[1:]).values_list('order_id', 'field', 'value'))
+        OrderSearchTerm.objects.all().delete()
+
+        with LogCapture(LOGGER_NAME) as log:
+            call_command('index_orders', batch_size=1, start_id=orders[1].id)
+            log.check(
+                (LOGGER_NAME, 'INFO', 'Indexed 1 orders, through order [{}].'.format(orders[1].id)),
+                (LOGGER_NAME, 'INFO', 'Indexed 2 orders, through order [{}].'.format(orders[2].id)),
+                (LOGGER_NAME, 'INFO', 'Indexed 2 orders.'),
+            )
+
+        self.assertEqual(set(OrderSearchTerm.objects.values_list('order_id', 'field', 'value')), expected)
+        self.assertTrue(expected)
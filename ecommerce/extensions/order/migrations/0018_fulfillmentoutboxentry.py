@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 13:00
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0017_order_partner'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FulfillmentOutboxEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('site_code', models.CharField(max_length=8)),
+                ('email_opt_in', models.BooleanField(default=False)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of times the entry was published.')),
+                ('last_dispatched', models.DateTimeField(blank=True, null=True)),
+                ('acknowledged', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='fulfillment_outbox_entry', to='order.Order')),
+            ],
+            options={
+                'verbose_name_plural': 'fulfillment outbox entries',
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 13:43
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0018_fulfillmentoutboxentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSearchTerm',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(choices=[(b'number', 'Order number'), (b'username', 'Username'), (b'email', 'Email'), (b'first_name', 'First name'), (b'last_name', 'Last name'), (b'product_title', 'Product title'), (b'upc', 'UPC'), (b'partner_sku', 'Partner SKU')], max_length=32)),
+                ('value', models.CharField(max_length=255)),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='order.Order')),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='ordersearchterm',
+            index_together=set([('field', 'value', 'order')]),
+        ),
+    ]
@@ -1,6 +1,12 @@
+import six
+from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
+from django_extensions.db.models import TimeStampedModel
 from oscar.apps.order.abstract_models import AbstractOrder, AbstractPaymentEvent
+from oscar.apps.order.signals import order_placed
 
 from ecommerce.extensions.fulfillment.status import ORDER
 
@@ -28,6 +34,204 @@ class PaymentEvent(AbstractPaymentEvent):
     processor_name = models.CharField(_('Payment Processor'), max_length=32, blank=True, null=True)
 
 
+class FulfillmentOutboxEntry(TimeStampedModel):
+    """
+    Fulfillment of an order, to be published to the fulfillment queue.
+
+    Entries are written in the transaction that places their order, and published once it is committed.
+    They remain pending until the worker acknowledges them, by fulfilling their order through the API.
+    """
+    order = models.OneToOneField('order.Order', related_name='fulfillment_outbox_entry')
+    site_code = models.CharField(max_length=8)
+    email_opt_in = models.BooleanField(default=False)
+    attempts = models.PositiveIntegerField(default=0, help_text=_('Number of times the entry was published.'))
+    last_dispatched = models.DateTimeField(null=True, blank=True)
+    acknowledged = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta(object):
+        verbose_name_plural = 'fulfillment outbox entries'
+
+    def __unicode__(self):
+        return u'Fulfillment of order [{}]'.format(self.order_id)
+
+
+class OrderSearchTerm(models.Model):
+    """
+    Lowercased value of a searchable field of an order.
+
+    Searching orders for usernames, emails, SKUs and the like across the joins between orders, their users and
+    their lines is slow on large tables. The values of those fields are instead indexed here, so that dashboard
+    searches match them with indexed exact or prefix lookups.
+    """
+    NUMBER = 'number'
+    USERNAME = 'username'
+    EMAIL = 'email'
+    FIRST_NAME = 'first_name'
+    LAST_NAME = 'last_name'
+    PRODUCT_TITLE = 'product_title'
+    UPC = 'upc'
+    PARTNER_SKU = 'partner_sku'
+    FIELD_CHOICES = (
+        (NUMBER, _('Order number')),
+        (USERNAME, _('Username')),
+        (EMAIL, _('Email')),
+        (FIRST_NAME, _('First name')),
+        (LAST_NAME, _('Last name')),
+        (PRODUCT_TITLE, _('Product title')),
+        (UPC, _('UPC')),
+        (PARTNER_SKU, _('Partner SKU')),
+    )
+    USER_FIELDS = (USERNAME, EMAIL, FIRST_NAME, LAST_NAME)
+    # Fields of orders whose values are indexed.
+    ORDER_FIELDS = ('number', 'user', 'guest_email')
+
+    order = models.ForeignKey('order.Order', related_name='search_terms', on_delete=models.CASCADE)
+    field = models.CharField(max_length=32, choices=FIELD_CHOICES)
+    value = models.CharField(max_length=255)
+
+    class Meta(object):
+        index_together = (('field', 'value', 'order'),)
+
+    def __unicode__(self):
+        return u'{field} [{value}] of order [{order_id}]'.format(field=self.field, value=self.value,
+                                                                 order_id=self.order_id)
+
+    @staticmethod
+    def normalize(value):
+        return six.text_type(value).strip().lower()[:255] if value is not None else ''
+
+    @classmethod
+    def get_user_terms(cls, user):
+        if not user:
+            return []
+        return [
+            (field, cls.normalize(getattr(user, field)))
+            for field in cls.USER_FIELDS if cls.normalize(getattr(user, field))
+        ]
+
+    @classmethod
+    def get_terms(cls, order):
+        """ Returns the searchable fields, and their values, of an order. """
+        terms = {(cls.NUMBER, cls.normalize(order.number))}
+        terms.update(cls.get_user_terms(order.user))
+        if order.guest_email:
+            terms.add((cls.EMAIL, cls.normalize(order.guest_email)))
+
+        for line in order.lines.all():
+            for field, value in ((cls.PRODUCT_TITLE, line.title), (cls.UPC, line.upc),
+                                 (cls.PARTNER_SKU, line.partner_sku)):
+                value = cls.normalize(value)
+                if value:
+                    terms.add((field, value))
+
+        return terms
+
+    @classmethod
+    def index_orders(cls, orders):
+        """ (Re)indexes the given orders, whose users and lines should be loaded along with them. """
+        orders = list(orders)
+        cls.objects.filter(order__in=orders).delete()
+        cls.objects.bulk_create([
+            cls(order=order, field=field, value=value) for order in orders for field, value in cls.get_terms(order)
+        ])
+
+    @classmethod
+    def index_order(cls, order_id):
+        """
+        (Re)indexes an order, loading it again with its user and lines.
+
+        The user of an order being placed or saved is not loaded onto it, so that code using the order later loads
+        the user as it is then.
+        """
+        cls.index_orders(Order.objects.filter(id=order_id).select_related('user').prefetch_related('lines'))
+
+    @classmethod
+    def index_user(cls, user):
+        """ Reindexes the fields of the orders of a user which are those of the user. """
+        order_ids = list(Order.objects.filter(user=user).values_list('id', flat=True))
+        if not order_ids:
+            return
+
+        cls.objects.filter(order_id__in=order_ids, field__in=cls.USER_FIELDS).delete()
+        cls.objects.bulk_create([
+            cls(order_id=order_id, field=field, value=value)
+            for order_id in order_ids for field, value in cls.get_user_terms(user)
+        ])
+
+    @staticmethod
+    def get_indexed_values(instance, fields):
+        """
+        Returns the values of the given fields of an order or user, by field name, as loaded on the instance.
+
+        Foreign keys are read by their IDs, and deferred fields are not loaded, so that this costs no queries.
+        """
+        meta = instance._meta  # pylint: disable=protected-access
+        return {field: instance.__dict__.get(meta.get_field(field).attname) for field in fields}
+
+    @classmethod
+    def have_indexed_values_changed(cls, instance, fields, update_fields=None):
+        """
+        Returns whether the values of the given fields of a saved order or user changed since it was loaded, or last
+        saved, and records the saved values. Only the fields in update_fields, if given, were saved.
+        """
+        if update_fields is not None:
+            meta = instance._meta  # pylint: disable=protected-access
+            fields = [
+                field for field in fields
+                if field in update_fields or meta.get_field(field).attname in update_fields
+            ]
+
+        values = cls.get_indexed_values(instance, fields)
+        changed = any(value != instance.original_indexed_values.get(field) for field, value in values.items())
+        instance.original_indexed_values.update(values)
+        return changed
+
+    @classmethod
+    def match(cls, field, value, prefix=True):
+        """
+        Returns the terms of the given field matching the given value, or starting with it.
+
+        Values are lowercased when indexed, so case-insensitive lookups match them as well. Unlike those of
+        other databases, MySQL's case-insensitive LIKE queries use the index of the field.
+        """
+        value = cls.normalize(value)
+        lookup = {'value__istartswith': value} if prefix else {'value': value}
+        return cls.objects.filter(field=field, **lookup)
+
+
+@receiver(order_placed)
+def index_placed_order(sender, order, **kwargs):  # pylint: disable=unused-argument
+    OrderSearchTerm.index_order(order.id)
+
+
+@receiver(post_init, sender=Order)
+def update_original_order_indexed_values(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Records the indexed values of orders as loaded, so that saves which do not change them are not reindexed. """
+    instance.original_indexed_values = OrderSearchTerm.get_indexed_values(instance, OrderSearchTerm.ORDER_FIELDS)
+
+
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def update_original_user_indexed_values(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """ Records the indexed values of users as loaded, so that saves which do not change them are not reindexed. """
+    instance.original_indexed_values = OrderSearchTerm.get_indexed_values(instance, OrderSearchTerm.USER_FIELDS)
+
+
+@receiver(post_save, sender=Order)
+def reindex_order(sender, instance, created, update_fields=None, **kwargs):  # pylint: disable=unused-argument
+    """ Reindexes orders when their indexed fields change. Placed orders are indexed with their lines. """
+    changed = OrderSearchTerm.have_indexed_values_changed(instance, OrderSearchTerm.ORDER_FIELDS, update_fields)
+    if changed and not created:
+        OrderSearchTerm.index_order(instance.id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def reindex_user_orders(sender, instance, created, update_fields=None, **kwargs):  # pylint: disable=unused-argument
+    """ Reindexes the orders of users when their indexed fields change, e.g. not when they log in. """
+    changed = OrderSearchTerm.have_indexed_values_changed(instance, OrderSearchTerm.USER_FIELDS, update_fields)
+    if changed and not created:
+        OrderSearchTerm.index_user(instance)
+
+
 # If two models with the same name are declared within an app, Django will only use the first one.
 # noinspection PyUnresolvedReferences
 from oscar.apps.order.models import *  # noqa isort:skip pylint: disable=wildcard-import,unused-wildcard-import,wrong-import-position,wrong-import-order,ungrouped-imports
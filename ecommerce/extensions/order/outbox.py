@@ -0,0 +1,104 @@
+""" Transactional outbox for the fulfillment tasks of orders. """
+from __future__ import unicode_literals
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.timezone import now
+from ecommerce_worker.fulfillment.v1.tasks import fulfill_order
+from oscar.core.loading import get_model
+
+logger = logging.getLogger(__name__)
+FulfillmentOutboxEntry = get_model('order', 'FulfillmentOutboxEntry')
+
+
+def enqueue_fulfillment(order, site_code, email_opt_in=False):
+    """
+    Adds the fulfillment of an order to the outbox, in the current transaction, and publishes it
+    to the fulfillment queue once the transaction is committed.
+
+    Entries that fail to be published, or are not acknowledged by the worker, are published again
+    by the dispatch_fulfillment_outbox command.
+
+    Returns:
+        FulfillmentOutboxEntry
+    """
+    entry = FulfillmentOutboxEntry.objects.create(order=order, site_code=site_code, email_opt_in=email_opt_in)
+    transaction.on_commit(lambda: dispatch_entries([entry]))
+    return entry
+
+
+def dispatch_entries(entries):
+    """
+    Publishes the fulfillment tasks of outbox entries, over a single broker connection.
+
+    Publication stops at the first failure. The remaining entries are left to be retried.
+
+    Returns:
+        int: Number of published entries.
+    """
+    published = []
+    try:
+        with fulfill_order.app.producer_or_acquire() as producer:
+            for entry in entries:
+                fulfill_order.apply_async(
+                    args=(entry.order.number,),
+                    kwargs={'site_code': entry.site_code, 'email_opt_in': entry.email_opt_in},
+                    producer=producer
+                )
+                published.append(entry.id)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception(
+            'Failed to publish the fulfillment of %d orders. They will be retried.', len(entries) - len(published)
+        )
+    finally:
+        if published:
+            FulfillmentOutboxEntry.objects.filter(id__in=published).update(
+                attempts=F('attempts') + 1, last_dispatched=now()
+            )
+
+    return len(published)
+
+
+def get_pending_entries():
+    """ Returns the outbox entries not yet acknowledged by the worker. """
+    return FulfillmentOutboxEntry.objects.filter(acknowledged__isnull=True)
+
+
+def dispatch_pending_entries(batch_size=100, retry_delay=None, max_attempts=None):
+    """
+    Publishes, in batches, the pending outbox entries that were never published, or not acknowledged
+    within retry_delay seconds of being published.
+
+    Entries published max_attempts times are no longer retried, and must be fulfilled manually.
+
+    Returns:
+        int: Number of published entries.
+    """
+    retry_delay = settings.FULFILLMENT_OUTBOX_RETRY_DELAY if retry_delay is None else retry_delay
+    max_attempts = settings.FULFILLMENT_OUTBOX_MAX_ATTEMPTS if max_attempts is None else max_attempts
+
+    entries = get_pending_entries().filter(
+        Q(last_dispatched__isnull=True) | Q(last_dispatched__lt=now() - timedelta(seconds=retry_delay)),
+        attempts__lt=max_attempts
+    ).select_related('order').order_by('id')
+
+    last_id = 0
+    total = 0
+    while True:
+        batch = list(entries.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+
+        total += dispatch_entries(batch)
+        last_id = batch[-1].id
+
+    return total
+
+
+def acknowledge_fulfillment(order):
+    """ Marks the outbox entry of an order, if any, as acknowledged by the worker, once the order is fulfilled. """
+    FulfillmentOutboxEntry.objects.filter(order=order, acknowledged__isnull=True).update(acknowledged=now())
@@ -1,4 +1,7 @@
 import ddt
+import mock
+from django.contrib.auth import get_user_model
+from oscar.core.loading import get_model
 from oscar.test import factories
 
 from ecommerce.core.constants import COUPON_PRODUCT_CLASS_NAME
@@ -6,6 +9,10 @@ from ecommerce.extensions.fulfillment.status import ORDER
 from ecommerce.extensions.test.factories import create_basket, create_order
 from ecommerce.tests.testcases import TestCase
 
+Order = get_model('order', 'Order')
+OrderSearchTerm = get_model('order', 'OrderSearchTerm')
+User = get_user_model()
+
 
 @ddt.ddt
 class OrderTests(TestCase):
@@ -39,3 +46,76 @@ class OrderTests(TestCase):
         basket.add_product(product)
         order = create_order(basket=basket)
         self.assertTrue(order.contains_coupon)
+
+
+class OrderSearchTermTests(TestCase):
+    def setUp(self):
+        super(OrderSearchTermTests, self).setUp()
+        self.user = self.create_user(username='Learner', email='Learner@Example.com', first_name='Ada',
+                                     last_name='Lovelace')
+        self.order = create_order(user=self.user)
+
+    def test_order_placement(self):
+        """ Orders should be indexed, with their users and lines, when they are placed. Empty values are skipped. """
+        line = self.order.lines.first()
+        self.assertEqual(line.upc, '')
+        self.assertEqual(set(OrderSearchTerm.objects.filter(order=self.order).values_list('field', 'value')), {
+            (OrderSearchTerm.NUMBER, self.order.number.lower()),
+            (OrderSearchTerm.USERNAME, 'learner'),
+            (OrderSearchTerm.EMAIL, 'learner@example.com'),
+            (OrderSearchTerm.FIRST_NAME, 'ada'),
+            (OrderSearchTerm.LAST_NAME, 'lovelace'),
+            (OrderSearchTerm.PRODUCT_TITLE, line.title.lower()),
+            (OrderSearchTerm.PARTNER_SKU, line.partner_sku.lower()),
+        })
+
+    def test_user_update(self):
+        """ The orders of users should be reindexed when their indexed fields change, but not when they log in. """
+        self.user.email = 'new@example.com'
+        self.user.save()
+        emails = OrderSearchTerm.objects.filter(order=self.order, field=OrderSearchTerm.EMAIL)
+        self.assertEqual(list(emails.values_list('value', flat=True)), ['new@example.com'])
+
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+
+        with mock.patch.object(OrderSearchTerm, 'index_user') as mock_index:
+            self.user.save()
+            User.objects.get(id=self.user.id).save()
+            self.assertFalse(mock_index.called)
+
+            user = User.objects.only('id', 'username').get(id=self.user.id)
+            user.username = 'renamed'
+            user.save()
+            mock_index.assert_called_once_with(user)
+
+    def test_order_update(self):
+        """ Orders should be reindexed when their indexed fields change, but not when their status does. """
+        other_user = self.create_user(username='other')
+        self.order.user = other_user
+        self.order.save()
+        self.assertTrue(OrderSearchTerm.match(OrderSearchTerm.USERNAME, 'other').filter(order=self.order).exists())
+
+        with self.assertNumQueries(1):
+            self.order.save(update_fields=['status'])
+
+        with mock.patch.object(OrderSearchTerm, 'index_order') as mock_index:
+            self.order.set_status(ORDER.COMPLETE)
+            Order.objects.get(id=self.order.id).save()
+            self.assertFalse(mock_index.called)
+
+            # Values changed but not saved are reindexed once saved.
+            self.order.guest_email = 'guest@example.com'
+            self.order.save(update_fields=['status'])
+            self.assertFalse(mock_index.called)
+            self.order.save()
+            mock_index.assert_called_once_with(self.order.id)
+
+    def test_match(self):
+        """ Terms should match values, and prefixes of values, case-insensitively. """
+        create_order(user=self.create_user(username='learning'))
+
+        self.assertEqual(OrderSearchTerm.match(OrderSearchTerm.USERNAME, 'LEARN').count(), 2)
+        matches = OrderSearchTerm.match(OrderSearchTerm.USERNAME, 'Learner', prefix=False)
+        self.assertEqual(list(matches.values_list('order_id', flat=True)), [self.order.id])
+        self.assertFalse(OrderSearchTerm.match(OrderSearchTerm.USERNAME, 'learners').exists())
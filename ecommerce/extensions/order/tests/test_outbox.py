@@ -0,0 +1,83 @@
+import datetime
+
+import mock
+from django.utils.timezone import now
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.order.outbox import (
+    acknowledge_fulfillment,
+    dispatch_entries,
+    dispatch_pending_entries,
+    enqueue_fulfillment,
+    get_pending_entries
+)
+from ecommerce.extensions.test.factories import create_order
+from ecommerce.tests.testcases import TestCase
+
+FulfillmentOutboxEntry = get_model('order', 'FulfillmentOutboxEntry')
+APPLY_ASYNC = 'ecommerce.extensions.order.outbox.fulfill_order.apply_async'
+
+
+class FulfillmentOutboxTests(TestCase):
+    def create_entry(self, **kwargs):
+        return FulfillmentOutboxEntry.objects.create(order=create_order(), site_code='edX', **kwargs)
+
+    def test_enqueue_fulfillment(self):
+        """ The entry should be written immediately, and published once the transaction is committed. """
+        order = create_order()
+        with mock.patch('ecommerce.extensions.order.outbox.transaction.on_commit') as mock_on_commit:
+            with mock.patch(APPLY_ASYNC) as mock_apply_async:
+                entry = enqueue_fulfillment(order, 'edX', email_opt_in=True)
+                self.assertFalse(mock_apply_async.called)
+
+                mock_on_commit.call_args[0][0]()
+                mock_apply_async.assert_called_once_with(
+                    args=(order.number,), kwargs={'site_code': 'edX', 'email_opt_in': True}, producer=mock.ANY
+                )
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.order, order)
+        self.assertEqual(entry.attempts, 1)
+        self.assertIsNotNone(entry.last_dispatched)
+
+    def test_dispatch_entries_failure(self):
+        """ Entries not published because of a broker failure should not be marked as dispatched. """
+        entries = [self.create_entry(), self.create_entry()]
+        with mock.patch(APPLY_ASYNC, side_effect=[None, IOError]):
+            with mock.patch('ecommerce.extensions.order.outbox.logger.exception') as mock_log:
+                self.assertEqual(dispatch_entries(entries), 1)
+                mock_log.assert_called_once_with(
+                    'Failed to publish the fulfillment of %d orders. They will be retried.', 1
+                )
+
+        self.assertEqual(
+            list(FulfillmentOutboxEntry.objects.order_by('id').values_list('attempts', flat=True)), [1, 0]
+        )
+        self.assertIsNone(FulfillmentOutboxEntry.objects.get(id=entries[1].id).last_dispatched)
+
+    def test_dispatch_pending_entries(self):
+        """ Only pending entries never published, or not acknowledged in time, should be published. """
+        long_ago = now() - datetime.timedelta(hours=1)
+        never_published = self.create_entry()
+        unacknowledged = self.create_entry(attempts=1, last_dispatched=long_ago)
+        self.create_entry(attempts=1, last_dispatched=now())
+        self.create_entry(attempts=1, last_dispatched=long_ago, acknowledged=now())
+        self.create_entry(attempts=5, last_dispatched=long_ago)
+
+        with mock.patch(APPLY_ASYNC) as mock_apply_async:
+            with self.assertNumQueries(5):
+                self.assertEqual(dispatch_pending_entries(batch_size=1, retry_delay=600, max_attempts=5), 2)
+
+        self.assertEqual(
+            [call[1]['args'] for call in mock_apply_async.call_args_list],
+            [(never_published.order.number,), (unacknowledged.order.number,)]
+        )
+        self.assertEqual(FulfillmentOutboxEntry.objects.get(id=unacknowledged.id).attempts, 2)
+
+    def test_acknowledge_fulfillment(self):
+        """ Acknowledged entries should no longer be pending. """
+        entry = self.create_entry(attempts=1, last_dispatched=now())
+        self.assertEqual(list(get_pending_entries()), [entry])
+
+        acknowledge_fulfillment(entry.order)
+        self.assertEqual(list(get_pending_entries()), [])
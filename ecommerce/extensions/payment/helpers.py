@@ -2,12 +2,20 @@
 import base64
 import hashlib
 import hmac
+import uuid
+from collections import OrderedDict
 from importlib import import_module
 
 from django.conf import settings
+from edx_django_utils.cache import TieredCache
 
 from ecommerce.extensions.payment import exceptions
 
+PAYMENT_PROCESSORS_CACHE_VERSION_KEY = 'payment_processors_cache_version'
+
+# Processor classes imported from the paths in the PAYMENT_PROCESSORS setting, keyed by the paths.
+_processor_classes = {}
+
 
 def get_processor_class(path):
     """Return the payment processor class at the specified path.
@@ -29,6 +37,27 @@ def get_processor_class(path):
     return processor_class
 
 
+def get_processor_classes():
+    """Return the payment processor classes declared in the PAYMENT_PROCESSORS setting.
+
+    The classes are imported once per process. The returned dictionary is shared, and must not be modified.
+
+    Returns:
+        OrderedDict: The payment processor classes, keyed by name, in the order of the setting.
+    """
+    paths = tuple(settings.PAYMENT_PROCESSORS)
+    processor_classes = _processor_classes.get(paths)
+
+    if processor_classes is None:
+        processor_classes = OrderedDict()
+        for path in paths:
+            processor_class = get_processor_class(path)
+            processor_classes[processor_class.NAME] = processor_class
+        _processor_classes[paths] = processor_classes
+
+    return processor_classes
+
+
 def get_default_processor_class():
     """Return the default payment processor class.
 
@@ -56,15 +85,32 @@ def get_processor_class_by_name(name):
     Raises:
         ProcessorNotFoundError: If no payment processor with the given name exists.
     """
-    for path in settings.PAYMENT_PROCESSORS:
-        processor_class = get_processor_class(path)
+    try:
+        return get_processor_classes()[name]
+    except KeyError:
+        raise exceptions.ProcessorNotFoundError(
+            exceptions.PROCESSOR_NOT_FOUND_DEVELOPER_MESSAGE.format(name=name)
+        )
+
+
+def get_payment_processors_cache_version():
+    """Return the version the cache keys of the payment processors enabled for sites are built with.
+
+    Returns:
+        str: The current cache version.
+    """
+    cached_response = TieredCache.get_cached_response(PAYMENT_PROCESSORS_CACHE_VERSION_KEY)
+    if cached_response.is_found:
+        return cached_response.value
+
+    version = uuid.uuid4().hex
+    TieredCache.set_all_tiers(PAYMENT_PROCESSORS_CACHE_VERSION_KEY, version, None)
+    return version
 
-        if name == processor_class.NAME:
-            return processor_class
 
-    raise exceptions.ProcessorNotFoundError(
-        exceptions.PROCESSOR_NOT_FOUND_DEVELOPER_MESSAGE.format(name=name)
-    )
+def invalidate_payment_processors_cache():
+    """Invalidate the cached payment processors of all sites."""
+    TieredCache.delete_all_tiers(PAYMENT_PROCESSORS_CACHE_VERSION_KEY)
 
 
 def sign(message, secret):
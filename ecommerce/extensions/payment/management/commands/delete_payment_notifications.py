@@ -0,0 +1,41 @@
+from __future__ import unicode_literals
+
+import logging
+from textwrap import dedent
+
+from django.core.management.base import BaseCommand
+
+from ecommerce.extensions.payment.utils import delete_expired_payment_notifications
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to delete the records of payment notifications claimed more than a number of days ago.
+
+    It is meant to be run periodically, e.g. by cron.
+
+    Example:
+
+        ./manage.py delete_payment_notifications --days 30
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days',
+                            action='store',
+                            dest='days',
+                            type=int,
+                            default=30,
+                            help='Number of days after which payment notifications are deleted.')
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=1000,
+                            help='Number of payment notifications deleted by each query.')
+
+    def handle(self, *args, **options):
+        deleted = delete_expired_payment_notifications(options['days'], batch_size=options['batch_size'])
+        logger.info('Deleted %d payment notifications claimed more than %d days ago.', deleted, options['days'])
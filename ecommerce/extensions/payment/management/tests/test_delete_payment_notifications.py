@@ -0,0 +1,28 @@
+import datetime
+
+from django.core.management import call_command
+from django.utils.timezone import now
+from testfixtures import LogCapture
+
+from ecommerce.extensions.payment.models import PaymentNotification
+from ecommerce.tests.testcases import TestCase
+
+LOGGER_NAME = 'ecommerce.extensions.payment.management.commands.delete_payment_notifications'
+
+
+class DeletePaymentNotificationsTests(TestCase):
+    """ Tests for the delete_payment_notifications management command. """
+
+    def test_delete(self):
+        """ Notifications claimed more than the given number of days ago should be deleted. """
+        PaymentNotification.objects.create(processor_name='cybersource', key='expired', order_number='EDX-100001')
+        PaymentNotification.objects.update(created=now() - datetime.timedelta(days=8))
+        PaymentNotification.objects.create(processor_name='cybersource', key='recent', order_number='EDX-100002')
+
+        with LogCapture(LOGGER_NAME) as log:
+            call_command('delete_payment_notifications', '--days=7')
+            log.check(
+                (LOGGER_NAME, 'INFO', 'Deleted 1 payment notifications claimed more than 7 days ago.')
+            )
+
+        self.assertEqual(PaymentNotification.objects.get().key, 'recent')
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 13:18
+from __future__ import unicode_literals
+
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment', '0019_auto_20180628_2011'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentNotification',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('processor_name', models.CharField(max_length=32, verbose_name='Payment Processor')),
+                ('key', models.CharField(max_length=255)),
+                ('order_number', models.CharField(blank=True, max_length=128)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='paymentnotification',
+            unique_together=set([('processor_name', 'key')]),
+        ),
+    ]
@@ -67,5 +67,25 @@ class SDNCheckFailure(TimeStampedModel):
     class Meta(object):
         verbose_name = 'SDN Check Failure'
 
+
+class PaymentNotification(TimeStampedModel):
+    """
+    Record of the handling of a payment notification, or submission.
+
+    Payment processors may send the same notification several times, and learners may submit the same payment
+    twice. Only the first of them is handled. The others are recognized by their processor and key (e.g. a
+    transaction ID or order number), before any basket or order work.
+    """
+    processor_name = models.CharField(max_length=32, verbose_name=_('Payment Processor'))
+    key = models.CharField(max_length=255)
+    order_number = models.CharField(max_length=128, blank=True)
+
+    class Meta(object):
+        unique_together = ('processor_name', 'key')
+
+    def __unicode__(self):
+        return '{processor_name} notification [{key}]'.format(processor_name=self.processor_name, key=self.key)
+
+
 # noinspection PyUnresolvedReferences
 from oscar.apps.payment.models import *  # noqa isort:skip pylint: disable=ungrouped-imports, wildcard-import,unused-wildcard-import,wrong-import-position,wrong-import-order
@@ -1,26 +1,31 @@
 import logging
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from edx_django_utils.cache import TieredCache
 from waffle.models import Switch
 
 from ecommerce.extensions.api.v2.views.payments import PAYMENT_PROCESSOR_CACHE_KEY
+from ecommerce.extensions.payment.helpers import invalidate_payment_processors_cache
 
 logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=Switch)
+@receiver(post_delete, sender=Switch)
 def invalidate_processor_cache(*_args, **kwargs):
     """
-    When Waffle switches for payment processors are toggled, the
-    payment processor list view cache must be invalidated.
+    When Waffle switches for payment processors are toggled or deleted, the
+    payment processor list view cache and the cached payment processors
+    of sites must be invalidated.
     """
     switch = kwargs['instance']
     parts = switch.name.split(settings.PAYMENT_PROCESSOR_SWITCH_PREFIX)
     if len(parts) == 2:
         processor = parts[1]
-        logger.info('Switched payment processor [%s] %s.', processor, 'on' if switch.active else 'off')
+        active = switch.active and kwargs['signal'] is post_save
+        logger.info('Switched payment processor [%s] %s.', processor, 'on' if active else 'off')
         TieredCache.delete_all_tiers(PAYMENT_PROCESSOR_CACHE_KEY)
+        invalidate_payment_processors_cache()
         logger.info('Invalidated payment processor cache after toggling [%s].', switch.name)
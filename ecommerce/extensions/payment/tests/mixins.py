@@ -191,7 +191,7 @@ class CybersourceMixin(PaymentEventsMixin):
             'decision': decision,
             'reason_code': reason_code,
             'req_reference_number': req_reference_number,
-            'transaction_id': '123456',
+            'transaction_id': kwargs.get('transaction_id', '123456'),
             'auth_amount': auth_amount,
             'req_amount': total,
             'req_tax_amount': '0.00',
@@ -599,6 +599,7 @@ class CybersourceNotificationTestsMixin(CybersourceMixin):
             notification = self.generate_notification(
                 self.basket,
                 billing_address=billing_address,
+                transaction_id='654321',
             )
             self.assertIn(cybersource_key, notification)
             check_notification_address(notification, billing_address)
@@ -305,6 +305,7 @@ class PaypalTests(PaypalMixin, PaymentProcessorTestCaseMixin, TestCase):
         Verify that the correct locale for payment processing is fetched from the language cookie
         """
         translation.activate(default_locale)
+        self.addCleanup(translation.deactivate)
         mock_method.side_effect = Exception("End of test")  # Force test to end after this call
 
         toggle_switch('create_and_set_webprofile', True)
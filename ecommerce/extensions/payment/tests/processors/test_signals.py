@@ -4,6 +4,7 @@ from edx_django_utils.cache import TieredCache
 from waffle.models import Switch
 
 from ecommerce.extensions.api.v2.views.payments import PAYMENT_PROCESSOR_CACHE_KEY
+from ecommerce.extensions.payment.helpers import get_payment_processors_cache_version
 from ecommerce.tests.testcases import TestCase
 
 
@@ -21,3 +22,13 @@ class SignalTests(TestCase):
         # Toggle a switch to trigger cache deletion
         Switch.objects.get_or_create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + 'dummy')
         self.assertFalse(TieredCache.get_cached_response(PAYMENT_PROCESSOR_CACHE_KEY).is_found)
+
+    def test_invalidate_processor_cache_on_delete(self):
+        """ Verify the cached payment processors of sites are invalidated when payment processor switches are deleted. """
+        switch = Switch.objects.create(name=settings.PAYMENT_PROCESSOR_SWITCH_PREFIX + 'dummy', active=True)
+        version = get_payment_processors_cache_version()
+        TieredCache.set_all_tiers(PAYMENT_PROCESSOR_CACHE_KEY, [], None)
+
+        switch.delete()
+        self.assertNotEqual(get_payment_processors_cache_version(), version)
+        self.assertFalse(TieredCache.get_cached_response(PAYMENT_PROCESSOR_CACHE_KEY).is_found)
@@ -1,4 +1,5 @@
 import ddt
+import mock
 from django.test import override_settings
 
 from ecommerce.extensions.payment import helpers
@@ -18,6 +19,15 @@ class HelperTests(TestCase):
         actual = helpers.get_processor_class('ecommerce.extensions.payment.tests.processors.DummyProcessor')
         self.assertIs(actual, DummyProcessor)
 
+    def test_get_processor_classes(self):
+        """ Verify the function returns the processor classes defined in settings, imported only once. """
+        expected = [(DummyProcessor.NAME, DummyProcessor), (AnotherDummyProcessor.NAME, AnotherDummyProcessor)]
+        self.assertEqual(list(helpers.get_processor_classes().items()), expected)
+
+        with mock.patch.object(helpers, 'import_module') as mock_import_module:
+            self.assertEqual(list(helpers.get_processor_classes().items()), expected)
+            self.assertFalse(mock_import_module.called)
+
     def test_get_default_processor_class(self):
         """ Verify the function returns the first processor class defined in settings. """
         self.assertIs(helpers.get_default_processor_class(), DummyProcessor)
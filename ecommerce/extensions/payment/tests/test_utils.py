@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import datetime
 import json
 import time
 from urllib import urlencode
@@ -7,12 +8,21 @@ import httpretty
 import mock
 from django.conf import settings
 from django.test import override_settings
+from django.utils.timezone import now
+from edx_django_utils.cache import TieredCache
 from oscar.test import factories
 from requests.exceptions import HTTPError, Timeout
 
 from ecommerce.core.models import User
-from ecommerce.extensions.payment.models import SDNCheckFailure
-from ecommerce.extensions.payment.utils import SDNClient, clean_field_value, middle_truncate
+from ecommerce.extensions.payment.models import PaymentNotification, SDNCheckFailure
+from ecommerce.extensions.payment.utils import (
+    SDNClient,
+    claim_payment_notification,
+    clean_field_value,
+    delete_expired_payment_notifications,
+    middle_truncate,
+    release_payment_notification
+)
 from ecommerce.tests.testcases import TestCase
 
 
@@ -38,6 +48,55 @@ class UtilsTests(TestCase):
         self.assertEqual(clean_field_value(value), 'Sometexttest-value')
 
 
+class PaymentNotificationTests(TestCase):
+    """ Tests for the claiming of payment notifications. """
+    processor_name = 'cybersource'
+    key = 'transaction-id'
+
+    def test_claim(self):
+        """ The first claim of a notification should succeed, and the others return its order number. """
+        self.assertEqual(claim_payment_notification(self.processor_name, self.key, 'EDX-100001'), ('EDX-100001', True))
+        self.assertEqual(claim_payment_notification(self.processor_name, self.key, 'EDX-100002'), ('EDX-100001', False))
+        self.assertEqual(PaymentNotification.objects.get().order_number, 'EDX-100001')
+
+        # Notifications of other processors are independent.
+        self.assertEqual(claim_payment_notification('paypal', self.key, 'EDX-100002'), ('EDX-100002', True))
+
+    def test_claim_cached(self):
+        """ Repeated claims should be answered from the cache, without querying the database. """
+        claim_payment_notification(self.processor_name, self.key, 'EDX-100001')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                claim_payment_notification(self.processor_name, self.key, 'EDX-100002'), ('EDX-100001', False)
+            )
+
+    def test_claim_not_cached(self):
+        """ Repeated claims should be recognized from the database if the cache has expired. """
+        claim_payment_notification(self.processor_name, self.key, 'EDX-100001')
+        TieredCache.dangerous_clear_all_tiers()
+
+        self.assertEqual(claim_payment_notification(self.processor_name, self.key, 'EDX-100002'), ('EDX-100001', False))
+
+    def test_release(self):
+        """ Released notifications should be claimable again. """
+        claim_payment_notification(self.processor_name, self.key, 'EDX-100001')
+        release_payment_notification(self.processor_name, self.key)
+
+        self.assertFalse(PaymentNotification.objects.exists())
+        self.assertEqual(claim_payment_notification(self.processor_name, self.key, 'EDX-100002'), ('EDX-100002', True))
+
+    def test_delete_expired(self):
+        """ Notifications claimed more than the given number of days ago should be deleted, in batches. """
+        for index in range(3):
+            claim_payment_notification(self.processor_name, 'expired-{}'.format(index), 'EDX-10000{}'.format(index))
+        PaymentNotification.objects.update(created=now() - datetime.timedelta(days=31))
+        claim_payment_notification(self.processor_name, self.key, 'EDX-100003')
+
+        self.assertEqual(delete_expired_payment_notifications(30, batch_size=2), 3)
+        self.assertEqual(PaymentNotification.objects.get().key, self.key)
+
+
 class SDNCheckTests(TestCase):
     """ Tests for the SDN check function. """
 
@@ -123,6 +182,40 @@ class SDNCheckTests(TestCase):
         response = self.sdn_validator.search(self.name, self.city, self.country)
         self.assertEqual(response, sdn_response)
 
+    @httpretty.activate
+    def test_sdn_check_cached(self):
+        """ Verify the results of the SDN check are cached for the normalized details of the individual. """
+        sdn_response = {'total': 0}
+        self.mock_sdn_response(json.dumps(sdn_response))
+        self.assertEqual(self.sdn_validator.search(self.name, self.city, self.country), sdn_response)
+        self.assertEqual(
+            self.sdn_validator.search('  dr.  EVIL ', self.city.upper(), self.country.lower()),
+            sdn_response
+        )
+        self.assertEqual(len(httpretty.httpretty.latest_requests), 1)
+
+    @httpretty.activate
+    def test_sdn_check_error_not_cached(self):
+        """ Verify failed SDN checks are retried. """
+        self.mock_sdn_response(json.dumps({'total': 1}), status_code=500)
+        with self.assertRaises(HTTPError):
+            self.sdn_validator.search(self.name, self.city, self.country)
+
+        sdn_response = {'total': 1}
+        self.mock_sdn_response(json.dumps(sdn_response))
+        self.assertEqual(self.sdn_validator.search(self.name, self.city, self.country), sdn_response)
+
+    @httpretty.activate
+    def test_prescreen(self):
+        """ Verify pre-screening an individual caches the results for the SDN check. """
+        sdn_response = {'total': 1}
+        self.mock_sdn_response(json.dumps(sdn_response))
+        self.sdn_validator.prescreen(self.name, self.city, self.country).wait()
+        self.assertEqual(len(httpretty.httpretty.latest_requests), 1)
+
+        self.assertEqual(self.sdn_validator.search(self.name, self.city, self.country), sdn_response)
+        self.assertEqual(len(httpretty.httpretty.latest_requests), 1)
+
     def test_deactivate_user(self):
         """ Verify an SDN failure is logged. """
         response = {'description': 'Bad dude.'}
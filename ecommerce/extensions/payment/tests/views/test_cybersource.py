@@ -26,6 +26,7 @@ from ecommerce.extensions.order.constants import PaymentEventTypeName
 from ecommerce.extensions.payment.exceptions import InvalidBasketError, InvalidSignatureError
 from ecommerce.extensions.payment.processors.cybersource import Cybersource
 from ecommerce.extensions.payment.tests.mixins import CybersourceMixin, CybersourceNotificationTestsMixin
+from ecommerce.extensions.payment.utils import claim_payment_notification
 from ecommerce.extensions.payment.views.cybersource import CybersourceInterstitialView, OrderCreationMixin
 from ecommerce.extensions.test.factories import create_basket, create_order
 from ecommerce.invoice.models import Invoice
@@ -37,6 +38,7 @@ Basket = get_model('basket', 'Basket')
 Order = get_model('order', 'Order')
 OrderNumberGenerator = get_class('order.utils', 'OrderNumberGenerator')
 PaymentEvent = get_model('order', 'PaymentEvent')
+PaymentNotification = get_model('payment', 'PaymentNotification')
 PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
 Product = get_model('catalogue', 'Product')
 Selector = get_class('partner.strategy', 'Selector')
@@ -290,6 +292,53 @@ class CybersourceInterstitialViewTests(CybersourceNotificationTestsMixin, TestCa
         business_client = BusinessClient.objects.get(name=request_data['organization'])
         assert Invoice.objects.get(order=order).business_client == business_client
 
+    def test_duplicate_notification(self):
+        """ Verify that repeated notifications are redirected to the Receipt page without being handled again. """
+        notification = self.generate_notification(
+            self.basket,
+            billing_address=self.billing_address,
+        )
+        self.client.post(self.path, notification)
+
+        with mock.patch.object(self.view, 'validate_notification') as mock_validate_notification:
+            response = self.client.post(self.path, notification)
+            self.assertFalse(mock_validate_notification.called)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Order.objects.filter(basket=self.basket).count(), 1)
+
+    def test_invalid_notification_released(self):
+        """ Verify that notifications which could not be handled can be handled again. """
+        notification = self.generate_notification(
+            self.basket,
+            billing_address=self.billing_address,
+        )
+        with mock.patch.object(self.view, 'validate_notification', side_effect=InvalidSignatureError):
+            self.client.post(self.path, notification)
+
+        self.assertFalse(PaymentNotification.objects.exists())
+
+        response = self.client.post(self.path, notification)
+        self.assertTrue(Order.objects.filter(basket=self.basket).exists())
+        self.assertEqual(response.status_code, 302)
+
+    def test_forged_notification(self):
+        """ Verify that notifications with invalid signatures neither claim nor release the transaction. """
+        notification = self.generate_notification(
+            self.basket,
+            billing_address=self.billing_address,
+        )
+        forged = dict(notification, signature='forged-signature')
+
+        self.client.post(self.path, forged)
+        self.assertFalse(PaymentNotification.objects.exists())
+
+        transaction_id = notification['transaction_id']
+        claim_payment_notification(Cybersource.NAME, transaction_id, notification['req_reference_number'])
+        self.client.post(self.path, forged)
+        self.assertTrue(PaymentNotification.objects.filter(key=transaction_id).exists())
+        self.assertFalse(Order.objects.filter(basket=self.basket).exists())
+
     def test_order_creation_error(self):
         """ Verify the view redirects to the Payment error page when an error occurred during Order creation. """
         notification = self.generate_notification(
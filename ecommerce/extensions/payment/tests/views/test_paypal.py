@@ -31,6 +31,7 @@ Basket = get_model('basket', 'Basket')
 Order = get_model('order', 'Order')
 PaymentEvent = get_model('order', 'PaymentEvent')
 PaymentEventType = get_model('order', 'PaymentEventType')
+PaymentNotification = get_model('payment', 'PaymentNotification')
 PaymentProcessorResponse = get_model('payment', 'PaymentProcessorResponse')
 Product = get_model('catalogue', 'Product')
 Selector = get_class('partner.strategy', 'Selector')
@@ -210,6 +211,31 @@ class PaypalPaymentExecutionViewTests(PaypalMixin, PaymentEventsMixin, TestCase)
                     ),
                 )
 
+    def test_duplicate_execution(self):
+        """ Verify that users returning from PayPal again are redirected to the receipt page without paying again. """
+        self._assert_execution_redirect()
+
+        with mock.patch.object(PaypalPaymentExecutionView, 'handle_payment') as fake_handle_payment:
+            response = self.client.get(reverse('paypal:execute'), self.RETURN_DATA)
+            self.assertFalse(fake_handle_payment.called)
+
+        self.assertRedirects(
+            response,
+            get_receipt_page_url(
+                order_number=self.basket.order_number,
+                site_configuration=self.basket.site.siteconfiguration
+            ),
+            fetch_redirect_response=False
+        )
+        self.assertEqual(Order.objects.filter(basket=self.basket).count(), 1)
+
+    def test_payment_error_releases_notification(self):
+        """ Verify that the execution of a payment that failed can be retried. """
+        with mock.patch.object(PaypalPaymentExecutionView, 'handle_payment', side_effect=PaymentError):
+            self._assert_execution_redirect(url_redirect=self.processor.error_url)
+
+        self.assertFalse(PaymentNotification.objects.exists())
+
     def test_unanticipated_error_during_payment_handling(self):
         """
         Verify that a user who has approved payment is redirected to the configured receipt page when payment
@@ -17,6 +17,7 @@ from ecommerce.extensions.order.constants import PaymentEventTypeName
 from ecommerce.extensions.payment.constants import STRIPE_CARD_TYPE_MAP
 from ecommerce.extensions.payment.processors.stripe import Stripe
 from ecommerce.extensions.payment.tests.mixins import PaymentEventsMixin
+from ecommerce.extensions.payment.utils import claim_payment_notification
 from ecommerce.extensions.test.factories import create_basket
 from ecommerce.invoice.models import Invoice
 from ecommerce.tests.testcases import TestCase
@@ -24,6 +25,7 @@ from ecommerce.tests.testcases import TestCase
 Country = get_model('address', 'Country')
 Order = get_model('order', 'Order')
 PaymentEvent = get_model('order', 'PaymentEvent')
+PaymentNotification = get_model('payment', 'PaymentNotification')
 Selector = get_class('partner.strategy', 'Selector')
 Source = get_model('payment', 'Source')
 Product = get_model('catalogue', 'Product')
@@ -90,6 +92,23 @@ class StripeSubmitViewTests(PaymentEventsMixin, TestCase):
 
         assert response.status_code == 400
         assert response.content == '{}'
+        assert not PaymentNotification.objects.exists()
+
+    def test_duplicate_submission(self):
+        """ Verify that repeated submissions are sent to the receipt page without charging the card again. """
+        basket = self.create_basket()
+        data = self.generate_form_data(basket.id)
+        claim_payment_notification(Stripe.NAME, basket.order_number, basket.order_number)
+
+        with mock.patch.object(stripe.Charge, 'create') as charge_mock:
+            response = self.client.post(self.path, data)
+            assert not charge_mock.called
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {
+            'url': get_receipt_page_url(self.site_configuration, basket.order_number)
+        }
+        assert not Order.objects.filter(number=basket.order_number).exists()
 
     def test_billing_address_error(self):
         basket = self.create_basket()
@@ -1,20 +1,32 @@
+import hashlib
 import json
 import logging
 import re
+import threading
+from datetime import timedelta
 from urllib import urlencode
 
 import requests
 from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
+from edx_django_utils.cache import TieredCache
 from oscar.core.loading import get_model
 
+from ecommerce.core.background import BackgroundPool
 from ecommerce.core.constants import SEAT_PRODUCT_CLASS_NAME
+from ecommerce.core.utils import get_cache_key
 from ecommerce.extensions.analytics.utils import parse_tracking_context
-from ecommerce.extensions.payment.models import SDNCheckFailure
+from ecommerce.extensions.payment.models import PaymentNotification, SDNCheckFailure
 
 logger = logging.getLogger(__name__)
 Basket = get_model('basket', 'Basket')
 
+sdn_prescreen_pool = BackgroundPool(
+    'sdn_prescreen', settings.SDN_PRESCREEN_MAX_WORKERS, settings.SDN_PRESCREEN_MAX_PENDING
+)
+
 
 def middle_truncate(string, chars):
     """Truncate the provided string, if necessary.
@@ -103,13 +115,111 @@ def embargo_check(user, site, products):
     return True
 
 
+def get_payment_notification_cache_key(processor_name, key):
+    """ Returns the key of the cached order number of a payment notification. """
+    return get_cache_key(
+        resource='payment_notification',
+        processor_name=processor_name,
+        key=hashlib.md5(key.encode('utf-8')).hexdigest(),
+    )
+
+
+def claim_payment_notification(processor_name, key, order_number):
+    """ Claims the handling of a payment notification, or submission.
+
+    Repeated notifications are recognized from the cache, or else from the unique PaymentNotification
+    record written by the first of them. The claim of a notification that could not be handled must be
+    released, so that the notification can be retried.
+
+    Args:
+        processor_name (str): Name of the payment processor.
+        key (str): Identifier of the notification, e.g. its transaction ID.
+        order_number (str): Number of the order placed for the notification.
+
+    Returns:
+        (str, bool): The number of the order of the notification, and whether it was claimed. If it was not,
+            the notification was already claimed, and the order number is the one it was first claimed for.
+    """
+    cache_key = get_payment_notification_cache_key(processor_name, key)
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value, False
+
+    try:
+        with transaction.atomic():
+            PaymentNotification.objects.create(processor_name=processor_name, key=key, order_number=order_number)
+        claimed = True
+    except IntegrityError:
+        order_number = PaymentNotification.objects.get(processor_name=processor_name, key=key).order_number
+        claimed = False
+
+    TieredCache.set_all_tiers(cache_key, order_number, settings.PAYMENT_NOTIFICATION_CACHE_TIMEOUT)
+    return order_number, claimed
+
+
+def release_payment_notification(processor_name, key):
+    """ Releases the claim of a payment notification that could not be handled, so that it can be retried. """
+    PaymentNotification.objects.filter(processor_name=processor_name, key=key).delete()
+    TieredCache.delete_all_tiers(get_payment_notification_cache_key(processor_name, key))
+
+
+def delete_expired_payment_notifications(days, batch_size=1000):
+    """ Deletes, in batches, the payment notifications claimed more than the given number of days ago.
+
+    Payment processors stop repeating notifications, and learners resubmitting payments, long before then, so they
+    no longer need to be recognized.
+
+    Returns:
+        int: Number of deleted notifications.
+    """
+    expired = PaymentNotification.objects.filter(created__lt=now() - timedelta(days=days))
+    deleted = 0
+    while True:
+        ids = list(expired.order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+
+        deleted += PaymentNotification.objects.filter(id__in=ids).delete()[0]
+
+
 class SDNClient(object):
     """A utility class that handles SDN related operations."""
+    # Connections to the SDN API are pooled and reused by all clients of the process.
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self, api_url, api_key, sdn_list):
         self.api_url = api_url
         self.api_key = api_key
         self.sdn_list = sdn_list
 
+    @classmethod
+    def get_session(cls):
+        """ Returns the session shared by all clients of the process. """
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=settings.SDN_CHECK_POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._session = session
+        return cls._session
+
+    def get_cache_key(self, name, city, country):
+        """
+        Returns the key of the cached search results for an individual.
+
+        The details are normalized, so that retries with a differently cased or spaced name
+        share their results.
+        """
+        identity = u'\n'.join(u' '.join(unicode(value or '').split()).lower() for value in (name, city, country))
+        return get_cache_key(
+            resource='sdn_check',
+            api_url=self.api_url,
+            sdn_list=self.sdn_list,
+            identity=hashlib.md5(identity.encode('utf-8')).hexdigest(),
+        )
+
     def search(self, name, city, country):
         """
         Searches the OFAC list for an individual with the specified details.
@@ -118,6 +228,8 @@ class SDNClient(object):
             * SDN API returns a non-200 status code response
             * user is not found on the SDN list
 
+        Successful searches are cached for SDN_CHECK_CACHE_TIMEOUT seconds.
+
         Args:
             name (str): Individual's full name.
             city (str): Individual's city.
@@ -125,6 +237,11 @@ class SDNClient(object):
         Returns:
             dict: SDN API response.
         """
+        cache_key = self.get_cache_key(name, city, country)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
+
         params = urlencode({
             'sources': self.sdn_list,
             'api_key': self.api_key,
@@ -141,7 +258,7 @@ class SDNClient(object):
         )
 
         try:
-            response = requests.get(sdn_check_url, timeout=settings.SDN_CHECK_REQUEST_TIMEOUT)
+            response = self.get_session().get(sdn_check_url, timeout=settings.SDN_CHECK_REQUEST_TIMEOUT)
         except requests.exceptions.Timeout:
             logger.warning('Connection to US Treasury SDN API timed out for [%s].', name)
             raise
@@ -153,7 +270,33 @@ class SDNClient(object):
             )
             raise requests.exceptions.HTTPError('Unable to connect to SDN API')
 
-        return json.loads(response.content)
+        search_results = json.loads(response.content)
+        TieredCache.set_all_tiers(cache_key, search_results, settings.SDN_CHECK_CACHE_TIMEOUT)
+        return search_results
+
+    def prescreen(self, name, city, country):
+        """
+        Searches the OFAC list for an individual in the background, so that the results are
+        cached by the time the individual submits their payment.
+
+        Failures are logged by `search`, and left to be retried when the payment is submitted,
+        as are pre-screenings skipped because too many are pending.
+
+        Args:
+            name (str): Individual's full name.
+            city (str): Individual's city.
+            country (str): ISO 3166-1 alpha-2 country code where the individual is from.
+
+        Returns:
+            AsyncResult: The result of the search, or None if it was skipped.
+        """
+        def search():
+            try:
+                self.search(name, city, country)
+            except requests.exceptions.RequestException:
+                pass
+
+        return sdn_prescreen_pool.submit(search)
 
     def deactivate_user(self, basket, name, city, country, search_results):
         """ Deactivates a user account.
@@ -36,7 +36,11 @@ from ecommerce.extensions.payment.exceptions import (
     InvalidSignatureError
 )
 from ecommerce.extensions.payment.processors.cybersource import Cybersource
-from ecommerce.extensions.payment.utils import clean_field_value
+from ecommerce.extensions.payment.utils import (
+    claim_payment_notification,
+    clean_field_value,
+    release_payment_notification
+)
 from ecommerce.extensions.payment.views import BasePaymentSubmitView
 
 logger = logging.getLogger(__name__)
@@ -295,8 +299,25 @@ class CybersourceInterstitialView(CybersourceNotificationMixin, View):
 
     def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         """Process a CyberSource merchant notification and place an order for paid products as appropriate."""
+        notification = request.POST.dict()
+        transaction_id = notification.get('transaction_id')
+        # Only notifications signed by CyberSource are claimed, so that forged ones can neither claim, nor release,
+        # the transaction of a genuine notification. Forged notifications are rejected by validate_notification.
+        claimed = False
+        if transaction_id and self.payment_processor.is_signature_valid(notification):
+            __, claimed = claim_payment_notification(
+                self.payment_processor.NAME, transaction_id, notification.get('req_reference_number')
+            )
+            if not claimed:
+                logger.info(
+                    'Received duplicate CyberSource payment notification for transaction [%s], associated with '
+                    'order [%s]. The notification was ignored.',
+                    transaction_id,
+                    notification.get('req_reference_number')
+                )
+                return self.redirect_to_receipt_page(notification)
+
         try:
-            notification = request.POST.dict()
             basket = self.validate_notification(notification)
         except DuplicateReferenceNumber:
             # CyberSource has told us that they've declined an attempt to pay
@@ -317,6 +338,8 @@ class CybersourceInterstitialView(CybersourceNotificationMixin, View):
             # We intentionally avoid thawing the old basket here to prevent order
             # numbers from being reused. For more, refer to commit a1efc68.
             new_basket.merge(old_basket, add_quantities=False)
+            if claimed:
+                self.release_notification(notification)
 
             message = _(
                 'An error occurred while processing your payment. You have not been charged. '
@@ -331,6 +354,8 @@ class CybersourceInterstitialView(CybersourceNotificationMixin, View):
 
             return redirect(reverse('basket:summary'))
         except:  # pylint: disable=bare-except
+            if claimed:
+                self.release_notification(notification)
             return redirect(reverse('payment_error'))
 
         try:
@@ -341,6 +366,11 @@ class CybersourceInterstitialView(CybersourceNotificationMixin, View):
         except:  # pylint: disable=bare-except
             return redirect(reverse('payment_error'))
 
+    def release_notification(self, notification):
+        """ Allows a notification that did not result in an order to be handled again. """
+        if notification.get('transaction_id'):
+            release_payment_notification(self.payment_processor.NAME, notification['transaction_id'])
+
     def redirect_to_receipt_page(self, notification):
         receipt_page_url = get_receipt_page_url(
             self.request.site.siteconfiguration,
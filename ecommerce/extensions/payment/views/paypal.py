@@ -20,6 +20,7 @@ from ecommerce.extensions.basket.utils import basket_add_organization_attribute
 from ecommerce.extensions.checkout.mixins import EdxOrderPlacementMixin
 from ecommerce.extensions.checkout.utils import get_receipt_page_url
 from ecommerce.extensions.payment.processors.paypal import Paypal
+from ecommerce.extensions.payment.utils import claim_payment_notification, release_payment_notification
 
 logger = logging.getLogger(__name__)
 
@@ -84,9 +85,34 @@ class PaypalPaymentExecutionView(EdxOrderPlacementMixin, View):
         logger.info(u"Payment [%s] approved by payer [%s]", payment_id, payer_id)
 
         paypal_response = request.GET.dict()
+
+        # Users may return from PayPal more than once, e.g. by refreshing the page. Only the first visit should
+        # execute the payment, so repeat visits are sent to the receipt page before the basket is even loaded.
+        basket_id = PaymentProcessorResponse.objects.filter(
+            processor_name=self.payment_processor.NAME,
+            transaction_id=payment_id
+        ).values_list('basket_id', flat=True).first()
+        if payment_id and basket_id:
+            order_number = OrderNumberGenerator().order_number_from_basket_id(
+                request.site.siteconfiguration.partner,
+                basket_id
+            )
+            claimed_order_number, claimed = claim_payment_notification(
+                self.payment_processor.NAME, payment_id, order_number
+            )
+            if not claimed:
+                logger.info(
+                    u'PayPal payment [%s] was already executed for order [%s].', payment_id, claimed_order_number
+                )
+                return redirect(get_receipt_page_url(
+                    order_number=claimed_order_number,
+                    site_configuration=request.site.siteconfiguration
+                ))
+
         basket = self._get_basket(payment_id)
 
         if not basket:
+            self.release_notification(payment_id)
             return redirect(self.payment_processor.error_url)
 
         receipt_url = get_receipt_page_url(
@@ -99,15 +125,22 @@ class PaypalPaymentExecutionView(EdxOrderPlacementMixin, View):
                 try:
                     self.handle_payment(paypal_response, basket)
                 except PaymentError:
+                    self.release_notification(payment_id)
                     return redirect(self.payment_processor.error_url)
         except:  # pylint: disable=bare-except
             logger.exception('Attempts to handle payment for basket [%d] failed.', basket.id)
+            self.release_notification(payment_id)
             return redirect(receipt_url)
 
         self.call_handle_order_placement(basket, request)
 
         return redirect(receipt_url)
 
+    def release_notification(self, payment_id):
+        """ Allows the execution of a payment that did not result in an order to be retried. """
+        if payment_id:
+            release_payment_notification(self.payment_processor.NAME, payment_id)
+
     def call_handle_order_placement(self, basket, request):
         try:
             shipping_method = NoShippingRequired()
@@ -8,6 +8,7 @@ from ecommerce.extensions.checkout.mixins import EdxOrderPlacementMixin
 from ecommerce.extensions.checkout.utils import get_receipt_page_url
 from ecommerce.extensions.payment.forms import StripeSubmitForm
 from ecommerce.extensions.payment.processors.stripe import Stripe
+from ecommerce.extensions.payment.utils import claim_payment_notification, release_payment_notification
 from ecommerce.extensions.payment.views import BasePaymentSubmitView
 
 logger = logging.getLogger(__name__)
@@ -37,8 +38,21 @@ class StripeSubmitView(EdxOrderPlacementMixin, BasePaymentSubmitView):
         token = form_data['stripe_token']
         order_number = basket.order_number
 
+        receipt_url = get_receipt_page_url(
+            site_configuration=self.request.site.siteconfiguration,
+            order_number=order_number
+        )
+
         basket_add_organization_attribute(basket, self.request.POST)
 
+        # The payment form may be submitted more than once, e.g. by double-clicking. Only the first submission
+        # should charge the card. It is claimed after the basket is updated, since only a failed payment releases the
+        # claim.
+        __, claimed = claim_payment_notification(self.payment_processor.NAME, order_number, order_number)
+        if not claimed:
+            logger.info('Stripe payment for basket [%d] was already submitted for order [%s].', basket.id, order_number)
+            return JsonResponse({'url': receipt_url}, status=200)
+
         try:
             billing_address = self.payment_processor.get_address_from_token(token)
         except Exception:  # pylint: disable=broad-except
@@ -53,6 +67,7 @@ class StripeSubmitView(EdxOrderPlacementMixin, BasePaymentSubmitView):
             self.handle_payment(token, basket)
         except Exception:  # pylint: disable=broad-except
             logger.exception('An error occurred while processing the Stripe payment for basket [%d].', basket.id)
+            release_payment_notification(self.payment_processor.NAME, order_number)
             return JsonResponse({}, status=400)
 
         shipping_method = NoShippingRequired()
@@ -72,8 +87,4 @@ class StripeSubmitView(EdxOrderPlacementMixin, BasePaymentSubmitView):
         )
         self.handle_post_order(order)
 
-        receipt_url = get_receipt_page_url(
-            site_configuration=self.request.site.siteconfiguration,
-            order_number=order_number
-        )
         return JsonResponse({'url': receipt_url}, status=201)
@@ -1,7 +1,10 @@
+from collections import defaultdict
+
 from oscar.core.loading import get_model
 
 from ecommerce.extensions.fulfillment.status import ORDER
 
+Line = get_model('order', 'Line')
 Option = get_model('catalogue', 'Option')
 Refund = get_model('refund', 'Refund')
 RefundLine = get_model('refund', 'RefundLine')
@@ -31,8 +34,7 @@ def find_orders_associated_with_course(user, course_id):
 
     # Find all complete orders associated with the course.
     orders = user.orders.filter(status=ORDER.COMPLETE,
-                                lines__product__attribute_values__attribute__code='course_key',
-                                lines__product__attribute_values__value_text=course_id)
+                                lines__product__seat_attributes__course_key=course_id)
 
     return list(orders)
 
@@ -74,16 +76,19 @@ def create_refunds(orders, course_id):
     Returns:
         list: refunds created
     """
-    refunds = []
-
-    for order in orders:
-        # Find lines associated with the course and not refunded.
-        lines = order.lines.filter(refund_lines__id__isnull=True,
-                                   product__attribute_values__attribute__code='course_key',
-                                   product__attribute_values__value_text=course_id)
-
-        refund = Refund.create_with_lines(order, lines)
-        if refund is not None:
-            refunds.append(refund)
+    # Find lines associated with the course and not refunded.
+    lines = Line.objects.filter(
+        order__in=orders,
+        refund_lines__id__isnull=True,
+        product__seat_attributes__course_key=course_id
+    )
+    lines_by_order = defaultdict(list)
+    for line in lines:
+        lines_by_order[line.order_id].append(line)
+
+    refunds = Refund.create_in_bulk([(order, lines_by_order[order.id]) for order in orders])
+    for refund in refunds:
+        if refund.total_credit_excl_tax == 0:
+            refund.approve(notify_purchaser=False)
 
     return refunds
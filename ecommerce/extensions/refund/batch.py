@@ -0,0 +1,155 @@
+""" Refunds of many orders at once, e.g. for all the learners of a cancelled course run. """
+from __future__ import unicode_literals
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from multiprocessing.pool import ThreadPool
+
+from django.conf import settings
+from django.db import connection
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.fulfillment.status import ORDER
+
+logger = logging.getLogger(__name__)
+Line = get_model('order', 'Line')
+Refund = get_model('refund', 'Refund')
+
+
+class RateLimiter(object):
+    """ Spaces out calls made from many threads, so that no more than `rate` of them start per second. """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.next_call = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """ Blocks until the next call is allowed. """
+        with self.lock:
+            current = time.time()
+            delay = self.next_call - current
+            self.next_call = max(current, self.next_call) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BatchRefundProcessor(object):
+    """
+    Refunds many orders at once.
+
+    Refunds, and their lines, are created in bulk. They are then approved by a pool of workers, so that
+    credits are issued and fulfillments revoked concurrently, at a rate limited to protect the payment
+    processors and the LMS.
+    """
+
+    def __init__(self, max_workers=None, rate_limit=None, revoke_fulfillment=True, notify_purchaser=True):
+        self.max_workers = max_workers or settings.REFUND_BATCH_MAX_WORKERS
+        self.rate_limiter = RateLimiter(settings.REFUND_BATCH_RATE_LIMIT if rate_limit is None else rate_limit)
+        self.revoke_fulfillment = revoke_fulfillment
+        self.notify_purchaser = notify_purchaser
+
+    def get_lines_for_enrollments(self, enrollments):
+        """
+        Returns the unrefunded lines of the complete orders of the given enrollments.
+
+        Arguments:
+            enrollments (list of (str, str)): Usernames of learners, with the IDs of their courses.
+
+        Returns:
+            list of (Order, list of Line)
+        """
+        enrollments = set(enrollments)
+        lines = Line.objects.filter(
+            order__status=ORDER.COMPLETE,
+            order__user__username__in={username for username, __ in enrollments},
+            product__seat_attributes__course_key__in={course_id for __, course_id in enrollments},
+            refund_lines__id__isnull=True
+        ).select_related('order__user', 'product__seat_attributes').order_by('order_id', 'id')
+
+        return self._group_by_order(
+            line for line in lines
+            if (line.order.user.username, line.product.seat_attributes.course_key) in enrollments
+        )
+
+    def get_lines_for_orders(self, order_numbers):
+        """
+        Returns the unrefunded lines of the given complete orders.
+
+        Arguments:
+            order_numbers (list of str)
+
+        Returns:
+            list of (Order, list of Line)
+        """
+        lines = Line.objects.filter(
+            order__number__in=order_numbers,
+            order__status=ORDER.COMPLETE,
+            refund_lines__id__isnull=True
+        ).select_related('order__user').order_by('order_id', 'id')
+
+        return self._group_by_order(lines)
+
+    def _group_by_order(self, lines):
+        orders = OrderedDict()
+        lines_by_order = defaultdict(list)
+        for line in lines:
+            orders.setdefault(line.order_id, line.order)
+            lines_by_order[line.order_id].append(line)
+
+        return [(order, lines_by_order[order_id]) for order_id, order in orders.items()]
+
+    def create_refunds(self, orders_lines):
+        """ Creates the refunds of the given orders and lines, in bulk. """
+        return Refund.create_in_bulk(orders_lines)
+
+    def approve_refunds(self, refunds, callback=None):
+        """
+        Approves refunds concurrently.
+
+        Arguments:
+            refunds (list of Refund)
+            callback (callable): Called with each refund, and whether it was approved, as they are processed.
+
+        Returns:
+            OrderedDict: Whether each refund was approved, by refund.
+        """
+        approved = OrderedDict()
+        if not refunds:
+            return approved
+
+        pool = ThreadPool(min(self.max_workers, len(refunds)))
+        try:
+            for index, result in enumerate(pool.imap(self._approve, refunds)):
+                approved[refunds[index]] = result
+                if callback:
+                    callback(refunds[index], result)
+        finally:
+            pool.close()
+            pool.join()
+
+        return approved
+
+    def _approve(self, refund):
+        self.rate_limiter.wait()
+        try:
+            # Free refunds are approved silently, as by Refund.create_with_lines.
+            notify_purchaser = self.notify_purchaser and refund.total_credit_excl_tax != 0
+            return refund.approve(revoke_fulfillment=self.revoke_fulfillment, notify_purchaser=notify_purchaser)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Failed to approve refund [%d].', refund.id)
+            return False
+        finally:
+            connection.close()
+
+    def refund(self, orders_lines, callback=None):
+        """
+        Creates and approves the refunds of the given orders and lines.
+
+        Returns:
+            OrderedDict: Whether each refund was approved, by refund.
+        """
+        return self.approve_refunds(self.create_refunds(orders_lines), callback=callback)
@@ -0,0 +1,137 @@
+from __future__ import unicode_literals
+
+import logging
+import os
+from textwrap import dedent
+
+import unicodecsv as csv
+from django.core.management.base import BaseCommand, CommandError
+
+from ecommerce.extensions.refund.batch import BatchRefundProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to refund many enrollments, or orders, e.g. when a course run is cancelled.
+
+    Enrollments are read from a CSV file of usernames and course IDs, orders from a file of order numbers.
+    They are refunded in batches, after each of which they are appended to the checkpoint file. If the
+    command is interrupted, running it again with the same checkpoint file resumes where it stopped.
+
+    Example:
+
+        ./manage.py bulk_refund --enrollments_file enrollments.csv --checkpoint_file refunded.csv
+    """
+    help = dedent(__doc__)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--enrollments_file',
+                            action='store',
+                            dest='enrollments_file',
+                            default=None,
+                            help='Path to the CSV file of usernames and course IDs to refund.')
+        parser.add_argument('--orders_file',
+                            action='store',
+                            dest='orders_file',
+                            default=None,
+                            help='Path to the file of order numbers to refund.')
+        parser.add_argument('--checkpoint_file',
+                            action='store',
+                            dest='checkpoint_file',
+                            default=None,
+                            help='Path to the file the processed enrollments or orders are written to, and skipped '
+                                 'from when the command is run again.')
+        parser.add_argument('--report_file',
+                            action='store',
+                            dest='report_file',
+                            default=None,
+                            help='Path to the CSV file the created refunds are written to.')
+        parser.add_argument('--batch_size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=100,
+                            help='Number of enrollments or orders refunded per batch.')
+        parser.add_argument('--max_workers',
+                            action='store',
+                            dest='max_workers',
+                            type=int,
+                            default=None,
+                            help='Maximum number of refunds approved concurrently. '
+                                 'Defaults to the REFUND_BATCH_MAX_WORKERS setting.')
+        parser.add_argument('--rate_limit',
+                            action='store',
+                            dest='rate_limit',
+                            type=float,
+                            default=None,
+                            help='Maximum number of refund approvals started per second. '
+                                 'Defaults to the REFUND_BATCH_RATE_LIMIT setting.')
+
+    def handle(self, *args, **options):
+        enrollments_file = options['enrollments_file']
+        orders_file = options['orders_file']
+        if bool(enrollments_file) == bool(orders_file):
+            raise CommandError('Pass exactly one of the --enrollments_file and --orders_file arguments.')
+
+        items = self.read_rows(enrollments_file or orders_file, required=True)
+        checkpoint_file = options['checkpoint_file']
+        processed = set(self.read_rows(checkpoint_file)) if checkpoint_file else set()
+        pending = [item for item in items if item not in processed]
+        logger.info('Refunding %d %s. %d were already processed.', len(pending),
+                    'enrollments' if enrollments_file else 'orders', len(items) - len(pending))
+
+        processor = BatchRefundProcessor(max_workers=options['max_workers'], rate_limit=options['rate_limit'])
+        summary = {'approved': 0, 'failed': 0}
+        report = []
+
+        def log_progress(refund, approved):
+            summary['approved' if approved else 'failed'] += 1
+            report.append([refund.id, refund.order.number, refund.user.username, refund.total_credit_excl_tax,
+                           refund.currency, refund.status])
+            if not approved:
+                logger.error('Refund [%d] of order [%s] was not approved. Its status is [%s].',
+                             refund.id, refund.order.number, refund.status)
+
+        batch_size = options['batch_size']
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            if enrollments_file:
+                orders_lines = processor.get_lines_for_enrollments(batch)
+            else:
+                orders_lines = processor.get_lines_for_orders([order_number for order_number, in batch])
+
+            processor.refund(orders_lines, callback=log_progress)
+
+            if checkpoint_file:
+                self.write_rows(checkpoint_file, batch)
+            logger.info('Processed %d of %d.', start + len(batch), len(pending))
+
+        if options['report_file']:
+            self.write_rows(
+                options['report_file'], report,
+                header=['refund_id', 'order_number', 'username', 'amount', 'currency', 'status']
+            )
+
+        logger.info('Created %d refunds: %d approved, %d failed.',
+                    summary['approved'] + summary['failed'], summary['approved'], summary['failed'])
+
+    def read_rows(self, path, required=False):
+        """ Returns the non-empty rows of a CSV file, as tuples. """
+        if not os.path.exists(path):
+            if required:
+                raise CommandError('File [{}] does not exist.'.format(path))
+            return []
+
+        with open(path, 'rb') as csv_file:
+            return [tuple(value.strip() for value in row) for row in csv.reader(csv_file, encoding='utf-8') if row]
+
+    def write_rows(self, path, rows, header=None):
+        """ Appends rows to a CSV file, starting it with the header if it is new. """
+        is_new = not os.path.exists(path)
+        with open(path, 'ab') as csv_file:
+            writer = csv.writer(csv_file, encoding='utf-8')
+            if header and is_new:
+                writer.writerow(header)
+            writer.writerows(rows)
@@ -0,0 +1,115 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+
+import mock
+from django.core.management import CommandError, call_command
+from oscar.core.loading import get_model
+from oscar.test.factories import UserFactory
+from testfixtures import LogCapture
+
+from ecommerce.extensions.refund.tests.mixins import RefundTestMixin
+from ecommerce.tests.testcases import TestCase
+
+LOGGER_NAME = 'ecommerce.extensions.refund.management.commands.bulk_refund'
+Refund = get_model('refund', 'Refund')
+
+
+class BulkRefundTests(RefundTestMixin, TestCase):
+    """Tests for bulk_refund management command."""
+
+    def setUp(self):
+        super(BulkRefundTests, self).setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.users = [UserFactory(), UserFactory()]
+        self.orders = [self.create_order(user=user) for user in self.users]
+
+    def tearDown(self):
+        super(BulkRefundTests, self).tearDown()
+        shutil.rmtree(self.tmp_dir)
+
+    def write_file(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def call_command(self, **kwargs):
+        with mock.patch.object(Refund, 'approve', return_value=True):
+            with LogCapture(LOGGER_NAME) as log:
+                call_command('bulk_refund', rate_limit=0, **kwargs)
+        return log
+
+    def test_missing_arguments(self):
+        """ Exactly one of the enrollments and orders files should be required. """
+        with self.assertRaises(CommandError):
+            call_command('bulk_refund')
+
+        with self.assertRaises(CommandError):
+            call_command('bulk_refund', enrollments_file='a.csv', orders_file='b.csv')
+
+    def test_invalid_file_path(self):
+        """ Verify command raises the CommandError for invalid file path. """
+        with self.assertRaises(CommandError):
+            call_command('bulk_refund', orders_file='fake/path')
+
+    def test_refund_enrollments(self):
+        """ Checkpointed enrollments should be skipped, and the others refunded and checkpointed. """
+        enrollments = ['{},{}'.format(user.username, self.course.id) for user in self.users]
+        enrollments_file = self.write_file('enrollments.csv', '\n'.join(enrollments))
+        checkpoint_file = self.write_file('checkpoint.csv', enrollments[0] + '\r\n')
+        report_file = os.path.join(self.tmp_dir, 'report.csv')
+
+        log = self.call_command(
+            enrollments_file=enrollments_file, checkpoint_file=checkpoint_file, report_file=report_file, batch_size=1
+        )
+
+        refund = Refund.objects.get()
+        self.assertEqual(refund.order, self.orders[1])
+        log.check(
+            (LOGGER_NAME, 'INFO', 'Refunding 1 enrollments. 1 were already processed.'),
+            (LOGGER_NAME, 'INFO', 'Processed 1 of 1.'),
+            (LOGGER_NAME, 'INFO', 'Created 1 refunds: 1 approved, 0 failed.'),
+        )
+
+        with open(checkpoint_file) as f:
+            self.assertEqual(f.read().splitlines(), enrollments)
+
+        with open(report_file) as f:
+            self.assertEqual(f.read().splitlines(), [
+                'refund_id,order_number,username,amount,currency,status',
+                '{},{},{},{},{},{}'.format(refund.id, self.orders[1].number, self.users[1].username,
+                                           refund.total_credit_excl_tax, refund.currency, refund.status),
+            ])
+
+        # Running the command again should not refund anything.
+        log = self.call_command(enrollments_file=enrollments_file, checkpoint_file=checkpoint_file)
+        log.check(
+            (LOGGER_NAME, 'INFO', 'Refunding 0 enrollments. 2 were already processed.'),
+            (LOGGER_NAME, 'INFO', 'Created 0 refunds: 0 approved, 0 failed.'),
+        )
+
+    def test_refund_orders(self):
+        """ The given orders should be refunded. """
+        orders_file = self.write_file('orders.csv', '\n'.join(order.number for order in self.orders))
+
+        with mock.patch.object(Refund, 'approve', return_value=False):
+            with LogCapture(LOGGER_NAME) as log:
+                call_command('bulk_refund', orders_file=orders_file, rate_limit=0)
+
+        refunds = list(Refund.objects.order_by('id'))
+        self.assertEqual([refund.order for refund in refunds], self.orders)
+        log.check(*(
+            [(LOGGER_NAME, 'INFO', 'Refunding 2 orders. 0 were already processed.')] +
+            [
+                (LOGGER_NAME, 'ERROR', 'Refund [{}] of order [{}] was not approved. Its status is [{}].'.format(
+                    refund.id, refund.order.number, refund.status
+                )) for refund in refunds
+            ] +
+            [
+                (LOGGER_NAME, 'INFO', 'Processed 2 of 2.'),
+                (LOGGER_NAME, 'INFO', 'Created 2 refunds: 0 approved, 2 failed.'),
+            ]
+        ))
@@ -3,7 +3,7 @@ from __future__ import unicode_literals
 import logging
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import ugettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
 from ecommerce_worker.sailthru.v1.tasks import send_course_refund_email
@@ -103,41 +103,77 @@ class Refund(StatusMixin, TimeStampedModel):
             None: If no unrefunded order lines have been provided.
             Refund: With RefundLines corresponding to each given unrefunded order line.
         """
-        unrefunded_lines = [line for line in lines if not line.refund_lines.exclude(status=REFUND_LINE.DENIED).exists()]
-
-        if unrefunded_lines:
-            status = getattr(settings, 'OSCAR_INITIAL_REFUND_STATUS', REFUND.OPEN)
-            total_credit_excl_tax = sum([line.line_price_excl_tax for line in unrefunded_lines])
-            refund = cls.objects.create(
-                order=order,
-                user=order.user,
-                status=status,
-                total_credit_excl_tax=total_credit_excl_tax
-            )
+        refunds = cls.create_in_bulk([(order, lines)])
 
-            audit_log(
-                'refund_created',
-                amount=total_credit_excl_tax,
-                currency=refund.currency,
-                order_number=order.number,
-                refund_id=refund.id,
-                user_id=refund.user.id
-            )
+        if refunds:
+            refund = refunds[0]
+            if refund.total_credit_excl_tax == 0:
+                refund.approve(notify_purchaser=False)
+
+            return refund
+
+    @classmethod
+    def create_in_bulk(cls, orders_lines):
+        """Creates Refunds, with corresponding RefundLines, for many orders at once.
+
+        Only creates RefundLines for unrefunded order lines, found with a single query, and creates
+        all of them with a single insert. Unlike create_with_lines, refunds are not approved.
 
-            status = getattr(settings, 'OSCAR_INITIAL_REFUND_LINE_STATUS', REFUND_LINE.OPEN)
-            for line in unrefunded_lines:
-                RefundLine.objects.create(
-                    refund=refund,
-                    order_line=line,
-                    line_credit_excl_tax=line.line_price_excl_tax,
-                    quantity=line.quantity,
-                    status=status
+        Arguments:
+            orders_lines (list of (order.Order, list of order.Line)): Orders, with their lines to be refunded.
+
+        Returns:
+            list of Refund: One for each order with unrefunded lines.
+        """
+        orders_lines = [(order, list(lines)) for order, lines in orders_lines]
+        refunded_line_ids = set(
+            RefundLine.objects.filter(
+                order_line_id__in=[line.id for __, lines in orders_lines for line in lines]
+            ).exclude(status=REFUND_LINE.DENIED).values_list('order_line_id', flat=True)
+        )
+
+        refund_status = getattr(settings, 'OSCAR_INITIAL_REFUND_STATUS', REFUND.OPEN)
+        line_status = getattr(settings, 'OSCAR_INITIAL_REFUND_LINE_STATUS', REFUND_LINE.OPEN)
+        refunds = []
+        refund_lines = []
+
+        with transaction.atomic():
+            for order, lines in orders_lines:
+                unrefunded_lines = [line for line in lines if line.id not in refunded_line_ids]
+                if not unrefunded_lines:
+                    continue
+
+                total_credit_excl_tax = sum([line.line_price_excl_tax for line in unrefunded_lines])
+                refund = cls.objects.create(
+                    order=order,
+                    user_id=order.user_id,
+                    status=refund_status,
+                    total_credit_excl_tax=total_credit_excl_tax
                 )
 
-            if total_credit_excl_tax == 0:
-                refund.approve(notify_purchaser=False)
+                audit_log(
+                    'refund_created',
+                    amount=total_credit_excl_tax,
+                    currency=refund.currency,
+                    order_number=order.number,
+                    refund_id=refund.id,
+                    user_id=refund.user_id
+                )
 
-            return refund
+                refunds.append(refund)
+                refund_lines += [
+                    RefundLine(
+                        refund=refund,
+                        order_line=line,
+                        line_credit_excl_tax=line.line_price_excl_tax,
+                        quantity=line.quantity,
+                        status=line_status
+                    ) for line in unrefunded_lines
+                ]
+
+            RefundLine.objects.bulk_create(refund_lines)
+
+        return refunds
 
     @property
     def num_items(self):
@@ -0,0 +1,96 @@
+import mock
+from oscar.core.loading import get_model
+from oscar.test.factories import UserFactory
+
+from ecommerce.extensions.fulfillment.status import ORDER
+from ecommerce.extensions.refund.batch import BatchRefundProcessor, RateLimiter
+from ecommerce.extensions.refund.tests.factories import RefundFactory, RefundLineFactory
+from ecommerce.extensions.refund.tests.mixins import RefundTestMixin
+from ecommerce.tests.testcases import TestCase
+
+Refund = get_model('refund', 'Refund')
+
+
+class RateLimiterTests(TestCase):
+    @mock.patch('ecommerce.extensions.refund.batch.time')
+    def test_wait(self, mock_time):
+        """ Calls should be spaced out by the inverse of the rate. """
+        mock_time.time.return_value = 100.0
+        limiter = RateLimiter(4)
+
+        for __ in range(3):
+            limiter.wait()
+
+        self.assertEqual([call[0][0] for call in mock_time.sleep.call_args_list], [0.25, 0.5])
+
+    @mock.patch('ecommerce.extensions.refund.batch.time')
+    def test_no_limit(self, mock_time):
+        """ Calls should not be delayed if the rate is not limited. """
+        mock_time.time.return_value = 100.0
+        limiter = RateLimiter(0)
+
+        for __ in range(3):
+            limiter.wait()
+
+        self.assertFalse(mock_time.sleep.called)
+
+
+class BatchRefundProcessorTests(RefundTestMixin, TestCase):
+    def setUp(self):
+        super(BatchRefundProcessorTests, self).setUp()
+        self.processor = BatchRefundProcessor(max_workers=2, rate_limit=0)
+
+    def test_get_lines_for_enrollments(self):
+        """ Only the unrefunded lines of the complete orders of the given enrollments should be returned. """
+        users = [UserFactory(), UserFactory(), UserFactory()]
+        orders = [self.create_order(user=user, multiple_lines=True) for user in users]
+        self.create_order(user=users[0], status=ORDER.OPEN)
+        RefundLineFactory(order_line=orders[1].lines.first())
+
+        enrollments = [(users[0].username, self.course.id), (users[1].username, self.course.id),
+                       (users[2].username, 'course-v1:other+course+run')]
+        with self.assertNumQueries(1):
+            actual = self.processor.get_lines_for_enrollments(enrollments)
+
+        self.assertEqual(actual, [
+            (orders[0], list(orders[0].lines.order_by('id'))),
+            (orders[1], list(orders[1].lines.order_by('id')[1:])),
+        ])
+
+    def test_get_lines_for_orders(self):
+        """ The unrefunded lines of the given complete orders should be returned. """
+        orders = [self.create_order(user=UserFactory(), multiple_lines=True) for __ in range(2)]
+        open_order = self.create_order(user=UserFactory(), status=ORDER.OPEN)
+
+        actual = self.processor.get_lines_for_orders([order.number for order in orders + [open_order]])
+        self.assertEqual(actual, [(order, list(order.lines.order_by('id'))) for order in orders])
+
+    def test_approve_refunds(self):
+        """ Refunds should be approved concurrently, with failures reported to the callback. """
+        refunds = [RefundFactory() for __ in range(3)]
+        results = {refunds[0].id: True, refunds[1].id: False}
+
+        def approve(refund, **kwargs):  # pylint: disable=unused-argument
+            if refund.id not in results:
+                raise Exception('Failed')
+            return results[refund.id]
+
+        callback = mock.Mock()
+        with mock.patch.object(Refund, 'approve', autospec=True, side_effect=approve) as mock_approve:
+            with mock.patch('ecommerce.extensions.refund.batch.logger.exception') as mock_log:
+                actual = self.processor.approve_refunds(refunds, callback=callback)
+                mock_log.assert_called_once_with('Failed to approve refund [%d].', refunds[2].id)
+
+        self.assertEqual(actual.items(), [(refunds[0], True), (refunds[1], False), (refunds[2], False)])
+        self.assertEqual(callback.call_args_list, [mock.call(refund, result) for refund, result in actual.items()])
+        mock_approve.assert_any_call(refunds[0], revoke_fulfillment=True, notify_purchaser=True)
+
+    def test_refund_free_orders(self):
+        """ The purchasers of free orders should not be notified of their refund. """
+        order = self.create_order(user=UserFactory(), free=True)
+
+        with mock.patch.object(Refund, 'approve', return_value=True) as mock_approve:
+            actual = self.processor.refund([(order, list(order.lines.all()))])
+
+        self.assertEqual(actual.values(), [True])
+        mock_approve.assert_called_once_with(revoke_fulfillment=True, notify_purchaser=False)
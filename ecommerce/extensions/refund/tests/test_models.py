@@ -1,15 +1,18 @@
 from __future__ import unicode_literals
 
+import json
 from decimal import Decimal
 
 import ddt
 import httpretty
 import mock
 from django.conf import settings
+from django.test import override_settings
 from oscar.apps.payment.exceptions import PaymentError
 from oscar.core.loading import get_class, get_model
 from oscar.test.factories import UserFactory
 from testfixtures import LogCapture
+from threadlocals.threadlocals import set_thread_variable
 
 from ecommerce.core.constants import SEAT_PRODUCT_CLASS_NAME
 from ecommerce.core.url_utils import get_lms_enrollment_api_url
@@ -151,6 +154,28 @@ class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
             else:
                 l.check()
 
+    def test_create_in_bulk(self):
+        """
+        Refund.create_in_bulk should create Refunds for the orders with unrefunded lines, with a fixed
+        number of queries per refund.
+        """
+        orders = [self.create_order(user=UserFactory(), multiple_lines=True) for __ in range(3)]
+        RefundLineFactory(order_line=orders[1].lines.first())
+        orders_lines = [(order, list(order.lines.all())) for order in orders]
+        orders_lines[2] = (orders[2], [orders_lines[2][1][0]])
+        RefundLineFactory(order_line=orders_lines[2][1][0])
+
+        # One query for refunded lines, one insert per refund and one for all refund lines,
+        # and a savepoint and its release.
+        with self.assertNumQueries(6):
+            refunds = Refund.create_in_bulk(orders_lines)
+
+        self.assertEqual([refund.order for refund in refunds], orders[:2])
+        self.assert_refund_matches_order(refunds[0], orders[0])
+        self.assertEqual(
+            [line.order_line for line in refunds[1].lines.all()], list(orders[1].lines.all()[1:])
+        )
+
     @httpretty.activate
     @mock.patch('ecommerce.extensions.fulfillment.modules.EnrollmentFulfillmentModule.revoke_line')
     def test_zero_dollar_refund(self, mock_revoke_line):
@@ -268,6 +293,26 @@ class RefundTests(RefundTestMixin, StatusTestsMixin, TestCase):
         self.assertTrue(refund.approve())
         self.assertEqual(refund.status, REFUND.COMPLETE)
 
+    @httpretty.activate
+    @override_settings(PAYMENT_PROCESSORS=['ecommerce.extensions.payment.tests.processors.DummyProcessor'])
+    def test_approve_without_request(self):
+        """ Refunds approved outside of requests, e.g. by the refund command, should revoke the enrollments. """
+        httpretty.register_uri(
+            httpretty.POST,
+            self.site.siteconfiguration.build_lms_url('/api/enrollment/v1/enrollment'),
+            status=200,
+            body='{}',
+            content_type='application/json'
+        )
+        order = self.create_order(user=UserFactory())
+        refund = self.create_refund(order=order, user=order.user)
+        set_thread_variable('request', None)
+
+        self.assertTrue(refund.approve())
+        self.assertEqual(refund.status, REFUND.COMPLETE)
+        self.assert_line_status(refund, REFUND_LINE.COMPLETE)
+        self.assertFalse(json.loads(httpretty.last_request().body)['is_active'])
+
     def test_approve_payment_error(self):
         """
         If payment refund fails, the Refund status should be set to Payment Refund Error, and the RefundLine
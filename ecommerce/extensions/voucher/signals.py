@@ -0,0 +1,36 @@
+import logging
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from oscar.core.loading import get_model
+
+from ecommerce.extensions.voucher.utils import invalidate_voucher_offers_cache
+
+logger = logging.getLogger(__name__)
+
+Benefit = get_model('offer', 'Benefit')
+Product = get_model('catalogue', 'Product')
+Range = get_model('offer', 'Range')
+RangeProduct = get_model('offer', 'RangeProduct')
+StockRecord = get_model('partner', 'StockRecord')
+Voucher = get_model('voucher', 'Voucher')
+
+
+@receiver(post_save, sender=Benefit)
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Range)
+@receiver(post_save, sender=RangeProduct)
+@receiver(post_delete, sender=RangeProduct)
+@receiver(post_save, sender=StockRecord)
+@receiver(m2m_changed, sender=Voucher.offers.through)
+def invalidate_offers_cache(sender, **_kwargs):
+    """
+    When the benefit, range, products or prices behind a voucher change, the
+    cached voucher offers previews must be invalidated.
+
+    Vouchers and offers themselves are not watched, because they are saved on every
+    redemption. Their changes that affect the preview are either part of the cache key
+    or go through the models above.
+    """
+    invalidate_voucher_offers_cache()
+    logger.debug('Invalidated voucher offers cache after a %s change.', sender.__name__)
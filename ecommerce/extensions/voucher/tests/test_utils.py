@@ -6,8 +6,9 @@ import uuid
 import ddt
 import httpretty
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import ugettext_lazy as _
 from factory.fuzzy import FuzzyText
 from oscar.templatetags.currency_filters import currency
@@ -228,6 +229,25 @@ class UtilTests(CouponMixin, DiscoveryMockMixin, DiscoveryTestMixin, LmsApiMockM
         self.assertEqual(voucher.start_datetime, self.data['start_datetime'])
         self.assertEqual(voucher.usage, Voucher.SINGLE_USE)
 
+    def test_create_vouchers_in_bulk(self):
+        """ Vouchers are created in a number of queries that does not depend on their quantity. """
+        self.data['quantity'] = 1
+        create_vouchers(**self.data)
+        with CaptureQueriesContext(connection) as queries:
+            create_vouchers(**self.data)
+
+        self.data['quantity'] = 100
+        with self.assertNumQueries(len(queries)):
+            vouchers = create_vouchers(**self.data)
+
+        self.assertEqual(len(set(voucher.code for voucher in vouchers)), 100)
+        self.assertEqual(Voucher.objects.filter(id__in=[voucher.id for voucher in vouchers]).count(), 100)
+        self.assertEqual(
+            Voucher.offers.through.objects.filter(voucher__in=vouchers).values('conditionaloffer').distinct().count(),
+            1
+        )
+        self.assertEqual(Voucher.offers.through.objects.filter(voucher__in=vouchers).count(), 100)
+
     def test_create_voucher_with_long_name(self):
         self.data.update({
             'name': (
@@ -34,6 +34,10 @@ from ecommerce.programs.custom import class_path, create_condition
 
 logger = logging.getLogger(__name__)
 
+VOUCHER_OFFERS_CACHE_VERSION_KEY = 'voucher_offers_cache_version'
+# Number of vouchers inserted, or looked up by code, per query when creating vouchers in bulk.
+VOUCHER_BULK_BATCH_SIZE = 500
+
 Basket = get_model('basket', 'Basket')
 Benefit = get_model('offer', 'Benefit')
 Condition = get_model('offer', 'Condition')
@@ -488,64 +492,114 @@ def get_or_create_enterprise_offer(
     return offer
 
 
-def _generate_code_string(length):
+def _generate_code_strings(length, quantity):
     """
-    Create a string of random characters of specified length
+    Create a list of unique strings of random characters of specified length, which are not used by any voucher.
+
+    The codes already in use are looked up for a whole batch of codes in one query. The generated codes are
+    upper case, as are the codes of saved vouchers, hence the case sensitive lookup.
 
     Args:
-        length (int): Defines the length of randomly generated string.
+        length (int): Defines the length of randomly generated strings.
+        quantity (int): Number of strings to generate.
 
     Raises:
         ValueError raised if length is less than one.
 
     Returns:
-        str
+        list
     """
     if length < 1:
         raise ValueError("Voucher code length must be a positive number.")
 
+    voucher_codes = set()
+    while len(voucher_codes) < quantity:
+        candidates = set()
+        while len(candidates) < min(quantity - len(voucher_codes), VOUCHER_BULK_BATCH_SIZE):
+            candidate = _random_code_string(length)
+            if candidate not in voucher_codes:
+                candidates.add(candidate)
+
+        candidates -= set(Voucher.objects.filter(code__in=candidates).values_list('code', flat=True))
+        voucher_codes.update(candidates)
+
+    return list(voucher_codes)
+
+
+def _random_code_string(length):
     h = hashlib.sha256()
     h.update(uuid.uuid4().get_bytes())
-    voucher_code = base64.b32encode(h.digest())[0:length]
-    if Voucher.objects.filter(code__iexact=voucher_code).exists():
-        return _generate_code_string(length)
-
-    return voucher_code
+    return base64.b32encode(h.digest())[0:length]
 
 
-def create_new_voucher(code, end_datetime, name, start_datetime, voucher_type):
+def create_new_vouchers(codes, end_datetime, name, start_datetime, voucher_type):
     """
-    Creates a voucher.
+    Creates a voucher for each of the given codes, in a fixed number of queries per batch of vouchers.
 
-    If randomly generated voucher code already exists, new code will be generated and reverified.
+    The vouchers are validated as they would be on save, but no model signals are sent.
 
     Args:
-        code (str): Code associated with vouchers. If not provided, one will be generated.
+        codes (list): Codes of the vouchers.
         end_datetime (datetime): Voucher end date.
         name (str): Voucher name.
-        offer (Offer): Offer associated with voucher.
         start_datetime (datetime): Voucher start date.
         voucher_type (str): Voucher usage.
 
     Returns:
-        Voucher
+        List[Voucher]
     """
-    voucher_code = code or _generate_code_string(settings.VOUCHER_CODE_LENGTH)
     if not isinstance(start_datetime, datetime.datetime):
         start_datetime = dateutil.parser.parse(start_datetime)
 
     if not isinstance(end_datetime, datetime.datetime):
         end_datetime = dateutil.parser.parse(end_datetime)
 
-    voucher = Voucher.objects.create(
-        name=name[:128],
-        code=voucher_code,
-        usage=voucher_type,
-        start_datetime=start_datetime,
-        end_datetime=end_datetime,
-    )
+    vouchers = []
+    for code in codes:
+        voucher = Voucher(
+            name=name[:128],
+            code=code.upper(),
+            usage=voucher_type,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+        voucher.clean()
+        vouchers.append(voucher)
 
-    return voucher
+    Voucher.objects.bulk_create(vouchers, batch_size=VOUCHER_BULK_BATCH_SIZE)
+
+    # Most databases do not return the primary keys of rows inserted in bulk, so they are read back.
+    voucher_codes = [created_voucher.code for created_voucher in vouchers]
+    voucher_ids = {}
+    for i in range(0, len(voucher_codes), VOUCHER_BULK_BATCH_SIZE):
+        voucher_ids.update(
+            Voucher.objects.filter(code__in=voucher_codes[i:i + VOUCHER_BULK_BATCH_SIZE]).values_list('code', 'id')
+        )
+
+    for voucher in vouchers:
+        voucher.id = voucher_ids[voucher.code]
+        voucher._state.adding = False  # pylint: disable=protected-access
+        voucher._state.db = Voucher.objects.db  # pylint: disable=protected-access
+
+    return vouchers
+
+
+def add_offers_to_vouchers(vouchers, offers):
+    """
+    Adds offers to vouchers in bulk.
+
+    Args:
+        vouchers (list): Vouchers to add the offers to.
+        offers (list): A single offer, added to every voucher, or an offer for each voucher.
+    """
+    VoucherOffer = Voucher.offers.through
+    VoucherOffer.objects.bulk_create(
+        [
+            VoucherOffer(voucher_id=voucher.id, conditionaloffer_id=(offers[i] if len(offers) > 1 else offers[0]).id)
+            for i, voucher in enumerate(vouchers)
+        ],
+        batch_size=VOUCHER_BULK_BATCH_SIZE
+    )
 
 
 def validate_voucher_fields(
@@ -641,17 +695,14 @@ def create_enterprise_vouchers(
         )
         offers.append(offer)
 
-    vouchers = []
-    for i in range(quantity):
-        voucher = create_new_voucher(
-            end_datetime=end_datetime,
-            start_datetime=start_datetime,
-            voucher_type=voucher_type,
-            code=code,
-            name=name
-        )
-        voucher.offers.add(offers[i] if len(offers) > 1 else offers[0])
-        vouchers.append(voucher)
+    vouchers = create_new_vouchers(
+        codes=[code] * quantity if code else _generate_code_strings(settings.VOUCHER_CODE_LENGTH, quantity),
+        end_datetime=end_datetime,
+        start_datetime=start_datetime,
+        voucher_type=voucher_type,
+        name=name
+    )
+    add_offers_to_vouchers(vouchers, offers)
 
     return vouchers
 
@@ -708,7 +759,6 @@ def create_vouchers(
         List[Voucher]
     """
     logger.info("Creating [%d] vouchers product [%s]", quantity, coupon.id)
-    vouchers = []
     offers = []
     enterprise_offers = []
 
@@ -784,18 +834,16 @@ def create_vouchers(
             )
             enterprise_offers.append(enterprise_offer)
 
-    for i in range(quantity):
-        voucher = create_new_voucher(
-            end_datetime=end_datetime,
-            start_datetime=start_datetime,
-            voucher_type=voucher_type,
-            code=code,
-            name=name
-        )
-        voucher.offers.add(offers[i] if len(offers) > 1 else offers[0])
-        if enterprise_customer:
-            voucher.offers.add(enterprise_offers[i] if len(enterprise_offers) > 1 else enterprise_offers[0])
-        vouchers.append(voucher)
+    vouchers = create_new_vouchers(
+        codes=[code] * quantity if code else _generate_code_strings(settings.VOUCHER_CODE_LENGTH, quantity),
+        end_datetime=end_datetime,
+        start_datetime=start_datetime,
+        voucher_type=voucher_type,
+        name=name
+    )
+    add_offers_to_vouchers(vouchers, offers)
+    if enterprise_customer:
+        add_offers_to_vouchers(vouchers, enterprise_offers)
 
     return vouchers
 
@@ -939,6 +987,30 @@ def get_cached_voucher(code):
     return voucher
 
 
+def get_voucher_offers_cache_version():
+    """
+    Returns the version the voucher offers preview cache keys are built with.
+
+    Changing the version invalidates every cached offers preview at once, without having to know which
+    vouchers, pages and page sizes have been cached.
+
+    Returns:
+        str: The current cache version.
+    """
+    cached_response = TieredCache.get_cached_response(VOUCHER_OFFERS_CACHE_VERSION_KEY)
+    if cached_response.is_found:
+        return cached_response.value
+
+    version = uuid.uuid4().hex
+    TieredCache.set_all_tiers(VOUCHER_OFFERS_CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate_voucher_offers_cache():
+    """ Invalidates all cached voucher offers previews. """
+    TieredCache.delete_all_tiers(VOUCHER_OFFERS_CACHE_VERSION_KEY)
+
+
 def get_voucher_and_products_from_code(code):
     """
     Returns a voucher and product for a given code.
@@ -1,9 +1,9 @@
 import logging
 
 from oscar.core.loading import get_class, get_model
-from premailer import transform
 
 from ecommerce.extensions.analytics.utils import parse_tracking_context
+from ecommerce.notifications.templates import get_notification_templates
 
 log = logging.getLogger(__name__)
 CommunicationEventType = get_model('customer', 'CommunicationEventType')
@@ -36,14 +36,16 @@ def send_notification(user, commtype_code, context, site):
         event_type = CommunicationEventType.objects.get(code=commtype_code)
     except CommunicationEventType.DoesNotExist:
         try:
-            messages = CommunicationEventType.objects.get_and_render(commtype_code, context)
+            templates = get_notification_templates(CommunicationEventType(code=commtype_code), site)
+            messages = templates.render(context)
         except Exception:  # pylint: disable=broad-except
             log.error('Unable to locate a DB entry or templates for communication type [%s]. '
                       'No notification has been sent.', commtype_code)
             return
     else:
-        messages = event_type.get_messages(context)
+        templates = get_notification_templates(event_type, site)
+        messages = templates.render(context)
 
     if messages and (messages['body'] or messages['html']):
-        messages['html'] = transform(messages['html'])
+        messages['html'] = templates.inline_css(messages['html'])
         Dispatcher().dispatch_user_messages(user, messages, site)
@@ -0,0 +1,269 @@
+"""
+Cache of the compiled templates of notifications, and of the stylesheets inlined into their HTML.
+
+Rendering a notification used to load and compile its templates, and to parse and apply the stylesheet of its HTML
+with premailer, for each recipient. Only the context differs between recipients, so the templates of each
+communication type, site and theme are compiled once, and the stylesheet of their HTML is parsed and compiled once.
+For each recipient, the templates are rendered with their context, and the compiled stylesheet is applied to the
+rendered HTML, which gives the same HTML as premailer.
+
+CompiledStylesheet relies on private functions of premailer 2.9.2, the version pinned in requirements/base.in
+(_parse_style_rules, _css_rules_to_string and _style_to_basic_html_attributes), which must be checked whenever
+premailer is upgraded. The tests compare its output with that of premailer.
+"""
+from __future__ import unicode_literals
+
+import operator
+import re
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, engines
+from django.template.loader import get_template
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from premailer import Premailer, transform
+from premailer.merge_style import csstext_to_pairs, merge_styles
+from premailer.premailer import FILTER_PSEUDOSELECTORS, get_or_create_head
+
+from ecommerce.theming.helpers import get_current_theme
+
+IMPORTANT_REGEX = re.compile(r'\s*!important')
+STYLESHEET_LINK_SELECTOR = CSSSelector('link[rel~=stylesheet]')
+STYLE_SELECTOR = CSSSelector('style')
+
+# Maximum number of compiled templates kept. The least recently used ones are dropped first, so that edits of the
+# template fields of event types do not grow the cache.
+MAX_CACHED_TEMPLATES = 100
+
+# Templates of the communication event types, keyed by their codes, sites, themes and template fields, from the
+# least to the most recently used.
+_templates_cache = OrderedDict()
+_templates_cache_lock = threading.Lock()
+
+
+def get_notification_templates(event_type, site):
+    """
+    Returns the compiled templates of a communication event type, for the given site and the current theme.
+
+    The templates are compiled once per process, or for each call if DEBUG is enabled, like Django's cached template
+    loader. The template fields of the event type are part of the key, so edits to them are picked up at once. At
+    most MAX_CACHED_TEMPLATES templates are kept, the least recently used being dropped first.
+
+    Args:
+        event_type (CommunicationEventType): The event type, which need not be saved.
+        site (Site): The site the notification is sent for.
+
+    Returns:
+        NotificationTemplates
+    """
+    theme = get_current_theme()
+    key = (
+        event_type.code,
+        site.id if site else None,
+        theme.theme_dir_name if theme else None,
+        tuple(getattr(event_type, field, None) for field in NotificationTemplates.TEMPLATE_FIELDS.values()),
+    )
+
+    if settings.DEBUG:
+        return NotificationTemplates(event_type)
+
+    with _templates_cache_lock:
+        templates = _templates_cache.pop(key, None)
+        if templates is not None:
+            _templates_cache[key] = templates
+            return templates
+
+    templates = NotificationTemplates(event_type)
+    with _templates_cache_lock:
+        _templates_cache[key] = templates
+        while len(_templates_cache) > MAX_CACHED_TEMPLATES:
+            _templates_cache.popitem(last=False)
+
+    return templates
+
+
+def clear_notification_templates_cache():
+    with _templates_cache_lock:
+        _templates_cache.clear()
+
+
+class NotificationTemplates(object):
+    """ The compiled subject, body, HTML and SMS templates of a communication event type. """
+
+    TEMPLATE_FIELDS = {
+        'subject': 'email_subject_template',
+        'body': 'email_body_template',
+        'html': 'email_body_html_template',
+        'sms': 'sms_template',
+    }
+
+    def __init__(self, event_type):
+        # The templates are looked up as in CommunicationEventType.get_messages: from the fields of the event type,
+        # or from the template files for its code if the fields are empty.
+        code = event_type.code.lower()
+        self.templates = {}
+        for name, field in self.TEMPLATE_FIELDS.items():
+            value = getattr(event_type, field, None)
+            if value is not None:
+                self.templates[name] = engines['django'].from_string(value)
+            else:
+                try:
+                    self.templates[name] = get_template(getattr(event_type, '{}_file'.format(field)) % code)
+                except TemplateDoesNotExist:
+                    self.templates[name] = None
+
+        self.stylesheet = None
+        self._stylesheet_lock = threading.Lock()
+
+    def render(self, context):
+        """ Returns the messages rendered with the given context, like CommunicationEventType.get_messages. """
+        context['static_base_url'] = getattr(settings, 'OSCAR_STATIC_BASE_URL', None)
+
+        messages = {}
+        for name, template in self.templates.items():
+            messages[name] = template.render(context) if template else ''
+
+        # Ensure the email subject doesn't contain any newlines
+        messages['subject'] = messages['subject'].replace('\n', '').replace('\r', '')
+
+        return messages
+
+    def inline_css(self, html):
+        """ Returns the HTML with its stylesheet inlined, as premailer.transform does. """
+        html = html.strip()
+        tree = CompiledStylesheet.parse(html)
+        page = tree.getroot()
+        if STYLESHEET_LINK_SELECTOR(page):  # pylint: disable=not-callable
+            return transform(html)
+
+        # Instances are shared by the threads of the process. The stylesheet of the first document is kept, and
+        # never replaced, and documents with other stylesheets are inlined with their own, in a local variable.
+        css_bodies = CompiledStylesheet.get_css_bodies(page)
+        stylesheet = self.stylesheet
+        if stylesheet is None or stylesheet.css_bodies != css_bodies:
+            stylesheet = CompiledStylesheet(css_bodies)
+            with self._stylesheet_lock:
+                if self.stylesheet is None:
+                    self.stylesheet = stylesheet
+        return stylesheet.inline(html, tree)
+
+
+class CompiledStylesheet(object):
+    """
+    The <style> elements of HTML documents, parsed and compiled once so they can be inlined into many documents.
+
+    Parsing the CSS, compiling its selectors and merging the styles of each element take most of the time of
+    premailer, and give the same results for documents with the same stylesheet and structure. Here they are done
+    once per stylesheet, and once per combination of inline style and matching rules of an element.
+    """
+
+    # Number of merged styles kept, to bound memory use should inline styles vary by recipient.
+    MAX_MERGED_STYLES = 1000
+
+    def __init__(self, css_bodies):
+        self.css_bodies = css_bodies
+        self.premailer = Premailer('')
+
+        rules = []
+        self.leftovers = []
+        for index, css_body in enumerate(css_bodies):
+            these_rules, these_leftovers = self.premailer._parse_style_rules(  # pylint: disable=protected-access
+                css_body, index
+            )
+            rules.extend(these_rules)
+            self.leftovers.append(
+                self.premailer._css_rules_to_string(these_leftovers)  # pylint: disable=protected-access
+                if these_leftovers else None
+            )
+
+        rules.sort(key=operator.itemgetter(0))
+        self.rules = []
+        for __, selector, style in rules:
+            pseudo_class = ''
+            if ':' in selector:
+                new_selector, pseudo_class = selector.split(':', 1)
+                pseudo_class = ':{}'.format(pseudo_class)
+                # Filter pseudo classes select the elements to apply to, and so are kept in the selector.
+                if pseudo_class in FILTER_PSEUDOSELECTORS:
+                    pseudo_class = ''
+                else:
+                    selector = new_selector
+            self.rules.append((CSSSelector(selector), csstext_to_pairs(style), pseudo_class))
+
+        self.merged_styles = {}
+
+    @staticmethod
+    def parse(html):
+        return etree.fromstring(html, etree.HTMLParser()).getroottree()
+
+    @staticmethod
+    def get_style_elements(page):
+        # Styles for other media are left alone, as premailer does.
+        return [
+            element for element in STYLE_SELECTOR(page)  # pylint: disable=not-callable
+            if not element.attrib.get('media') or element.attrib['media'] == 'screen'
+        ]
+
+    @classmethod
+    def get_css_bodies(cls, page):
+        return tuple(
+            element.text for element in cls.get_style_elements(page)
+            if element.attrib.get(Premailer.attribute_name) != 'ignore'
+        )
+
+    def inline(self, html, tree):
+        """
+        Inlines the stylesheet into the parsed HTML, and returns it.
+
+        Args:
+            html (str): The HTML, stripped of leading and trailing whitespace.
+            tree (ElementTree): The parsed HTML, whose stylesheet should be this one.
+        """
+        page = tree.getroot()
+        # lxml inserts a doctype if none exists, so only include it in the root if it was in the original html.
+        root = tree if html.startswith(tree.docinfo.doctype) else page
+        get_or_create_head(tree)
+
+        # The styles which cannot be inlined, such as media queries, are kept in their <style> elements.
+        leftovers = iter(self.leftovers)
+        for element in self.get_style_elements(page):
+            if element.attrib.get(Premailer.attribute_name) == 'ignore':
+                del element.attrib[Premailer.attribute_name]
+                continue
+
+            leftover = next(leftovers)
+            if leftover:
+                element.text = leftover
+            else:
+                element.getparent().remove(element)
+
+        elements = {}
+        for index, (selector, __, __) in enumerate(self.rules):
+            for element in selector(page):
+                elements.setdefault(element, []).append(index)
+
+        for element, indexes in elements.items():
+            style = self.merge_styles(element.attrib.get('style', ''), tuple(indexes))
+            element.attrib['style'] = style
+            self.premailer._style_to_basic_html_attributes(  # pylint: disable=protected-access
+                element, style, force=True
+            )
+
+        for attribute in page.xpath('//@class'):
+            del attribute.getparent().attrib['class']
+
+        html = etree.tostring(root, method='html', pretty_print=True, encoding='utf-8').decode('utf-8')
+        return IMPORTANT_REGEX.sub('', html)
+
+    def merge_styles(self, inline_style, indexes):
+        key = (inline_style, indexes)
+        style = self.merged_styles.get(key)
+        if style is None:
+            style = merge_styles(
+                inline_style, [self.rules[index][1] for index in indexes], [self.rules[index][2] for index in indexes]
+            )
+            if len(self.merged_styles) < self.MAX_MERGED_STYLES:
+                self.merged_styles[key] = style
+        return style
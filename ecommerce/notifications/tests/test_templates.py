@@ -0,0 +1,122 @@
+from __future__ import unicode_literals
+
+import re
+
+import ddt
+import mock
+from django.core import mail
+from django.test import override_settings
+from oscar.core.loading import get_model
+from premailer import transform
+
+from ecommerce.notifications.notifications import send_notification
+from ecommerce.notifications.templates import (
+    CompiledStylesheet,
+    clear_notification_templates_cache,
+    get_notification_templates
+)
+from ecommerce.tests.factories import SiteConfigurationFactory
+from ecommerce.tests.testcases import TestCase
+
+CommunicationEventType = get_model('customer', 'CommunicationEventType')
+
+CONTEXT = {
+    'full_name': 'Ada Lovelace',
+    'course_title': 'Demonstration Course',
+    'platform_name': 'edX',
+    'receipt_page_url': 'https://example.com/receipt/?order_number=EDX-100001&a=b',
+}
+
+
+@ddt.ddt
+class NotificationTemplatesTests(TestCase):
+    def setUp(self):
+        super(NotificationTemplatesTests, self).setUp()
+        clear_notification_templates_cache()
+
+    def test_cache(self):
+        """ Templates should be compiled once per communication type, site, theme and template fields. """
+        event_type = CommunicationEventType(code='COURSE_PURCHASED')
+        templates = get_notification_templates(event_type, self.site)
+
+        self.assertIs(
+            get_notification_templates(CommunicationEventType(code='COURSE_PURCHASED'), self.site), templates
+        )
+        self.assertIsNot(
+            get_notification_templates(CommunicationEventType(code='CREDIT_RECEIPT'), self.site), templates
+        )
+        self.assertIsNot(get_notification_templates(event_type, SiteConfigurationFactory().site), templates)
+
+        event_type.email_subject_template = 'New subject'
+        self.assertIsNot(get_notification_templates(event_type, self.site), templates)
+
+        with override_settings(DEBUG=True):
+            self.assertIsNot(get_notification_templates(CommunicationEventType(code='COURSE_PURCHASED'), self.site),
+                             templates)
+
+    @mock.patch('ecommerce.notifications.templates.MAX_CACHED_TEMPLATES', 2)
+    def test_cache_size(self):
+        """ The least recently used templates should be dropped once MAX_CACHED_TEMPLATES are cached. """
+        def get(code):
+            return get_notification_templates(CommunicationEventType(code=code), self.site)
+
+        purchased, receipt = get('COURSE_PURCHASED'), get('CREDIT_RECEIPT')
+        self.assertIs(get('COURSE_PURCHASED'), purchased)
+        get('ORDER_WITH_CSV')
+
+        self.assertIs(get('COURSE_PURCHASED'), purchased)
+        self.assertIsNot(get('CREDIT_RECEIPT'), receipt)
+
+    @ddt.data('COURSE_PURCHASED', 'CREDIT_RECEIPT', 'ORDER_WITH_CSV')
+    def test_render(self, code):
+        """ The messages should be those rendered by the event type, and their HTML inlined as premailer does. """
+        event_type = CommunicationEventType(code=code, email_subject_template='Subject\n{{ course_title }}')
+        templates = get_notification_templates(event_type, self.site)
+        messages = templates.render(dict(CONTEXT))
+
+        self.assertEqual(messages, event_type.get_messages(dict(CONTEXT)))
+        self.assertEqual(messages['subject'], 'SubjectDemonstration Course')
+        self.assertEqual(templates.inline_css(messages['html']), transform(messages['html']))
+
+    def test_inline_css(self):
+        """ The stylesheet should be compiled once, and inlined as premailer does. """
+        html = (
+            '<html><head>'
+            '<style>p {color: red} a:hover {color: blue} li:first-child {margin: 0} .wide {width: 10px !important}'
+            '@media screen and (max-width: 10px) {p {color: green}}</style>'
+            '<style data-premailer="ignore">p {color: pink}</style>'
+            '<style media="print">p {color: black}</style>'
+            '</head><body>'
+            '<p class="wide" style="font-size: 2px">NAME <a href="#">link</a></p><ul><li>1</li><li>2</li></ul>'
+            '</body></html>'
+        )
+        templates = get_notification_templates(CommunicationEventType(code='COURSE_PURCHASED'), self.site)
+
+        with mock.patch.object(CompiledStylesheet, '__init__', autospec=True,
+                               side_effect=CompiledStylesheet.__init__) as mock_init:
+            for name in ('Ada', 'Grace'):
+                recipient_html = html.replace('NAME', name)
+                self.assertEqual(templates.inline_css(recipient_html), transform(recipient_html))
+
+            self.assertEqual(mock_init.call_count, 1)
+
+            # Documents with other stylesheets should have those inlined.
+            other_html = html.replace('color: red', 'color: orange')
+            self.assertEqual(templates.inline_css(other_html), transform(other_html))
+            self.assertEqual(mock_init.call_count, 2)
+
+            # Without replacing the stylesheet kept by the templates, which other threads may be using.
+            self.assertEqual(templates.inline_css(html), transform(html))
+            self.assertEqual(mock_init.call_count, 2)
+
+    def test_send_notification(self):
+        """ Notifications should be sent with their HTML inlined. """
+        user = self.create_user(full_name='Ada Lovelace')
+        send_notification(user, 'COURSE_PURCHASED', dict(CONTEXT), self.site)
+
+        self.assertEqual(len(mail.outbox), 1)
+        html = mail.outbox[0].alternatives[0][0]
+        self.assertIn('Hi Ada Lovelace,', html)
+        # The styles of classes are inlined, and the classes removed.
+        self.assertNotIn('.container-footer', html)
+        self.assertIsNone(re.search(r'<[^>]+ class=', html))
@@ -5,7 +5,6 @@ from django.dispatch import receiver
 from ecommerce_worker.sailthru.v1.tasks import update_course_enrollment
 from oscar.core.loading import get_class, get_model
 
-from ecommerce.core.url_utils import get_lms_url
 from ecommerce.courses.utils import mode_for_product
 from ecommerce.extensions.analytics.utils import silence_exceptions
 
@@ -40,12 +39,7 @@ def process_checkout_complete(sender, order=None, user=None, request=None,  # py
         message_id = request.COOKIES.get('sailthru_bid')
 
     if not message_id:
-        saved_id = BasketAttribute.objects.filter(
-            basket=order.basket,
-            attribute_type=get_basket_attribute_type()
-        )
-        if len(saved_id) > 0:
-            message_id = saved_id[0].value_text
+        message_id = order.basket.get_attribute(SAILTHRU_CAMPAIGN)
 
     # loop through lines in order
     #  If multi product orders become common it may be worthwhile to pass an array of
@@ -67,7 +61,7 @@ def process_checkout_complete(sender, order=None, user=None, request=None,  # py
             course_id = product.course_id
 
             # Tell Sailthru that the purchase is complete asynchronously
-            update_course_enrollment.delay(order.user.email, _build_course_url(course_id),
+            update_course_enrollment.delay(order.user.email, _build_course_url(site_configuration, course_id),
                                            False, mode_for_product(product),
                                            unit_cost=price, course_id=course_id, currency=order.currency,
                                            site_code=site_configuration.partner.short_code, message_id=message_id,
@@ -104,7 +98,7 @@ def process_basket_addition(sender, product=None, user=None, request=None, baske
         if message_id and basket:
             BasketAttribute.objects.update_or_create(
                 basket=basket,
-                attribute_type=get_basket_attribute_type(),
+                attribute_type_id=BasketAttributeType.get_id(SAILTHRU_CAMPAIGN),
                 defaults={'value_text': message_id}
             )
 
@@ -113,20 +107,12 @@ def process_basket_addition(sender, product=None, user=None, request=None, baske
         # later if the purchase is not completed.  Abandoned cart support is only for purchases, not
         # for free enrolls
         if price and not is_multi_product_basket:
-            update_course_enrollment.delay(user.email, _build_course_url(course_id), True, mode_for_product(product),
-                                           unit_cost=price, course_id=course_id, currency=currency,
-                                           site_code=site_configuration.partner.short_code, message_id=message_id)
+            update_course_enrollment.delay(user.email, _build_course_url(site_configuration, course_id), True,
+                                           mode_for_product(product), unit_cost=price, course_id=course_id,
+                                           currency=currency, site_code=site_configuration.partner.short_code,
+                                           message_id=message_id)
 
 
-def _build_course_url(course_id):
-    """Build a course url from a course id and the host"""
-    return get_lms_url('courses/{}/info'.format(course_id))
-
-
-def get_basket_attribute_type():
-    """ Returns `BasketAttributeType` for Sailthru campaign ID.
-
-    Returns:
-        BasketAttributeType
-    """
-    return BasketAttributeType.objects.get(name=SAILTHRU_CAMPAIGN)
+def _build_course_url(site_configuration, course_id):
+    """Build a course url from a course id and the LMS of the site"""
+    return site_configuration.build_lms_url('courses/{}/info'.format(course_id))
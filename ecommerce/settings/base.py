@@ -59,6 +59,12 @@ DATABASES = {
         'ATOMIC_REQUESTS': True,
     }
 }
+
+# Sends the reads of the read-only views that opt into it to the database called 'read_replica', if there is one.
+DATABASE_ROUTERS = ['ecommerce.core.read_replica.ReadReplicaRouter']
+# Number of seconds for which the reads of a user who has made a change are sent to the primary database instead,
+# so that they see their change despite the lag of the replica.
+READ_REPLICA_PIN_TIMEOUT = 30
 # END DATABASE CONFIGURATION
 
 
@@ -216,8 +222,9 @@ MIDDLEWARE_CLASSES = (
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
+    'ecommerce.core.read_replica.ReadReplicaPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.contrib.sites.middleware.CurrentSiteMiddleware',
+    'ecommerce.core.middleware.CurrentSiteMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'edx_rest_framework_extensions.auth.jwt.middleware.EnsureJWTAuthSettingsMiddleware',
     'waffle.middleware.WaffleMiddleware',
@@ -246,6 +253,13 @@ COMMERCE_API_TIMEOUT = 7
 
 # Cache course info from course API.
 COURSES_API_CACHE_TIMEOUT = 3600  # Value is in seconds
+# Maximum number of concurrent requests made for the courses of a basket.
+COURSES_API_MAX_CONCURRENT_REQUESTS = 6
+# Maximum number of courses published to LMS concurrently by the batch publisher.
+LMS_PUBLICATION_MAX_WORKERS = 8
+# Number of times, and base delay in seconds between, retries of failed publications of courses to LMS.
+LMS_PUBLICATION_MAX_RETRIES = 3
+LMS_PUBLICATION_RETRY_BACKOFF = 1
 PROGRAM_CACHE_TIMEOUT = 3600  # Value is in seconds.
 
 # Cache catalog results from the enterprise and discovery service.
@@ -267,7 +281,51 @@ LMS_API_CACHE_TIMEOUT = 30  # Value is in seconds.
 
 VOUCHER_CACHE_TIMEOUT = 10  # Value is in seconds.
 
+VOUCHER_OFFERS_CACHE_TIMEOUT = 300  # Value is in seconds.
+# Maximum number of threads prefetching the next catalog page of voucher offers, and of prefetches queued or
+# running. Further prefetches are skipped.
+CATALOG_PREFETCH_MAX_WORKERS = 2
+CATALOG_PREFETCH_MAX_PENDING = 20
+
+PAYMENT_PROCESSORS_CACHE_TIMEOUT = 3600  # Value is in seconds.
+
+# Access tokens of site service users are renewed in the background once they are this close to expiring.
+ACCESS_TOKEN_RENEWAL_WINDOW = 300  # Value is in seconds.
+# Maximum time a renewal of an access token is expected to take, after which it may be renewed again.
+ACCESS_TOKEN_LOCK_TIMEOUT = 10  # Value is in seconds.
+
 SDN_CHECK_REQUEST_TIMEOUT = 5  # Value is in seconds.
+# Results of SDN checks are cached, so that retried payments and pre-screened individuals are not checked again.
+SDN_CHECK_CACHE_TIMEOUT = 600  # Value is in seconds.
+# Maximum number of connections to the SDN API kept open by each process.
+SDN_CHECK_POOL_SIZE = 10
+# Maximum number of threads pre-screening individuals in the background, and of pre-screenings queued or running.
+# Further pre-screenings are skipped, and the individuals are checked when they submit their payment.
+SDN_PRESCREEN_MAX_WORKERS = 4
+SDN_PRESCREEN_MAX_PENDING = 50
+
+# Payment notifications already handled are recognized from the cache, for this long, before the database.
+PAYMENT_NOTIFICATION_CACHE_TIMEOUT = 600  # Value is in seconds.
+
+# Seconds after which fulfillment tasks not acknowledged by the worker are published again, and the maximum
+# number of times they are published.
+FULFILLMENT_OUTBOX_RETRY_DELAY = 600
+FULFILLMENT_OUTBOX_MAX_ATTEMPTS = 5
+
+# Maximum number of refunds approved concurrently by the batch refund processor, and the maximum number of
+# approvals started per second.
+REFUND_BATCH_MAX_WORKERS = 4
+REFUND_BATCH_RATE_LIMIT = 10
+
+# Receivers of the post_checkout signal that do not fulfill orders. After checkout, they are run concurrently
+# in a pool of POST_CHECKOUT_BACKGROUND_MAX_WORKERS background threads, once the order is committed, instead of
+# delaying the redirect to the receipt page. The pool is drained when the process exits.
+POST_CHECKOUT_BACKGROUND_MAX_WORKERS = 4
+POST_CHECKOUT_BACKGROUND_RECEIVERS = (
+    'ecommerce.extensions.checkout.signals.track_completed_order',
+    'ecommerce.extensions.checkout.signals.send_course_purchase_email',
+    'ecommerce.sailthru.signals.process_checkout_complete',
+)
 
 # APP CONFIGURATION
 DJANGO_APPS = [
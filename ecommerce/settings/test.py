@@ -146,6 +146,9 @@ PAYMENT_PROCESSOR_CONFIG = {
 CELERY_ALWAYS_EAGER = True
 # END CELERY
 
+# Run all post_checkout receivers synchronously, so that tests can verify their effects.
+POST_CHECKOUT_BACKGROUND_RECEIVERS = ()
+
 
 # Use production settings for asset compression so that asset compilation can be tested on the CI server.
 COMPRESS_ENABLED = True
@@ -196,12 +196,15 @@ define([
                 }
             },
 
-            sdnCheck: function(event) {
-                var firstName = $('input[name=first_name]').val(),
-                    lastName = $('input[name=last_name]').val(),
-                    city = $('input[name=city]').val(),
-                    country = $('select[name=country]').val();
+            getSdnCheckData: function() {
+                return {
+                    name: _s.sprintf('%s %s', $('input[name=first_name]').val(), $('input[name=last_name]').val()),
+                    city: $('input[name=city]').val(),
+                    country: $('select[name=country]').val()
+                };
+            },
 
+            sdnCheck: function(event) {
                 $.ajax({
                     url: '/api/v2/sdn/search/',
                     method: 'POST',
@@ -210,11 +213,7 @@ define([
                     headers: {
                         'X-CSRFToken': Cookies.get('ecommerce_csrftoken')
                     },
-                    data: JSON.stringify({
-                        name: _s.sprintf('%s %s', firstName, lastName),
-                        city: city,
-                        country: country
-                    }),
+                    data: JSON.stringify(BasketPage.getSdnCheckData()),
                     async: false,
                     success: function(data) {
                         if (data.hits > 0) {
@@ -225,6 +224,29 @@ define([
                 });
             },
 
+            sdnPrescreen: function() {
+                // Starts the SDN check as soon as the billing details are filled out, so that its results
+                // are already cached by the time the payment is submitted.
+                var data = BasketPage.getSdnCheckData(),
+                    key = JSON.stringify(data);
+
+                if (!$.trim(data.name) || !$.trim(data.city) || !data.country ||
+                    key === BasketPage.lastSdnPrescreen) {
+                    return;
+                }
+                BasketPage.lastSdnPrescreen = key;
+
+                $.ajax({
+                    url: '/api/v2/sdn/search/',
+                    method: 'POST',
+                    contentType: 'application/json; charset=utf-8',
+                    headers: {
+                        'X-CSRFToken': Cookies.get('ecommerce_csrftoken')
+                    },
+                    data: JSON.stringify(_.extend(data, {prescreen: true}))
+                });
+            },
+
             showVoucherForm: function() {
                 $('#voucher_form_container').show();
                 $('#voucher_form_link').hide();
@@ -507,6 +529,13 @@ define([
                     BasketPage.validateQuantity(e);
                 });
 
+                if ($('input[name=sdn-check]').val() === 'enabled') {
+                    $('input[name=first_name], input[name=last_name], input[name=city], select[name=country]')
+                        .on('change', function() {
+                            BasketPage.sdnPrescreen();
+                        });
+                }
+
                 $('#payment-button').click(function(e) {
                     _.each($('.help-block'), function(errorMsg) {
                         $(errorMsg).empty();  // Clear existing validation error messages.
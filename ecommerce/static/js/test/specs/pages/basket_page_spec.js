@@ -417,6 +417,29 @@ define([
                         expect(ajaxData.city).toEqual(city);
                         expect(ajaxData.country).toEqual(country);
                     });
+
+                    it('should pre-screen the billing details once', function() {
+                        var ajaxData;
+
+                        $('input[name=first_name]').val('Darth');
+                        $('input[name=last_name]').val('Vader');
+                        $('input[name=city]').val('');
+                        $('select[name=country]').val('DS');
+                        BasketPage.lastSdnPrescreen = undefined;
+                        spyOn($, 'ajax');
+
+                        BasketPage.sdnPrescreen();
+                        expect($.ajax).not.toHaveBeenCalled();
+
+                        $('input[name=city]').val('Death Star');
+                        BasketPage.sdnPrescreen();
+                        BasketPage.sdnPrescreen();
+                        expect($.ajax.calls.count()).toEqual(1);
+                        ajaxData = JSON.parse($.ajax.calls.argsFor(0)[0].data);
+                        expect(ajaxData.name).toEqual('Darth Vader');
+                        expect(ajaxData.city).toEqual('Death Star');
+                        expect(ajaxData.prescreen).toBe(true);
+                    });
                 });
 
                 describe('cardInfoValidation', function() {
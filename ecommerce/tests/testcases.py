@@ -4,6 +4,8 @@ from django.test import TestCase as DjangoTestCase
 from django.test import TransactionTestCase as DjangoTransactionTestCase
 from edx_django_utils.cache import TieredCache
 
+from ecommerce.extensions.basket.models import BasketAttributeType
+from ecommerce.extensions.catalogue.models import ProductClassRegistry
 from ecommerce.tests.mixins import SiteMixin, TestServerUrlMixin, UserMixin
 
 
@@ -20,6 +22,17 @@ class TieredCacheMixin(object):
         super(TieredCacheMixin, self).tearDown()
 
 
+class ProcessCacheMixin(object):
+    """
+    Clears the caches kept in process memory, which are not rolled back along with the database between tests.
+    """
+
+    def setUp(self):
+        BasketAttributeType.clear_ids()
+        ProductClassRegistry.clear()
+        super(ProcessCacheMixin, self).setUp()
+
+
 class ViewTestMixin(TieredCacheMixin):
     path = None
 
@@ -53,7 +66,7 @@ class ViewTestMixin(TieredCacheMixin):
         self.assert_get_response_status(200)
 
 
-class TestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, DjangoTestCase):
+class TestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, ProcessCacheMixin, DjangoTestCase):
     """
     Base test case for ecommerce tests.
 
@@ -61,7 +74,8 @@ class TestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, Djang
     """
 
 
-class LiveServerTestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, DjangoLiveServerTestCase):
+class LiveServerTestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, ProcessCacheMixin,
+                         DjangoLiveServerTestCase):
     """
     Base test case for ecommerce tests.
 
@@ -70,7 +84,8 @@ class LiveServerTestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMi
     pass
 
 
-class TransactionTestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, DjangoTransactionTestCase):
+class TransactionTestCase(TestServerUrlMixin, UserMixin, SiteMixin, TieredCacheMixin, ProcessCacheMixin,
+                          DjangoTransactionTestCase):
     """
     Base test case for ecommerce tests.
 
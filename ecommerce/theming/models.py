@@ -29,7 +29,9 @@ class SiteTheme(models.Model):
         if not site:
             return None
 
-        theme = site.themes.first()
+        # Themes are picked out of all of them, rather than queried for, so that prefetched themes are used.
+        themes = sorted(site.themes.all(), key=lambda site_theme: site_theme.pk)
+        theme = themes[0] if themes else None
 
         if (not theme) and settings.DEFAULT_SITE_THEME:
             theme = SiteTheme(site=site, theme_dir_name=settings.DEFAULT_SITE_THEME)